@@ -0,0 +1,21 @@
+﻿using System;
+using System.Threading;
+
+namespace LogHandlerHelper
+{
+    public class CalculationCancellation
+    {
+        private int cancelled;
+
+        public CalculationCancellation()
+        {
+            ShouldCancel = () => Volatile.Read(ref cancelled) != 0;
+        }
+
+        public Func<bool> ShouldCancel { get; }
+
+        public bool IsCancelled => Volatile.Read(ref cancelled) != 0;
+
+        public void Cancel() => Interlocked.Exchange(ref cancelled, 1);
+    }
+}
@@ -0,0 +1,25 @@
+﻿using System;
+using DiKErnel.Integration;
+
+namespace LogHandlerHelper
+{
+    public static class CalculationInputBuilderHelper
+    {
+        public static void AddTimeSteps(CalculationInputBuilder builder, double[] timeSteps, double[] waterLevels,
+                                        double[] waveHeights, double[] wavePeriods, double[] waveDirections)
+        {
+            int numberOfTimeSteps = waterLevels.Length;
+            if (timeSteps.Length != numberOfTimeSteps + 1 || waveHeights.Length != numberOfTimeSteps
+                || wavePeriods.Length != numberOfTimeSteps || waveDirections.Length != numberOfTimeSteps)
+            {
+                throw new ArgumentException("The number of time steps should be exactly 1 more than the number of hydrodynamic conditions.");
+            }
+
+            for (var i = 0; i < numberOfTimeSteps; i++)
+            {
+                builder.AddTimeStep(timeSteps[i], timeSteps[i + 1], waterLevels[i], waveHeights[i], wavePeriods[i],
+                                    waveDirections[i]);
+            }
+        }
+    }
+}
@@ -0,0 +1,95 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Reflection;
+using DiKErnel.Core.Data;
+using DiKErnel.Integration;
+
+namespace LogHandlerHelper
+{
+    public static class CalculationInputHelper
+    {
+        // The time dependent input of DiKErnel is internal, its constructor is obtained once. It is null in case this
+        // version of DiKErnel has no matching constructor.
+        private static readonly ConstructorInfo timeDependentInputConstructor = GetTimeDependentInputConstructor();
+
+        public static bool CanReplaceTimeSteps => timeDependentInputConstructor != null;
+
+        public static ICalculationInput ReplaceTimeSteps(ICalculationInput calculationInput, double[] timeSteps,
+                                                         double[] waterLevels, double[] waveHeights, double[] wavePeriods,
+                                                         double[] waveDirections)
+        {
+            if (!CanReplaceTimeSteps)
+            {
+                throw new InvalidOperationException("The time steps can not be replaced with this version of DiKErnel, the input needs to be created completely.");
+            }
+
+            int numberOfTimeSteps = waterLevels.Length;
+            if (timeSteps.Length != numberOfTimeSteps + 1 || waveHeights.Length != numberOfTimeSteps
+                || wavePeriods.Length != numberOfTimeSteps || waveDirections.Length != numberOfTimeSteps)
+            {
+                throw new ArgumentException("The number of time steps should be exactly 1 more than the number of hydrodynamic conditions.");
+            }
+
+            var timeDependentInputItems = new List<ITimeDependentInput>(numberOfTimeSteps);
+            for (var i = 0; i < numberOfTimeSteps; i++)
+            {
+                if (timeSteps[i] >= timeSteps[i + 1])
+                {
+                    throw new ArgumentException("The time steps should be continuously increasing.");
+                }
+
+                timeDependentInputItems.Add((ITimeDependentInput) timeDependentInputConstructor.Invoke(new object[]
+                {
+                    timeSteps[i],
+                    timeSteps[i + 1],
+                    waterLevels[i],
+                    waveHeights[i],
+                    wavePeriods[i],
+                    waveDirections[i]
+                }));
+            }
+
+            return new CalculationInput(calculationInput.ProfileData, calculationInput.LocationDependentInputItems,
+                                        timeDependentInputItems);
+        }
+
+        private static ConstructorInfo GetTimeDependentInputConstructor()
+        {
+            Type timeDependentInputType = typeof(CalculationInputBuilder).Assembly
+                                                                         .GetType("DiKErnel.Integration.Data.TimeDependentInput", false);
+            if (timeDependentInputType == null || !typeof(ITimeDependentInput).IsAssignableFrom(timeDependentInputType))
+            {
+                return null;
+            }
+
+            return timeDependentInputType.GetConstructor(BindingFlags.Instance | BindingFlags.Public | BindingFlags.NonPublic, null,
+                                                         new[]
+                                                         {
+                                                             typeof(double),
+                                                             typeof(double),
+                                                             typeof(double),
+                                                             typeof(double),
+                                                             typeof(double),
+                                                             typeof(double)
+                                                         }, null);
+        }
+
+        private class CalculationInput : ICalculationInput
+        {
+            public CalculationInput(IProfileData profileData,
+                                    IReadOnlyList<ILocationDependentInput> locationDependentInputItems,
+                                    IReadOnlyList<ITimeDependentInput> timeDependentInputItems)
+            {
+                ProfileData = profileData;
+                LocationDependentInputItems = locationDependentInputItems;
+                TimeDependentInputItems = timeDependentInputItems;
+            }
+
+            public IProfileData ProfileData { get; }
+
+            public IReadOnlyList<ILocationDependentInput> LocationDependentInputItems { get; }
+
+            public IReadOnlyList<ITimeDependentInput> TimeDependentInputItems { get; }
+        }
+    }
+}
@@ -0,0 +1,40 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+using DiKErnel.Core.Data;
+
+namespace LogHandlerHelper
+{
+    public static class LocationDependentOutputHelper
+    {
+        public static double[] GetCumulativeDamages(LocationDependentOutput output)
+        {
+            return output.CumulativeDamages.ToArray();
+        }
+
+        public static double[] GetTimeDependentValues(LocationDependentOutput output, string propertyName)
+        {
+            IReadOnlyList<TimeDependentOutput> items = output.TimeDependentOutputItems;
+            var values = new double[items.Count];
+            if (items.Count == 0)
+            {
+                return values;
+            }
+
+            PropertyInfo property = items[0].GetType().GetProperty(propertyName);
+            if (property == null)
+            {
+                throw new ArgumentException($"Time dependent output does not contain a property '{propertyName}'.");
+            }
+
+            for (var i = 0; i < items.Count; i++)
+            {
+                object value = property.GetValue(items[i]);
+                values[i] = value == null ? double.NaN : Convert.ToDouble(value);
+            }
+
+            return values;
+        }
+    }
+}
@@ -5,21 +5,55 @@ namespace LogHandlerHelper
 {
     public class LogHandler : ILogHandler
     {
+        private readonly object syncRoot = new object();
         private readonly List<string> warnings = new List<string>();
         private readonly List<string> errors = new List<string>();
 
-        public IReadOnlyList<string> Warnings => warnings;
+        public IReadOnlyList<string> Warnings
+        {
+            get
+            {
+                lock (syncRoot)
+                {
+                    return warnings.ToArray();
+                }
+            }
+        }
 
-        public IReadOnlyList<string> Errors => errors;
+        public IReadOnlyList<string> Errors
+        {
+            get
+            {
+                lock (syncRoot)
+                {
+                    return errors.ToArray();
+                }
+            }
+        }
 
         public void Clear()
         {
-            warnings.Clear();
-            errors.Clear();
+            lock (syncRoot)
+            {
+                warnings.Clear();
+                errors.Clear();
+            }
         }
 
-        public void LogWarning(string message) => warnings.Add(message);
+        public void LogWarning(string message)
+        {
+            lock (syncRoot)
+            {
+                warnings.Add(message);
+            }
+        }
 
-        public void LogError(string message) => errors.Add(message);
+        public void LogError(string message)
+        {
+            lock (syncRoot)
+            {
+                errors.Add(message);
+            }
+        }
     }
 }
@@ -0,0 +1,63 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+Benchmark of running DiKErnel calculations from multiple threads of a single process. All threads share one
+.NET runtime, the GIL is released while DiKErnel calculates. The throughput is reported for an increasing
+number of threads.
+
+Usage: python benchmark_threads.py [number of calculations] [number of time steps]
+"""
+
+from pydrever.calculation import Dikernel, warmup
+from pydrever.calculation._dikernel._paralleltuning import create_benchmark_input
+import pydrever.data as data
+from concurrent.futures import ThreadPoolExecutor
+import time
+import sys
+import os
+
+
+def run(input: data.DikernelInput) -> bool:
+    kernel = Dikernel(input)
+    kernel.compact_output = True
+    return kernel.run()
+
+
+if __name__ == "__main__":
+    number_of_calculations = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    number_of_time_steps = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    inputs = [create_benchmark_input(10, number_of_time_steps, seed) for seed in range(number_of_calculations)]
+    warmup()
+    run(inputs[0])
+
+    print(f"{number_of_calculations} calculations of {number_of_time_steps} time steps, {os.cpu_count()} cores")
+    reference_duration = None
+    for number_of_threads in [1, 2, 4, 8, 16]:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=number_of_threads) as executor:
+            if not all(executor.map(run, inputs)):
+                raise RuntimeError("Not all calculations succeeded.")
+        duration = time.perf_counter() - start
+        reference_duration = reference_duration or duration
+        print(
+            f"{number_of_threads:>3} threads: {duration:8.2f} s, "
+            f"{number_of_calculations / duration:8.1f} calculations/s, speedup {reference_duration / duration:5.2f}"
+        )
@@ -22,3 +22,4 @@ import pydrever.data as data
 import pydrever.io as io
 import pydrever.visualization as visualization
 import pydrever.calculation as calculation
+from pydrever.calculation import configure_runtime
@@ -18,6 +18,16 @@
  Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from pydrever.calculation._dikernel import Dikernel
+from pydrever.calculation._dikernel import (
+    Dikernel,
+    DikernelSession,
+    ResultCache,
+    EnsembleResult,
+    run_ensemble,
+    AsyncDikernelPool,
+)
+from pydrever.calculation._dikernel._dikernelcreferences import load as warmup
+from pydrever.calculation._dikernel._runtimeconfiguration import configure_runtime
+from pydrever.calculation._dikernel._paralleltuning import calibrate as calibrate_parallel_settings
 import pydrever.calculation._hydrodynamicsinterpolation as hydrodynamicsinterpolator
 import pydrever.calculation._grassresistancetimescalculator as grassresistancetimescalculator
@@ -18,5 +18,8 @@
  Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from ._dikernelcreferences import *
 from ._dikernel import Dikernel
+from ._resultcache import ResultCache
+from ._dikernelsession import DikernelSession
+from ._ensemblecalculator import EnsembleResult, run as run_ensemble
+from ._asynccalculator import AsyncDikernelPool
@@ -0,0 +1,60 @@
+"""
+Copyright (C) Stichting Deltares 2023-2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+This file contains functions to move series of numbers between NumPy and C# in a single copy,
+instead of crossing the Python/C# boundary for each individual value.
+"""
+
+import pydrever.calculation._dikernel._dikernelcreferences as _cs
+import numpy as numpy
+
+
+def to_c_array(values) -> "_cs.Array[_cs.Double]":
+    """
+    Converts a series of numbers to a C#-typed double[] by copying the underlying buffer at once.
+
+    Args:
+        values (list[float] | numpy.ndarray): The values to convert.
+
+    Returns:
+        Array[Double] [C#]: A C# array containing the same values.
+    """
+    values = numpy.ascontiguousarray(values, dtype=numpy.float64)
+    c_array = _cs.Array.CreateInstance(_cs.Double, len(values))
+    if len(values) > 0:
+        _cs.Marshal.Copy(_cs.IntPtr(values.ctypes.data), c_array, 0, len(values))
+    return c_array
+
+
+def to_numpy(c_array: "_cs.Array[_cs.Double]") -> numpy.ndarray:
+    """
+    Converts a C#-typed double[] to a NumPy array by copying the underlying buffer at once.
+
+    Args:
+        c_array (Array[Double] [C#]): The C# array to convert.
+
+    Returns:
+        numpy.ndarray: A float64 array containing the same values.
+    """
+    values = numpy.empty(c_array.Length, dtype=numpy.float64)
+    if len(values) > 0:
+        _cs.Marshal.Copy(c_array, 0, _cs.IntPtr(values.ctypes.data), len(values))
+    return values
@@ -0,0 +1,144 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+This file contains the functions needed to await DiKErnel calculations from an asyncio event loop. Calculations
+are performed in an executor, so the event loop is not blocked while DiKErnel is calculating.
+"""
+
+from pydrever.data import DikernelInput
+from pydrever.calculation._dikernel._dikernel import Dikernel
+from pydrever.calculation._dikernel._resultcache import ResultCache
+import pydrever.calculation._dikernel._batchcalculator as _batch_calculator
+import pydrever.calculation._dikernel._paralleltuning as _parallel_tuning
+from concurrent.futures import Executor, ThreadPoolExecutor
+import asyncio
+
+
+class AsyncDikernelPool:
+    """
+    Pool of workers that performs DiKErnel calculations for an asyncio event loop. The number of calculations
+    that is performed at the same time is limited by the number of workers, other calculations wait for a free worker.
+
+    Workers are either threads (the default) or processes. Running calculations in threads can be cancelled,
+    calculations in processes can only be cancelled as long as they did not start.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        use_processes: bool = False,
+        calculate_locations_parallel: bool = False,
+        calculate_time_steps_parallel: bool = False,
+        compact_output: bool = False,
+        cache: ResultCache | None = None,
+        auto_parallel: bool = False,
+    ):
+        """
+        Creates a pool of workers.
+
+        Args:
+            workers (int | None, optional): The number of workers. Defaults to the default of the executor.
+            use_processes (bool, optional): Whether to use worker processes instead of threads. Defaults to False.
+            calculate_locations_parallel (bool, optional): Passed to DiKErnel for each calculation. Defaults to False.
+            calculate_time_steps_parallel (bool, optional): Passed to DiKErnel for each calculation. Defaults to False.
+            compact_output (bool, optional): Whether the calculations produce compact output locations. Defaults to False.
+            cache (ResultCache | None, optional): Cache of calculation results that is used for all calculations. Defaults to None.
+            auto_parallel (bool, optional): Whether each calculation chooses the parallelization settings itself (see Dikernel). Defaults to False.
+        """
+        self.use_processes: bool = use_processes
+        """Whether calculations are performed in worker processes instead of threads."""
+        self.calculate_locations_parallel: bool = calculate_locations_parallel
+        """See the property with the same name of Dikernel."""
+        self.calculate_time_steps_parallel: bool = calculate_time_steps_parallel
+        """See the property with the same name of Dikernel."""
+        self.compact_output: bool = compact_output
+        """See the property with the same name of Dikernel."""
+        self.cache: ResultCache | None = cache
+        """See the property with the same name of Dikernel."""
+        self.auto_parallel: bool = auto_parallel
+        """See the property with the same name of Dikernel. Worker processes use the calibration of the cost model that is stored by this process."""
+        self.__executor: Executor = (
+            _batch_calculator.create_worker_pool(workers)
+            if use_processes
+            else ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dikernel")
+        )
+
+    async def run(self, input: DikernelInput, timeout: float | None = None) -> Dikernel:
+        """
+        Performs a calculation by one of the workers of this pool.
+
+        Args:
+            input (DikernelInput): The input of the calculation.
+            timeout (float | None, optional): The maximum time in seconds to wait for the calculation. Defaults to None (no timeout).
+
+        Raises:
+            TimeoutError: In case the calculation did not finish within the specified time.
+
+        Returns:
+            Dikernel: The (finished) calculation, holding the input, output, warnings and errors.
+        """
+        kernel = Dikernel(input)
+        kernel.calculate_locations_parallel = self.calculate_locations_parallel
+        kernel.calculate_time_steps_parallel = self.calculate_time_steps_parallel
+        kernel.auto_parallel = self.auto_parallel
+        kernel.compact_output = self.compact_output
+        kernel.cache = self.cache
+
+        if not self.use_processes:
+            await kernel.run_async(self.__executor, timeout)
+            return kernel
+
+        if self.auto_parallel:
+            # The cost model is calibrated once (in a thread, the event loop is not blocked), instead of by every worker.
+            await asyncio.get_running_loop().run_in_executor(None, _parallel_tuning.prepare)
+        future = asyncio.get_running_loop().run_in_executor(
+            self.__executor,
+            _batch_calculator._run_input,
+            input,
+            self.calculate_locations_parallel,
+            self.calculate_time_steps_parallel,
+            self.compact_output,
+            self.cache,
+            self.auto_parallel,
+        )
+        try:
+            kernel.output, warnings, errors = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError as e:
+            # Before Python 3.11, asyncio.TimeoutError is not the builtin TimeoutError.
+            raise TimeoutError("The calculation did not finish within the specified time.") from e
+        kernel.warnings.extend(warnings)
+        kernel.errors.extend(errors)
+        return kernel
+
+    def close(self, wait: bool = True):
+        """
+        Stops the workers of this pool.
+
+        Args:
+            wait (bool, optional): Whether to wait for the running calculations to finish. Defaults to True.
+        """
+        self.__executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self) -> "AsyncDikernelPool":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -0,0 +1,169 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+This file contains the functions needed to distribute many DiKErnel calculations over a pool of
+worker processes. Each worker loads the DiKErnel assemblies once and is reused for all inputs it receives.
+"""
+
+from pydrever.data import DikernelInput, DikernelOutputLocation, CompactOutputLocation
+from pydrever.calculation._dikernel._resultcache import ResultCache
+import pydrever.calculation._dikernel._paralleltuning as _parallel_tuning
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable
+import multiprocessing
+import os
+
+
+def run(
+    inputs: list[DikernelInput],
+    workers: int | None = None,
+    calculate_locations_parallel: bool = False,
+    calculate_time_steps_parallel: bool = False,
+    compact_output: bool = False,
+    cache: ResultCache | None = None,
+    auto_parallel: bool = False,
+) -> list[tuple[list[DikernelOutputLocation | CompactOutputLocation] | None, list[str], list[str]]]:
+    """
+    Calculates all specified inputs using a pool of worker processes.
+
+    Args:
+        inputs (list[DikernelInput]): The inputs that need to be calculated.
+        workers (int | None, optional): The number of worker processes. Defaults to the number of available cores.
+        calculate_locations_parallel (bool, optional): Passed to DiKErnel for each calculation. Defaults to False.
+        calculate_time_steps_parallel (bool, optional): Passed to DiKErnel for each calculation. Defaults to False.
+        compact_output (bool, optional): Whether the calculations produce compact output locations. Defaults to False.
+        cache (ResultCache | None, optional): Cache of calculation results that is used by all workers. Defaults to None.
+        auto_parallel (bool, optional): Whether each calculation chooses the parallelization settings itself (see Dikernel). Defaults to False.
+
+    Returns:
+        list[tuple[list[DikernelOutputLocation | CompactOutputLocation] | None, list[str], list[str]]]: The output, warnings and errors
+        of each calculation, in the order in which the inputs were specified.
+    """
+    if len(inputs) == 0:
+        return []
+
+    workers = min(get_number_of_workers(workers), len(inputs))
+    if auto_parallel:
+        # The cost model is calibrated once, instead of by every worker.
+        _parallel_tuning.prepare()
+    chunk_size = max(1, len(inputs) // (4 * workers))
+
+    with create_worker_pool(workers) as executor:
+        return list(
+            executor.map(
+                _run_input,
+                inputs,
+                repeat(calculate_locations_parallel),
+                repeat(calculate_time_steps_parallel),
+                repeat(compact_output),
+                repeat(cache),
+                repeat(auto_parallel),
+                chunksize=chunk_size,
+            )
+        )
+
+
+def create_worker_pool(
+    workers: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> ProcessPoolExecutor:
+    """
+    Creates a pool of spawned worker processes that load DiKErnel when they start.
+
+    Args:
+        workers (int | None, optional): The number of worker processes. Defaults to the default of ProcessPoolExecutor.
+        initializer (Callable[..., None] | None, optional): Function that is called when a worker starts, it should load the
+        DiKErnel assemblies itself. Defaults to None (only the assemblies are loaded).
+        initargs (tuple[Any, ...], optional): The arguments of the initializer. Defaults to ().
+
+    Returns:
+        ProcessPoolExecutor: The pool of worker processes.
+    """
+    # Forking a process that already hosts the .NET runtime is not safe, workers are therefore always spawned.
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer if initializer is not None else _initialize_worker,
+        initargs=initargs,
+    )
+
+
+def get_number_of_workers(workers: int | None) -> int:
+    """
+    Args:
+        workers (int | None): The requested number of worker processes, None for the number of available cores.
+
+    Raises:
+        ValueError: In case the requested number of workers is smaller than 1.
+
+    Returns:
+        int: The number of worker processes.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("The number of workers should be at least 1.")
+    return workers
+
+
+def _initialize_worker():
+    """
+    Loads the DiKErnel assemblies once when a worker process starts.
+    """
+    import pydrever.calculation._dikernel._dikernelcreferences as _cs
+
+    _cs.load()
+
+
+def _run_input(
+    input: DikernelInput,
+    calculate_locations_parallel: bool,
+    calculate_time_steps_parallel: bool,
+    compact_output: bool,
+    cache: ResultCache | None,
+    auto_parallel: bool = False,
+) -> tuple[list[DikernelOutputLocation | CompactOutputLocation] | None, list[str], list[str]]:
+    """
+    Performs a single calculation within a worker process.
+
+    Args:
+        input (DikernelInput): The input of the calculation.
+        calculate_locations_parallel (bool): Passed to DiKErnel.
+        calculate_time_steps_parallel (bool): Passed to DiKErnel.
+        compact_output (bool): Whether to produce compact output locations.
+        cache (ResultCache | None): Cache of calculation results.
+        auto_parallel (bool, optional): Whether the calculation chooses the parallelization settings itself. Defaults to False.
+
+    Returns:
+        tuple[list[DikernelOutputLocation | CompactOutputLocation] | None, list[str], list[str]]: The output, warnings and errors of the calculation.
+    """
+    from pydrever.calculation._dikernel._dikernel import Dikernel
+
+    kernel = Dikernel(input)
+    kernel.calculate_locations_parallel = calculate_locations_parallel
+    kernel.calculate_time_steps_parallel = calculate_time_steps_parallel
+    kernel.auto_parallel = auto_parallel
+    kernel.compact_output = compact_output
+    kernel.cache = cache
+    kernel.run()
+    return kernel.output, kernel.warnings, kernel.errors
@@ -0,0 +1,291 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+This file contains the functions needed to calculate long time series in chunks of time steps. The damage at the
+end of each chunk is used as initial damage of the next chunk, so only the input and output of a single chunk
+needs to exist at the same time. The state at the end of each chunk can be written to a checkpoint file, which
+allows resuming a calculation that was interrupted.
+"""
+
+from pydrever.data import (
+    DikernelInput,
+    HydrodynamicConditions,
+    OutputLocationSpecification,
+    InterpolationType,
+    DikernelOutputLocation,
+    CompactOutputLocation,
+)
+from pydrever.calculation._dikernel._resultcache import ResultCache
+import pydrever.calculation._dikernel._inputservices as _input_services
+import pydrever.calculation._hydrodynamicsinterpolation as interpolation
+from typing import TYPE_CHECKING, Callable, Iterator
+import numpy
+import json
+import os
+import uuid
+
+if TYPE_CHECKING:
+    from pydrever.calculation._dikernel._dikernel import Dikernel
+
+
+def run(
+    input: DikernelInput,
+    chunk_size: int,
+    calculate_locations_parallel: bool = False,
+    calculate_time_steps_parallel: bool = False,
+    compact_output: bool = False,
+    cache: ResultCache | None = None,
+    checkpoint_file: str | None = None,
+    auto_parallel: bool = False,
+) -> Iterator["Dikernel"]:
+    """
+    Calculates the specified input in chunks of time steps. Each chunk is calculated with the damage at the end of
+    the previous chunk as initial damage. Locations that failed are not part of the subsequent chunks.
+
+    Args:
+        input (DikernelInput): The input of the complete calculation.
+        chunk_size (int): The maximum number of time steps of each chunk.
+        calculate_locations_parallel (bool, optional): Passed to DiKErnel for each chunk. Defaults to False.
+        calculate_time_steps_parallel (bool, optional): Passed to DiKErnel for each chunk. Defaults to False.
+        compact_output (bool, optional): Whether the chunks produce compact output locations. Defaults to False.
+        cache (ResultCache | None, optional): Cache of calculation results that is used for each chunk. Defaults to None.
+        checkpoint_file (str | None, optional): File to write the damage and failure of all locations to after each chunk. In case
+        the file contains a checkpoint of the same input, the calculation resumes after the last chunk of that checkpoint. Defaults to None.
+        auto_parallel (bool, optional): Whether each chunk chooses the parallelization settings itself (see Dikernel). Defaults to False.
+
+    Raises:
+        ValueError: In case the chunk size is smaller than 1, or a checkpoint file is specified and the input can not be hashed (see get_input_hash).
+
+    Yields:
+        Iterator[Dikernel]: The (finished) calculation of each chunk. Iteration stops after a chunk that did not
+        succeed or when all locations have failed.
+    """
+    from pydrever.calculation._dikernel._dikernel import Dikernel
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size should be at least 1 time step.")
+
+    run_time_steps = _input_services.get_run_time_steps(input)
+    all_locations = _input_services.get_output_locations_from_input(input)
+    input_hash = _input_services.get_input_hash(input) if checkpoint_file is not None else None
+
+    checkpoint = read_checkpoint(checkpoint_file, input_hash) if checkpoint_file is not None else None
+    if checkpoint is not None and len(checkpoint["damages"]) == len(all_locations):
+        run_time_steps = [time_step for time_step in run_time_steps if time_step >= checkpoint["time"]]
+        damages = checkpoint["damages"]
+        times_of_failure = checkpoint["times_of_failure"]
+    else:
+        damages = [location.top_layer_specification.initial_damage for location in all_locations]
+        times_of_failure = [None] * len(all_locations)
+
+    indices = [i for i, time_of_failure in enumerate(times_of_failure) if time_of_failure is None]
+    for i_start in range(0, len(run_time_steps) - 1, chunk_size):
+        if len(indices) == 0:
+            return
+
+        chunk_time_steps = run_time_steps[i_start : i_start + chunk_size + 1]
+        chunk_input = get_chunk_input(input, chunk_time_steps, [all_locations[i] for i in indices], [damages[i] for i in indices])
+        kernel = Dikernel(chunk_input)
+        kernel.calculate_locations_parallel = calculate_locations_parallel
+        kernel.calculate_time_steps_parallel = calculate_time_steps_parallel
+        kernel.auto_parallel = auto_parallel
+        kernel.compact_output = compact_output
+        kernel.cache = cache
+        succeeded = kernel.run()
+        yield kernel
+
+        if not succeeded:
+            return
+
+        for i, output_location in zip(indices, kernel.output):
+            damages[i] = float(output_location.final_damage)
+            times_of_failure[i] = output_location.time_of_failure
+        indices = [i for i in indices if times_of_failure[i] is None]
+        # The checkpoint is written once the chunk has been processed by the caller, so a resumed calculation never skips unprocessed output.
+        if checkpoint_file is not None:
+            write_checkpoint(checkpoint_file, input_hash, chunk_time_steps[-1], damages, times_of_failure)
+
+
+def get_chunk_input(
+    input: DikernelInput,
+    chunk_time_steps: list[float],
+    locations: list[OutputLocationSpecification],
+    initial_damages: list[float | None],
+) -> DikernelInput:
+    """
+    Creates the input of a single chunk of time steps.
+
+    Args:
+        input (DikernelInput): The input of the complete calculation.
+        chunk_time_steps (list[float]): The time steps of the chunk (including its start and end time).
+        locations (list[OutputLocationSpecification]): The output locations that are calculated in this chunk.
+        initial_damages (list[float | None]): The damage of each of these locations at the start of the chunk.
+
+    Returns:
+        DikernelInput: The input of the chunk.
+    """
+    return DikernelInput(
+        hydrodynamic_input=get_chunk_hydrodynamics(input.hydrodynamic_input, chunk_time_steps, input.hydrodynamics_interpolation),
+        dike_schematization=input.dike_schematization,
+        output_locations=[__with_initial_damage(location, damage) for location, damage in zip(locations, initial_damages)],
+        settings=input.settings,
+        requested_quantities=input.requested_quantities,
+    )
+
+
+def combine_output(
+    chunk_outputs: list[DikernelOutputLocation | CompactOutputLocation],
+) -> DikernelOutputLocation | CompactOutputLocation:
+    """
+    Combines the output of a single location in consecutive chunks of time steps to the output of all these time steps.
+
+    Args:
+        chunk_outputs (list[DikernelOutputLocation | CompactOutputLocation]): The output of the location in each chunk, in order of time.
+
+    Returns:
+        DikernelOutputLocation | CompactOutputLocation: The output of the location. Time series are concatenated, the time
+        of failure is the first time of failure of the chunks and all other values are taken from the first chunk.
+    """
+    first_output = chunk_outputs[0]
+    if len(chunk_outputs) == 1:
+        return first_output
+
+    is_compact = isinstance(first_output, CompactOutputLocation)
+    field_names = first_output.field_names if is_compact else type(first_output).model_fields.keys()
+    values = {}
+    for field_name in field_names:
+        chunk_values = [getattr(output, field_name) for output in chunk_outputs]
+        if field_name == "time_of_failure":
+            values[field_name] = next((value for value in chunk_values if value is not None), None)
+        elif all(isinstance(value, numpy.ndarray) for value in chunk_values):
+            values[field_name] = numpy.concatenate(chunk_values)
+        else:
+            values[field_name] = chunk_values[0]
+
+    return type(first_output)(**values) if is_compact else type(first_output).model_construct(**values)
+
+
+def read_checkpoint(checkpoint_file: str, input_hash: str) -> dict | None:
+    """
+    Reads a checkpoint of a chunked calculation.
+
+    Args:
+        checkpoint_file (str): The checkpoint file.
+        input_hash (str): The hash of the input of the calculation (see get_input_hash).
+
+    Returns:
+        dict | None: The time of the checkpoint ("time") and the damage ("damages") and time of failure ("times_of_failure")
+        of all output locations at that time. None in case the file does not exist, cannot be read or belongs to different input.
+    """
+    try:
+        with open(checkpoint_file, "r") as file:
+            checkpoint = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if checkpoint.get("version") != __checkpoint_version or checkpoint.get("input_hash") != input_hash:
+        return None
+    return checkpoint
+
+
+def write_checkpoint(
+    checkpoint_file: str,
+    input_hash: str,
+    time: float,
+    damages: list[float | None],
+    times_of_failure: list[float | None],
+):
+    """
+    Writes a checkpoint of a chunked calculation. The file is replaced at once, an interrupted write never leaves an incomplete checkpoint.
+
+    Args:
+        checkpoint_file (str): The checkpoint file.
+        input_hash (str): The hash of the input of the calculation (see get_input_hash).
+        time (float): The time up to which the calculation has finished.
+        damages (list[float | None]): The damage of all output locations at this time.
+        times_of_failure (list[float | None]): The time of failure of all output locations (None in case a location did not fail).
+    """
+    checkpoint = {
+        "version": __checkpoint_version,
+        "input_hash": input_hash,
+        "time": float(time),
+        "damages": damages,
+        "times_of_failure": times_of_failure,
+    }
+    temporary_file_name = f"{checkpoint_file}.{uuid.uuid4().hex}.tmp"
+    with open(temporary_file_name, "w") as file:
+        json.dump(checkpoint, file)
+    os.replace(temporary_file_name, checkpoint_file)
+
+
+def get_chunk_hydrodynamics(
+    hydrodynamic_input: HydrodynamicConditions,
+    chunk_time_steps: list[float],
+    hydrodynamics_interpolation: InterpolationType | Callable = InterpolationType.Previous,
+) -> HydrodynamicConditions:
+    """
+    Determines the hydrodynamic conditions of a chunk of time steps.
+
+    Args:
+        hydrodynamic_input (HydrodynamicConditions): The hydrodynamic conditions of the complete calculation.
+        chunk_time_steps (list[float]): The time steps of the chunk (including its start and end time).
+        hydrodynamics_interpolation (InterpolationType | Callable, optional): See DikernelInput. Defaults to InterpolationType.Previous.
+
+    Returns:
+        HydrodynamicConditions: The hydrodynamic conditions for each time step of the chunk.
+    """
+    # Only the part of the original series that overlaps with the chunk (and the adjacent time steps, which are
+    # needed for linear interpolation) is interpolated.
+    time_steps = hydrodynamic_input.time_steps
+    i_first = max(0, int(numpy.searchsorted(time_steps, chunk_time_steps[0], side="right")) - 2)
+    i_last = min(len(time_steps) - 1, int(numpy.searchsorted(time_steps, chunk_time_steps[-1], side="left")) + 1)
+    window_values = interpolation.interpolate_hydrodynamics(
+        time_steps[i_first : i_last + 1],
+        numpy.array(
+            [
+                hydrodynamic_input.water_levels[i_first:i_last],
+                hydrodynamic_input.wave_heights[i_first:i_last],
+                hydrodynamic_input.wave_periods[i_first:i_last],
+                hydrodynamic_input.wave_directions[i_first:i_last],
+            ],
+            dtype=numpy.float64,
+        ),
+        chunk_time_steps,
+        hydrodynamics_interpolation,
+    )
+
+    return HydrodynamicConditions(
+        time_steps=chunk_time_steps,
+        water_levels=window_values[0].tolist(),
+        wave_heights=window_values[1].tolist(),
+        wave_periods=window_values[2].tolist(),
+        wave_directions=window_values[3].tolist(),
+    )
+
+
+__checkpoint_version = 1
+
+
+def __with_initial_damage(location: OutputLocationSpecification, initial_damage: float | None) -> OutputLocationSpecification:
+    if initial_damage == location.top_layer_specification.initial_damage:
+        return location
+    top_layer_specification = location.top_layer_specification.model_copy(update={"initial_damage": float(initial_damage)})
+    return location.model_copy(update={"top_layer_specification": top_layer_specification})
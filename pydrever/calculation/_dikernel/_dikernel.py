@@ -18,19 +18,39 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from pydrever.data import DikernelInput, DikernelOutputLocation
-from pydrever.calculation._dikernel._dikernelcreferences import *
+from __future__ import annotations
+
+from pydrever.data import (
+    DikernelInput,
+    DikernelOutputLocation,
+    CompactOutputLocation,
+    OutputLocationSpecification,
+    TimeDependentOutputQuantity,
+)
+import pydrever.calculation._dikernel._dikernelcreferences as _cs
 import pydrever.calculation._dikernel._dikernelinputparser as _input_parser
 import pydrever.calculation._dikernel._dikerneloutputparser as _output_parser
 import pydrever.calculation._dikernel._inputservices as _input_services
+import pydrever.calculation._dikernel._outputservices as _output_services
 import pydrever.calculation._dikernel._messagehelper as _message_helper
 import pydrever.calculation._dikernel._validationhelper as _validation_helper
+import pydrever.calculation._dikernel._batchcalculator as _batch_calculator
+import pydrever.calculation._dikernel._chunkedcalculator as _chunked_calculator
+import pydrever.calculation._dikernel._paralleltuning as _parallel_tuning
+from pydrever.calculation._dikernel._resultcache import ResultCache
+import pydrever.calculation._dikernel._resultcache as _result_cache
+from concurrent.futures import Executor
+from typing import Iterator
 import numpy as numpy
+import asyncio
 
 
 class Dikernel:
     """
     Class to facilitate calculations with the (C#-typed) Dikernel.
+
+    Separate instances can run at the same time in multiple threads of a single process, the .NET runtime and DiKErnel
+    assemblies are shared between them. A single instance should only be run by one thread at a time.
     """
 
     def __init__(self, input: DikernelInput):
@@ -42,7 +62,7 @@ class Dikernel:
         """
         self.input: DikernelInput = input
         """Ths input specification DiKErnel is supposed to calculated with."""
-        self.output: list[DikernelOutputLocation] | None = None
+        self.output: list[DikernelOutputLocation | CompactOutputLocation] | None = None
         """A list of output locations that hold all calculation results after finishing the calculation."""
         self.warnings: list[str] = list[str]()
         """A list of warnings that occurred during validation or running the calculation."""
@@ -52,9 +72,23 @@ class Dikernel:
         """This property triggers DiKErnel to start parallel calculations on the GPU for each specified location. In case of many locations, this will be faster when set to True."""
         self.calculate_time_steps_parallel = False
         """This property triggers DiKErnel to start parallel calculations on the GPU for each specified time step. In case of many time steps, this will be faster when set to True."""
+        self.auto_parallel = False
+        """This property makes the calculation choose calculate_locations_parallel and calculate_time_steps_parallel itself, based on the number of locations, the number of time steps and a cost model that is calibrated on this machine (see calibrate_parallel_settings). The specified values of these properties are then ignored. In case there is no calibration yet, the first calculation calibrates the cost model (which takes a few seconds) and stores it in the file specified by the environment variable PYDREVER_PARALLEL_TUNING_FILE (~/.pydrever/paralleltuning.json by default). Call calibrate_parallel_settings beforehand to control when and where the calibration is performed."""
+        self.compact_output = False
+        """This property makes the calculation produce compact output locations (CompactOutputLocation) instead of DikernelOutputLocation. Compact output locations use less memory, which is useful when performing many calculations."""
+        self.cache: ResultCache | None = None
+        """Optional cache of calculation results. Results are cached per output location, only output locations that are not part of the cache (for equal profile, hydrodynamics and settings) are calculated. Successful calculations are added to the cache."""
+        self.stop_when_all_failed = False
+        """This property makes the calculation stop as soon as all output locations have failed. The output then only covers the time steps up to truncated_at."""
+        self.stop_at_first_failure = False
+        """This property makes the calculation stop as soon as one of the output locations has failed. The output then only covers the time steps up to truncated_at."""
+        self.truncated_at: float | None = None
+        """The time up to which the output was calculated in case the calculation was stopped early (see stop_when_all_failed and stop_at_first_failure). None in case all time steps were calculated."""
         self.__c_input = None
         self.__c_output = None
         self.__c_validation_result = None
+        self.__cancellation: _cs.CalculationCancellation | None = None
+        self.__is_cancelled = False
 
     def run(self) -> bool:
         """
@@ -66,6 +100,92 @@ class Dikernel:
         * warnings - Any warnings given by DiKErnel are listed in the warnings property of this class.
         * errors - Any errors given by DiKErnel are listed in the warnings property of this class.
 
+        Returns:
+            bool: Indicating whether the calculation was seccessfull or not.
+        """
+        self.truncated_at = None
+        if self.__cancellation is None:
+            self.__cancellation = _cs.CalculationCancellation()
+            if self.__is_cancelled:
+                self.__cancellation.Cancel()
+
+        if self.stop_when_all_failed or self.stop_at_first_failure:
+            return self.__run_until_failure()
+
+        return self.__run_complete()
+
+    async def run_async(self, executor: Executor | None = None, timeout: float | None = None) -> bool:
+        """
+        Runs the calculation (see run) in an executor and waits for it to finish without blocking the event loop. In case
+        the returned awaitable is cancelled or the timeout expires, the calculation is cancelled as well.
+
+        Args:
+            executor (Executor | None, optional): A thread pool executor to perform the calculation in. Defaults to the default executor of the event loop.
+            timeout (float | None, optional): The maximum time in seconds to wait for the calculation. Defaults to None (no timeout).
+
+        Raises:
+            TimeoutError: In case the calculation did not finish within the specified time.
+
+        Returns:
+            bool: Indicating whether the calculation was seccessfull or not.
+        """
+        future = asyncio.get_running_loop().run_in_executor(executor, self.run)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+        except asyncio.TimeoutError as e:
+            # Before Python 3.11, asyncio.TimeoutError is not the builtin TimeoutError.
+            self.cancel()
+            raise TimeoutError("The calculation did not finish within the specified time.") from e
+
+    def cancel(self):
+        """
+        Requests to stop the calculation. This method can be called from another thread while the calculation is running.
+        A cancelled calculation returns False and reports an error. Once cancelled, subsequent calls to run are cancelled as well.
+        """
+        self.__is_cancelled = True
+        if self.__cancellation is not None:
+            self.__cancellation.Cancel()
+
+    def run_chunked(self, chunk_size: int, checkpoint_file: str | None = None) -> Iterator[Dikernel]:
+        """
+        Method to run the calculation in chunks of time steps. Only the input and output of a single chunk exist at the same time,
+        which limits the memory that is needed for long time series. The damage at the end of each chunk is used as initial damage
+        of the next chunk. Locations that failed are not part of the subsequent chunks.
+
+        After each chunk the damage and failure of all locations can be written to a checkpoint file. A calculation that is started
+        again with the same input and checkpoint file (for example after the process was killed) resumes after the last finished chunk.
+
+        The output, warnings and errors of this instance are not changed.
+
+        Args:
+            chunk_size (int): The maximum number of time steps of each chunk.
+            checkpoint_file (str | None, optional): File to write checkpoints to and resume from. Defaults to None.
+
+        Raises:
+            ValueError: In case a checkpoint file is specified and the hydrodynamics interpolation function of the input can not be identified (see DikernelInput).
+
+        Yields:
+            Iterator[Dikernel]: The (finished) calculation of each chunk, holding the input, output, warnings and errors of that chunk.
+            Iteration stops after a chunk that did not succeed or when all locations have failed.
+        """
+        return _chunked_calculator.run(
+            self.input,
+            chunk_size,
+            self.calculate_locations_parallel,
+            self.calculate_time_steps_parallel,
+            self.compact_output,
+            self.cache,
+            checkpoint_file,
+            self.auto_parallel,
+        )
+
+    def __calculate(self) -> bool:
+        """
+        Validates the input and performs a calculation with DiKErnel for all output locations.
+
         Returns:
             bool: Indicating whether the calculation was seccessfull or not.
         """
@@ -73,14 +193,19 @@ class Dikernel:
             return False
 
         try:
-            handler: LogHandler = LogHandler()
-            settings: CalculatorSettings = CalculatorSettings()
+            handler: _cs.LogHandler = _cs.LogHandler()
+            settings: _cs.CalculatorSettings = _cs.CalculatorSettings()
             settings.LogHandler = handler
-            settings.CalculateLocationsInParallel = self.calculate_locations_parallel
-            settings.CalculateTimeStepsInParallel = self.calculate_time_steps_parallel
-            result = Calculator.Calculate(self.__c_input, settings)
+            settings.CalculateLocationsInParallel, settings.CalculateTimeStepsInParallel = self.__get_parallel_settings()
+            settings.ShouldCancel = self.__cancellation.ShouldCancel
+            # Python.NET releases the GIL while a .NET method is executed, other threads continue during the calculation.
+            result = _cs.Calculator.Calculate(self.__c_input, settings)
 
-            success = result.GetType() == SuccessResult
+            if self.__cancellation.IsCancelled:
+                self.errors.append("The calculation was cancelled.")
+                return False
+
+            success = result.GetType() == _cs.clr.GetClrType(_cs.SuccessResult)
 
             self.warnings.extend(list(w for w in handler.Warnings))
             self.errors.extend(list(w for w in handler.Errors))
@@ -98,12 +223,316 @@ class Dikernel:
                 return False
 
             x_positions = [l.x_position for l in _input_services.get_output_locations_from_input(self.input)]
-            self.output = _output_parser.parse(self.__c_output, x_positions)
+            self.output = _output_parser.parse(
+                self.__c_output,
+                x_positions,
+                self.input.requested_quantities,
+                self.compact_output,
+            )
 
             return self.__c_output is not None
         except Exception as e:
             return False
 
+    def to_array(self, quantity: TimeDependentOutputQuantity) -> numpy.ndarray | None:
+        """
+        Combines the calculated values of a time dependent quantity at all output locations in a single array.
+        Rows follow the order of the output locations (see the x_position of the output), columns follow the
+        calculated time steps (see get_output_time_steps).
+
+        Args:
+            quantity (TimeDependentOutputQuantity): The requested quantity.
+
+        Returns:
+            numpy.ndarray | None: A (number of locations x number of time steps) array with the values of the
+            requested quantity (NaN for locations without this quantity). None in case there is no output.
+        """
+        if self.output is None:
+            return None
+        return _output_services.to_array(self.output, quantity)
+
+    def to_table(self) -> dict[str, numpy.ndarray] | None:
+        """
+        Converts the output to a columnar table with one row per output location and time step. Next to the
+        available time dependent quantities, the table holds the columns x_position, z_position, time_of_failure
+        and time (the end of each calculated time step).
+
+        The result can directly be used to create a pandas DataFrame or an Arrow table.
+
+        Returns:
+            dict[str, numpy.ndarray] | None: The columns of the table by name. None in case there is no output.
+        """
+        if self.output is None:
+            return None
+        return _output_services.to_table(self.output, self.get_output_time_steps())
+
+    def get_output_time_steps(self) -> numpy.ndarray:
+        """
+        Returns:
+            numpy.ndarray: The end times of the calculated time steps, one for each value in the time dependent output.
+        """
+        time_steps = numpy.asarray(_input_services.get_run_time_steps(self.input)[1:], dtype=numpy.float64)
+        if self.truncated_at is not None:
+            time_steps = time_steps[time_steps <= self.truncated_at]
+        return time_steps
+
+    @staticmethod
+    def run_many(
+        inputs: list[DikernelInput],
+        workers: int | None = None,
+        calculate_locations_parallel: bool = False,
+        calculate_time_steps_parallel: bool = False,
+        compact_output: bool = False,
+        cache: ResultCache | None = None,
+        auto_parallel: bool = False,
+    ) -> list["Dikernel"]:
+        """
+        Method to run calculations for many inputs at once. The inputs are distributed over a pool of worker
+        processes. Each worker loads DiKErnel once and is reused for all inputs it receives.
+
+        Worker processes are spawned, scripts that call this method should therefore protect their entry
+        point with an 'if __name__ == "__main__":' block.
+
+        Args:
+            inputs (list[DikernelInput]): The inputs that need to be calculated.
+            workers (int | None, optional): The number of worker processes. Defaults to the number of available cores.
+            calculate_locations_parallel (bool, optional): See the property with the same name. Defaults to False.
+            calculate_time_steps_parallel (bool, optional): See the property with the same name. Defaults to False.
+            compact_output (bool, optional): See the property with the same name. Defaults to False.
+            cache (ResultCache | None, optional): See the property with the same name. Defaults to None.
+            auto_parallel (bool, optional): See the property with the same name. In case the cost model is not calibrated yet, it is calibrated before the workers start. Defaults to False.
+
+        Returns:
+            list[Dikernel]: One Dikernel instance per input (in the order of the specified inputs) holding the
+            output, warnings and errors of that calculation. The output is None for calculations that did not succeed.
+        """
+        inputs = list(inputs)
+        results = _batch_calculator.run(
+            inputs,
+            workers,
+            calculate_locations_parallel,
+            calculate_time_steps_parallel,
+            compact_output,
+            cache,
+            auto_parallel,
+        )
+
+        kernels = list[Dikernel]()
+        for input, (output, warnings, errors) in zip(inputs, results):
+            kernel = Dikernel(input)
+            kernel.calculate_locations_parallel = calculate_locations_parallel
+            kernel.calculate_time_steps_parallel = calculate_time_steps_parallel
+            kernel.auto_parallel = auto_parallel
+            kernel.compact_output = compact_output
+            kernel.cache = cache
+            kernel.output = output
+            kernel.warnings.extend(warnings)
+            kernel.errors.extend(errors)
+            kernels.append(kernel)
+
+        return kernels
+
+    def __get_parallel_settings(self) -> tuple[bool, bool]:
+        """
+        Returns:
+            tuple[bool, bool]: Whether to calculate locations in parallel and whether to calculate time steps in parallel.
+        """
+        if not self.auto_parallel:
+            return self.calculate_locations_parallel, self.calculate_time_steps_parallel
+
+        return _parallel_tuning.get_parallel_settings(
+            len(_input_services.get_output_locations_from_input(self.input)),
+            len(_input_services.get_run_time_steps(self.input)) - 1,
+        )
+
+    def __run_complete(self) -> bool:
+        """
+        Calculates all time steps, taking the results of output locations from the cache when possible.
+
+        Returns:
+            bool: Indicating whether the calculation was seccessfull or not.
+        """
+        location_keys = self.__get_cache_keys()
+        if location_keys is not None:
+            return self.__run_with_cache(location_keys)
+
+        return self.__calculate()
+
+    def __run_until_failure(self) -> bool:
+        """
+        Calculates consecutive segments of time steps until the locations have failed (see stop_when_all_failed and
+        stop_at_first_failure) or all time steps are calculated. Each segment continues with the damage at the end of the
+        previous segment (like run_chunked) and is as long as all previous segments together, segments do not overlap.
+
+        Locations that failed are not part of the subsequent segments. In case the calculation continues, their output is
+        completed afterwards by a single calculation that starts at the beginning of the segment in which they failed, so
+        the time steps from that segment onwards are calculated again for these locations.
+
+        The cache is not used, results of truncated calculations are never added to it.
+
+        Returns:
+            bool: Indicating whether the calculation was seccessfull or not.
+        """
+        # Segments are derived from the input, invalid input is reported before that.
+        if not self.__validate_input_data():
+            return False
+
+        try:
+            run_time_steps = _input_services.get_run_time_steps(self.input)
+            locations = _input_services.get_output_locations_from_input(self.input)
+        except Exception:
+            # Incomplete input is reported by validation.
+            return self.__run_complete()
+
+        number_of_time_steps = len(run_time_steps) - 1
+        i_segment_start = 0
+        i_segment_end = max(1, number_of_time_steps // 8)
+        if i_segment_end >= number_of_time_steps:
+            return self.__run_complete()
+
+        location_outputs = [list[DikernelOutputLocation | CompactOutputLocation]() for _ in locations]
+        damages = [location.top_layer_specification.initial_damage for location in locations]
+        indices = list(range(len(locations)))
+        # Start of the segment, number of previous outputs and damage at that start of locations that failed.
+        failure_states = dict[int, tuple[int, int, float | None]]()
+        warnings = list[str]()
+        while True:
+            segment_damages = [damages[i] for i in indices]
+            output = self.__run_segment(
+                run_time_steps[i_segment_start : i_segment_end + 1],
+                [locations[i] for i in indices],
+                segment_damages,
+                warnings,
+            )
+            if output is None:
+                return False
+
+            for i, damage, output_location in zip(indices, segment_damages, output, strict=True):
+                if output_location.failed:
+                    failure_states[i] = (i_segment_start, len(location_outputs[i]), damage)
+                location_outputs[i].append(output_location)
+                damages[i] = float(output_location.final_damage)
+            indices = [i for i in indices if i not in failure_states]
+
+            if i_segment_end >= number_of_time_steps or self.__has_stopped([outputs[-1] for outputs in location_outputs]):
+                break
+            i_segment_start, i_segment_end = i_segment_end, min(2 * i_segment_end, number_of_time_steps)
+
+        for i_start in sorted(set(state[0] for state in failure_states.values())):
+            completed_indices = [i for i, state in failure_states.items() if state[0] == i_start and i_start < i_segment_start]
+            if len(completed_indices) == 0:
+                continue
+            output = self.__run_segment(
+                run_time_steps[i_start : i_segment_end + 1],
+                [locations[i] for i in completed_indices],
+                [failure_states[i][2] for i in completed_indices],
+                warnings,
+            )
+            if output is None:
+                return False
+            for i, output_location in zip(completed_indices, output, strict=True):
+                location_outputs[i][failure_states[i][1] :] = [output_location]
+
+        self.warnings.extend(dict.fromkeys(warnings))
+        self.output = [_chunked_calculator.combine_output(outputs) for outputs in location_outputs]
+        if i_segment_end < number_of_time_steps:
+            self.truncated_at = run_time_steps[i_segment_end]
+        return True
+
+    def __run_segment(
+        self,
+        segment_time_steps: list[float],
+        locations: list[OutputLocationSpecification],
+        initial_damages: list[float | None],
+        warnings: list[str],
+    ) -> list[DikernelOutputLocation | CompactOutputLocation] | None:
+        """
+        Calculates a segment of the time steps for the specified locations (see __run_until_failure).
+
+        Returns:
+            list[DikernelOutputLocation | CompactOutputLocation] | None: The output of the segment. None in case the
+            calculation did not succeed, its warnings and errors are then added to this instance.
+        """
+        kernel = Dikernel(_chunked_calculator.get_chunk_input(self.input, segment_time_steps, locations, initial_damages))
+        kernel.calculate_locations_parallel = self.calculate_locations_parallel
+        kernel.calculate_time_steps_parallel = self.calculate_time_steps_parallel
+        kernel.auto_parallel = self.auto_parallel
+        kernel.compact_output = self.compact_output
+        kernel.__cancellation = self.__cancellation
+        succeeded = kernel.run()
+        warnings.extend(kernel.warnings)
+        if not succeeded:
+            self.warnings.extend(dict.fromkeys(warnings))
+            self.errors.extend(kernel.errors)
+            return None
+        return kernel.output
+
+    def __has_stopped(self, output: list[DikernelOutputLocation | CompactOutputLocation]) -> bool:
+        """
+        Returns:
+            bool: Whether the output meets the criterium to stop the calculation.
+        """
+        failed = [location.failed for location in output]
+        return (self.stop_at_first_failure and any(failed)) or (self.stop_when_all_failed and all(failed))
+
+    def __get_cache_keys(self) -> list[str] | None:
+        """
+        Returns:
+            list[str] | None: The keys of the output locations of this calculation in the cache. None in case no cache is used or the input is not complete enough to determine the keys.
+        """
+        if self.cache is None:
+            return None
+        try:
+            return _result_cache.get_location_keys(self.input, self.compact_output)
+        except Exception:
+            # Incomplete input is reported by validation.
+            return None
+
+    def __run_with_cache(self, location_keys: list[str]) -> bool:
+        """
+        Takes the results of output locations from the cache and calculates the remaining output locations.
+
+        Args:
+            location_keys (list[str]): The keys of all output locations in the cache.
+
+        Returns:
+            bool: Indicating whether the calculation was seccessfull or not.
+        """
+        cached_results = [self.cache.get(key) for key in location_keys]
+        missing_indices = [i for i, result in enumerate(cached_results) if result is None]
+        output = [result[0] if result is not None else None for result in cached_results]
+        warnings = [warning for result in cached_results if result is not None for warning in result[1]]
+
+        if len(missing_indices) > 0:
+            locations = _input_services.get_output_locations_from_input(self.input)
+            kernel = Dikernel(
+                self.input.model_copy(
+                    update={
+                        "output_locations": [locations[i] for i in missing_indices],
+                        "output_revetment_zones": None,
+                    }
+                )
+            )
+            kernel.calculate_locations_parallel = self.calculate_locations_parallel
+            kernel.calculate_time_steps_parallel = self.calculate_time_steps_parallel
+            kernel.auto_parallel = self.auto_parallel
+            kernel.compact_output = self.compact_output
+            kernel.__cancellation = self.__cancellation
+            if not kernel.run():
+                self.warnings.extend(kernel.warnings)
+                self.errors.extend(kernel.errors)
+                return False
+
+            for i, output_location in zip(missing_indices, kernel.output, strict=True):
+                output[i] = output_location
+            # The cache is reduced to its maximum size once for all new results.
+            self.cache.set_many([(location_keys[i], output[i], kernel.warnings) for i in missing_indices])
+            warnings.extend(kernel.warnings)
+
+        self.warnings.extend(dict.fromkeys(warnings))
+        self.output = output
+        return True
+
     def __validate(self) -> bool:
         """
         Calls the validation method of Dikernel to validate the specified input. First this
@@ -122,7 +551,7 @@ class Dikernel:
         return self.__run_kernel_validation()
 
     def __convert_input_to_c(self) -> bool:
-        self.__c_input, warnings, errors = _input_parser.parse(_input_services.get_run_input(self.input))
+        self.__c_input, warnings, errors = self._convert_run_input(_input_services.get_run_input(self.input))
 
         self.warnings.extend(warnings)
         self.errors.extend(errors)
@@ -131,14 +560,26 @@ class Dikernel:
 
         return True
 
+    def _convert_run_input(self, run_input: DikernelInput) -> tuple[_cs.ICalculationInput | None, list[str], list[str]]:
+        """
+        Converts the input of a calculation to C#-typed input. Derived classes can override this method to reuse previously converted input.
+
+        Args:
+            run_input (DikernelInput): The input as it should be passed to DiKErnel (see get_run_input).
+
+        Returns:
+            tuple[ICalculationInput | None, list[str], list[str]]: The C#-typed input, warnings and errors.
+        """
+        return _input_parser.parse(run_input)
+
     def __run_kernel_validation(self) -> bool:
         # TODO: Next version/release of DiKErnel this should be implemented similat to Calculate().
-        self.__c_validation_result = Validator.Validate(self.__c_input)
+        self.__c_validation_result = _cs.Validator.Validate(self.__c_input)
         warnings, errors = _message_helper.parse_messages(self.__c_validation_result)
         self.warnings.extend(warnings)
         self.errors.extend(errors)
 
-        return self.__c_validation_result.Successful and int(self.__c_validation_result.Data) == int(ValidationResultType.Successful)
+        return self.__c_validation_result.Successful and int(self.__c_validation_result.Data) == int(_cs.ValidationResultType.Successful)
 
     def __validate_input_data(self) -> bool:
         """
@@ -151,53 +592,99 @@ class Dikernel:
             self.errors.append("Specify input first")
             return False
 
+        # All checks are performed at once on arrays, every violation is reported instead of only the first one.
         result = True
+        time_steps = None
         if self.input.hydrodynamic_input is None:
             self.errors.append("Hydrodynamic input must be specified.")
             result = False
         elif self.input.hydrodynamic_input.time_steps is None or len(self.input.hydrodynamic_input.time_steps) < 2:
             self.errors.append("At least two time steps need to be specified in the hydrodynamic input.")
             result = False
+        else:
+            time_steps = numpy.asarray(self.input.hydrodynamic_input.time_steps, dtype=numpy.float64)
+            if not _validation_helper.contains_only_finite_numbers(time_steps):
+                self.errors.append("The time steps of the hydrodynamic input should all be finite numbers.")
+                result = False
+                time_steps = None
+            elif not _validation_helper.is_continuously_increasing(time_steps):
+                self.errors.append("The time steps of the hydrodynamic input should be continuously increasing.")
+                result = False
+            # Input that was copied or created from arrays is not validated by pydantic, the lengths are checked as well.
+            number_of_time_steps = len(self.input.hydrodynamic_input.time_steps)
+            for name, values in (
+                ("water levels", self.input.hydrodynamic_input.water_levels),
+                ("wave heights", self.input.hydrodynamic_input.wave_heights),
+                ("wave periods", self.input.hydrodynamic_input.wave_periods),
+                ("wave directions", self.input.hydrodynamic_input.wave_directions),
+            ):
+                if values is None:
+                    self.errors.append("The {0} of the hydrodynamic input must be specified.".format(name))
+                    result = False
+                elif len(values) != number_of_time_steps - 1:
+                    self.errors.append(
+                        "The number of {0} of the hydrodynamic input should be exactly 1 less than the number of time steps.".format(name)
+                    )
+                    result = False
+                elif not _validation_helper.contains_only_finite_numbers(values):
+                    self.errors.append("The {0} of the hydrodynamic input should all be finite numbers.".format(name))
+                    result = False
 
         if self.input.dike_schematization is None:
             self.errors.append("Dike schematization must be specified")
             result = False
-        if not _validation_helper.is_valid_orientation(self.input.dike_schematization.dike_orientation):
-            self.errors.append("Dike orientation must be specified as a number between 0 and 360 degrees.")
-            result = False
-            # TODO: Correct orientation?
-        if not _validation_helper.is_continuously_increasing(self.input.dike_schematization.x_positions):
-            self.warnings.append(
-                "X and Z positions of the dike schematization where re-arranged as they need to be continously increasing."
-            )
-            (
-                self.input.dike_schematization.x_positions,
-                self.input.dike_schematization.z_positions,
-            ) = _input_services.rearrange_profile_coordinates(
-                self.input.dike_schematization.x_positions,
-                self.input.dike_schematization.z_positions,
-            )
+        else:
+            if not _validation_helper.is_valid_orientation(self.input.dike_schematization.dike_orientation):
+                self.errors.append("Dike orientation must be specified as a number between 0 and 360 degrees.")
+                result = False
+                # TODO: Correct orientation?
+            if not _validation_helper.is_continuously_increasing(self.input.dike_schematization.x_positions):
+                self.warnings.append(
+                    "X and Z positions of the dike schematization where re-arranged as they need to be continously increasing."
+                )
+                (
+                    self.input.dike_schematization.x_positions,
+                    self.input.dike_schematization.z_positions,
+                ) = _input_services.rearrange_profile_coordinates(
+                    self.input.dike_schematization.x_positions,
+                    self.input.dike_schematization.z_positions,
+                )
 
         if (self.input.output_locations is None or len(self.input.output_locations) < 1) and (
             self.input.output_revetment_zones is None or len(self.input.output_revetment_zones) < 1
         ):
             self.errors.append("At least one outputlocation needs to be specified.")
             result = False
-        if self.input.start_time is not None and self.input.start_time > numpy.max(self.input.hydrodynamic_input.time_steps):
+
+        minimum_time = time_steps.min() if time_steps is not None else None
+        maximum_time = time_steps.max() if time_steps is not None else None
+        if self.input.start_time is not None and maximum_time is not None and self.input.start_time > maximum_time:
             self.errors.append("Start time should not exceed the specified hydrodynamic boundary conditions.")
             result = False
-        if self.input.output_time_steps is not None and len(self.input.output_time_steps) > 0:
-            minimumOutputTime = numpy.min(self.input.output_time_steps)
+        if self.input.stop_time is not None:
+            if self.input.start_time is not None and self.input.stop_time <= self.input.start_time:
+                self.errors.append("Stop time should be greater than the specified start time.")
+                result = False
+            if minimum_time is not None and self.input.stop_time < minimum_time:
+                self.errors.append("Stop time should not precede the specified hydrodynamic boundary conditions.")
+                result = False
+        output_time_steps = numpy.asarray(self.input.output_time_steps if self.input.output_time_steps is not None else [], dtype=numpy.float64)
+        if not _validation_helper.contains_only_finite_numbers(output_time_steps):
+            self.errors.append("Specified output time steps should all be finite numbers.")
+            result = False
+            output_time_steps = output_time_steps[numpy.isfinite(output_time_steps)]
+        if len(output_time_steps) > 0:
+            minimumOutputTime = output_time_steps.min()
             if self.input.start_time is not None and minimumOutputTime < self.input.start_time:
                 self.errors.append("Specified output time steps should all be greater than the specified start time.")
                 result = False
-            if self.input.hydrodynamic_input is not None and minimumOutputTime < numpy.min(self.input.hydrodynamic_input.time_steps):
+            if minimum_time is not None and minimumOutputTime < minimum_time:
                 self.errors.append(
                     "Specified output time steps should all be greater than the minimum specified time step of the hydrodynamic conditions."
                 )
                 result = False
-            maximumOutputTime = numpy.max(self.input.output_time_steps)
-            if self.input.hydrodynamic_input is not None and maximumOutputTime > numpy.max(self.input.hydrodynamic_input.time_steps):
+            maximumOutputTime = output_time_steps.max()
+            if maximum_time is not None and maximumOutputTime > maximum_time:
                 self.errors.append(
                     "Specified output time steps should not be greater than the maximum specified time step of the hydrodynamic conditions."
                 )
@@ -19,74 +19,119 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 """
-This file adds all relevent C# classes as import. 
+This file provides access to all relevent C# classes. The .NET runtime and DiKErnel assemblies are loaded
+when one of the classes is used for the first time (or when load is called), not when this file is imported.
 """
 
-# from pythonnet import load
-# load("coreclr", runtime_config="C:/src/pydrever/pydrever/calculation/_dikernel/_dikerneldll/runtimeconfig.json")
-
-import clr
+import pydrever.calculation._dikernel._runtimeconfiguration as _runtime_configuration
 import os
+import threading
 
 # pyright: reportMissingImports=false
 # pyright: reportMissingModuleSource=false
 # pyright: reportAttributeAccessIssue=false
 
 dll_base_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_dikerneldll")
-clr.AddReference(os.path.join(dll_base_path, "DiKErnel.Core.dll"))
-clr.AddReference(os.path.join(dll_base_path, "DiKErnel.Integration.dll"))
-clr.AddReference(os.path.join(dll_base_path, "DiKErnel.Util.dll"))
-clr.AddReference(os.path.join(dll_base_path, "DiKErnel.FunctionLibrary.dll"))
-clr.AddReference(os.path.join(dll_base_path, "LogHandlerHelper.dll"))
-
-from System import Double, ValueTuple, Type, Convert
-from System.Collections.Generic import List
-from System.Reflection import BindingFlags
-
-from LogHandlerHelper import LogHandler
-from DiKErnel.Core import Calculator, Validator, CalculatorSettings
-from DiKErnel.Core.Data import (
-    LocationDependentOutput,
-    CalculationOutput,
-    CharacteristicPointType,
-    ValidationResultType,
-    SuccessResult,
-    ICalculationInput,
-)
-
-from DiKErnel.Integration.Data.AsphaltWaveImpact import (
-    AsphaltWaveImpactLocationDependentOutput,
-    AsphaltWaveImpactLocationConstructionProperties,
-    AsphaltWaveImpactTopLayerType,
-)
-from DiKErnel.Integration.Data.Grass import (
-    GrassTopLayerType,
-    GrassCumulativeOverloadLocationDependentOutput,
-    GrassCumulativeOverloadLocationConstructionProperties,
-)
-from DiKErnel.Integration.Data.GrassWaveImpact import (
-    GrassWaveImpactLocationDependentOutput,
-    GrassWaveImpactLocationConstructionProperties,
-)
-from DiKErnel.Integration.Data.GrassWaveRunup import (
-    GrassWaveRunupRayleighDiscreteLocationConstructionProperties,
-    GrassWaveRunupBattjesGroenendijkAnalyticalLocationConstructionProperties,
-)
-from DiKErnel.Integration.Data.NaturalStoneWaveImpact import (
-    NaturalStoneWaveImpactLocationDependentOutput,
-    NaturalStoneWaveImpactLocationConstructionProperties,
-    NaturalStoneWaveImpactTopLayerType,
-)
-from DiKErnel.Integration.Data.GrassWaveOvertopping import (
-    GrassWaveOvertoppingRayleighDiscreteLocationConstructionProperties,
-    GrassWaveOvertoppingRayleighLocationConstructionProperties,
-)
-from DiKErnel.Integration import CalculationInputBuilder
-
-from DiKErnel.Util import EventType
-
-from DiKErnel.FunctionLibrary import HydraulicLoadFunctions
-
-from DiKErnel.FunctionLibrary.GrassWaveImpact import (
-    GrassWaveImpactFunctions,
-)
+
+__assemblies = [
+    "DiKErnel.Core.dll",
+    "DiKErnel.Integration.dll",
+    "DiKErnel.Util.dll",
+    "DiKErnel.FunctionLibrary.dll",
+    "LogHandlerHelper.dll",
+]
+__is_loaded = False
+__lock = threading.Lock()
+
+
+def load():
+    """
+    Starts the .NET runtime and loads the DiKErnel assemblies. This only happens once, subsequent calls return directly.
+    The runtime that is started can be configured with configure_runtime.
+    """
+    global __is_loaded
+    if __is_loaded:
+        return
+
+    with __lock:
+        if __is_loaded:
+            return
+
+        _runtime_configuration.apply_configuration()
+        import clr
+
+        for assembly in __assemblies:
+            clr.AddReference(os.path.join(dll_base_path, assembly))
+
+        from System import Array, Double, IntPtr, ValueTuple, Type, Convert
+        from System.Collections.Generic import List
+        from System.Reflection import BindingFlags
+        from System.Runtime.InteropServices import Marshal
+
+        from LogHandlerHelper import (
+            LogHandler,
+            CalculationInputBuilderHelper,
+            CalculationInputHelper,
+            CalculationCancellation,
+            LocationDependentOutputHelper,
+        )
+        from DiKErnel.Core import Calculator, Validator, CalculatorSettings
+        from DiKErnel.Core.Data import (
+            LocationDependentOutput,
+            CalculationOutput,
+            CharacteristicPointType,
+            ValidationResultType,
+            SuccessResult,
+            ICalculationInput,
+        )
+
+        from DiKErnel.Integration.Data.AsphaltWaveImpact import (
+            AsphaltWaveImpactLocationDependentOutput,
+            AsphaltWaveImpactLocationConstructionProperties,
+            AsphaltWaveImpactTopLayerType,
+        )
+        from DiKErnel.Integration.Data.Grass import (
+            GrassTopLayerType,
+            GrassCumulativeOverloadLocationDependentOutput,
+            GrassCumulativeOverloadLocationConstructionProperties,
+        )
+        from DiKErnel.Integration.Data.GrassWaveImpact import (
+            GrassWaveImpactLocationDependentOutput,
+            GrassWaveImpactLocationConstructionProperties,
+        )
+        from DiKErnel.Integration.Data.GrassWaveRunup import (
+            GrassWaveRunupRayleighDiscreteLocationConstructionProperties,
+            GrassWaveRunupBattjesGroenendijkAnalyticalLocationConstructionProperties,
+        )
+        from DiKErnel.Integration.Data.NaturalStoneWaveImpact import (
+            NaturalStoneWaveImpactLocationDependentOutput,
+            NaturalStoneWaveImpactLocationConstructionProperties,
+            NaturalStoneWaveImpactTopLayerType,
+        )
+        from DiKErnel.Integration.Data.GrassWaveOvertopping import (
+            GrassWaveOvertoppingRayleighDiscreteLocationConstructionProperties,
+            GrassWaveOvertoppingRayleighLocationConstructionProperties,
+        )
+        from DiKErnel.Integration import CalculationInputBuilder
+
+        from DiKErnel.Util import EventType
+
+        from DiKErnel.FunctionLibrary import HydraulicLoadFunctions
+
+        from DiKErnel.FunctionLibrary.GrassWaveImpact import (
+            GrassWaveImpactFunctions,
+        )
+
+        globals().update((name, value) for name, value in locals().items() if name != "assembly")
+        __is_loaded = True
+
+
+def __getattr__(name: str):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    load()
+    try:
+        return globals()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -18,6 +18,8 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
+from __future__ import annotations
+
 from pydrever.data import (
     DikernelInput,
     HydrodynamicConditions,
@@ -43,10 +45,11 @@ from pydrever.data import (
 )
 from pydrever.calculation._dikernel import _inputservices as _input_service
 from pydrever.calculation._dikernel import _messagehelper as _message_helper
-from pydrever.calculation._dikernel._dikernelcreferences import *
+from pydrever.calculation._dikernel import _arrayhelper as _array_helper
+import pydrever.calculation._dikernel._dikernelcreferences as _cs
 
 
-def parse(input: DikernelInput) -> ICalculationInput:
+def parse(input: DikernelInput) -> _cs.ICalculationInput:
     """
     Static method to parse a DikernelInput class to the equivalent C#-typed class.
 
@@ -56,7 +59,7 @@ def parse(input: DikernelInput) -> ICalculationInput:
     Returns:
         CalculationInput[C#]: The C#-typed input class produced by dikernels "CalculationInputBuilder".
     """
-    builder = CalculationInputBuilder(input.dike_schematization.dike_orientation)
+    builder = _cs.CalculationInputBuilder(input.dike_schematization.dike_orientation)
     __add_dike_profile_to_builder(builder, input.dike_schematization)
     __add_hydrodynamics_to_builder(builder, input.hydrodynamic_input)
     __add_output_location_specifications_to_builder(builder, input)
@@ -69,7 +72,45 @@ def parse(input: DikernelInput) -> ICalculationInput:
     return composed_input.Data, warnings, errors
 
 
-def __add_dike_profile_to_builder(builder: CalculationInputBuilder, dike_schematization: DikeSchematization) -> CalculationInputBuilder:
+def can_replace_hydrodynamics() -> bool:
+    """
+    Returns:
+        bool: Whether the loaded version of DiKErnel supports replacing the hydrodynamic conditions of parsed input
+        (see replace_hydrodynamics). This depends on internal types of DiKErnel, that are checked once.
+    """
+    return bool(_cs.CalculationInputHelper.CanReplaceTimeSteps)
+
+
+def replace_hydrodynamics(
+    c_input: _cs.ICalculationInput, hydrodynamic_conditions: HydrodynamicConditions
+) -> tuple[_cs.ICalculationInput | None, list[str], list[str]]:
+    """
+    Creates C#-typed input with the profile and locations of previously parsed input and new hydrodynamic conditions.
+    The profile and locations are not converted again. Only supported in case can_replace_hydrodynamics returns True.
+
+    Args:
+        c_input (ICalculationInput): Previously parsed input.
+        hydrodynamic_conditions (HydrodynamicConditions): The hydrodynamic conditions of the new input.
+
+    Returns:
+        tuple[ICalculationInput | None, list[str], list[str]]: The new input (None in case it could not be created), warnings and errors.
+    """
+    try:
+        new_input = _cs.CalculationInputHelper.ReplaceTimeSteps(
+            c_input,
+            _array_helper.to_c_array(hydrodynamic_conditions.time_steps),
+            _array_helper.to_c_array(hydrodynamic_conditions.water_levels),
+            _array_helper.to_c_array(hydrodynamic_conditions.wave_heights),
+            _array_helper.to_c_array(hydrodynamic_conditions.wave_periods),
+            _array_helper.to_c_array(hydrodynamic_conditions.wave_directions),
+        )
+    except Exception as e:
+        return None, [], [str(e)]
+
+    return new_input, [], []
+
+
+def __add_dike_profile_to_builder(builder: _cs.CalculationInputBuilder, dike_schematization: DikeSchematization) -> _cs.CalculationInputBuilder:
     """This function adds the specified dike profile to the C# input builder.
     First all dike segments are added, then all characteristic points are translated to C#
 
@@ -89,39 +130,40 @@ def __add_dike_profile_to_builder(builder: CalculationInputBuilder, dike_schemat
         builder.AddDikeProfileSegment(x_start, z_start, x_end, z_end, roughness)
 
     if dike_schematization.x_outer_toe is not None:
-        builder.AddDikeProfilePoint(dike_schematization.x_outer_toe, CharacteristicPointType.OuterToe)
+        builder.AddDikeProfilePoint(dike_schematization.x_outer_toe, _cs.CharacteristicPointType.OuterToe)
 
     if dike_schematization.x_crest_outer_berm is not None:
         builder.AddDikeProfilePoint(
             dike_schematization.x_crest_outer_berm,
-            CharacteristicPointType.CrestOuterBerm,
+            _cs.CharacteristicPointType.CrestOuterBerm,
         )
 
     if dike_schematization.x_notch_outer_berm is not None:
         builder.AddDikeProfilePoint(
             dike_schematization.x_notch_outer_berm,
-            CharacteristicPointType.NotchOuterBerm,
+            _cs.CharacteristicPointType.NotchOuterBerm,
         )
 
     if dike_schematization.x_outer_crest is not None:
-        builder.AddDikeProfilePoint(dike_schematization.x_outer_crest, CharacteristicPointType.OuterCrest)
+        builder.AddDikeProfilePoint(dike_schematization.x_outer_crest, _cs.CharacteristicPointType.OuterCrest)
 
     if dike_schematization.x_inner_crest is not None:
-        builder.AddDikeProfilePoint(dike_schematization.x_inner_crest, CharacteristicPointType.InnerCrest)
+        builder.AddDikeProfilePoint(dike_schematization.x_inner_crest, _cs.CharacteristicPointType.InnerCrest)
 
     if dike_schematization.x_inner_toe is not None:
-        builder.AddDikeProfilePoint(dike_schematization.x_inner_toe, CharacteristicPointType.InnerToe)
+        builder.AddDikeProfilePoint(dike_schematization.x_inner_toe, _cs.CharacteristicPointType.InnerToe)
 
     if dike_schematization.foreshore_slope is not None and dike_schematization.z_bottom is not None:
         builder.AddForeshore(dike_schematization.foreshore_slope, dike_schematization.z_bottom)
 
 
 def __add_hydrodynamics_to_builder(
-    builder: CalculationInputBuilder,
+    builder: _cs.CalculationInputBuilder,
     hydrodynamic_conditions: HydrodynamicConditions,
-) -> CalculationInputBuilder:
+) -> _cs.CalculationInputBuilder:
     """
-    This method adds the specified hydrodynamic input to the C# builder.
+    This method adds the specified hydrodynamic input to the C# builder. All time steps are
+    passed to C# at once, the builder is filled on the C# side.
 
     Args:
         builder (CalculationInputBuilder): The C# object used to build DiKErnel input.
@@ -130,20 +172,19 @@ def __add_hydrodynamics_to_builder(
     Returns:
         CalculationInputBuilder[C#]: The C#-typed builder with the added hydrodynamic conditions.
     """
-    for i in range(len(hydrodynamic_conditions.water_levels)):
-        builder.AddTimeStep(
-            Double(hydrodynamic_conditions.time_steps[i]),
-            Double(hydrodynamic_conditions.time_steps[i + 1]),
-            Double(hydrodynamic_conditions.water_levels[i]),
-            Double(hydrodynamic_conditions.wave_heights[i]),
-            Double(hydrodynamic_conditions.wave_periods[i]),
-            Double(hydrodynamic_conditions.wave_directions[i]),
-        )
+    _cs.CalculationInputBuilderHelper.AddTimeSteps(
+        builder,
+        _array_helper.to_c_array(hydrodynamic_conditions.time_steps),
+        _array_helper.to_c_array(hydrodynamic_conditions.water_levels),
+        _array_helper.to_c_array(hydrodynamic_conditions.wave_heights),
+        _array_helper.to_c_array(hydrodynamic_conditions.wave_periods),
+        _array_helper.to_c_array(hydrodynamic_conditions.wave_directions),
+    )
 
     return builder
 
 
-def __add_output_location_specifications_to_builder(builder: CalculationInputBuilder, input: DikernelInput) -> CalculationInputBuilder:
+def __add_output_location_specifications_to_builder(builder: _cs.CalculationInputBuilder, input: DikernelInput) -> _cs.CalculationInputBuilder:
     locations = _input_service.get_output_locations_from_input(input)
     settings = input.settings
 
@@ -222,10 +263,10 @@ def __create_asphalt_wave_impact_construction_properties(
     x_position: float,
     layer: AsphaltLayerSpecification,
     settings: AsphaltCalculationSettings | None,
-) -> AsphaltWaveImpactLocationConstructionProperties:
-    properties = AsphaltWaveImpactLocationConstructionProperties(
+) -> _cs.AsphaltWaveImpactLocationConstructionProperties:
+    properties = _cs.AsphaltWaveImpactLocationConstructionProperties(
         x_position,
-        AsphaltWaveImpactTopLayerType.HydraulicAsphaltConcrete,
+        _cs.AsphaltWaveImpactTopLayerType.HydraulicAsphaltConcrete,
         layer.flexural_strength,
         layer.soil_elasticity,
         layer.upper_layer_thickness,
@@ -258,11 +299,11 @@ def __create_natural_stone_construction_properties(
     x_position: float,
     layer: NordicStoneLayerSpecification,
     settings: NaturalStoneCalculationSettings | None,
-) -> NaturalStoneWaveImpactLocationConstructionProperties:
+) -> _cs.NaturalStoneWaveImpactLocationConstructionProperties:
 
-    properties = NaturalStoneWaveImpactLocationConstructionProperties(
+    properties = _cs.NaturalStoneWaveImpactLocationConstructionProperties(
         x_position,
-        NaturalStoneWaveImpactTopLayerType.NordicStone,
+        _cs.NaturalStoneWaveImpactTopLayerType.NordicStone,
         layer.top_layer_thickness,
         layer.relative_density,
     )
@@ -301,9 +342,9 @@ def __create_grass_wave_impact_construction_properties(
     x_position: float,
     layer: GrassWaveImpactLayerSpecification,
     settings: GrassWaveImpactCalculationSettings | None,
-) -> GrassWaveImpactLocationConstructionProperties:
-    top_layer_type = GrassTopLayerType.ClosedSod if layer.top_layer_type == TopLayerType.GrassClosedSod else GrassTopLayerType.OpenSod
-    properties = GrassWaveImpactLocationConstructionProperties(x_position, top_layer_type)
+) -> _cs.GrassWaveImpactLocationConstructionProperties:
+    top_layer_type = _cs.GrassTopLayerType.ClosedSod if layer.top_layer_type == TopLayerType.GrassClosedSod else _cs.GrassTopLayerType.OpenSod
+    properties = _cs.GrassWaveImpactLocationConstructionProperties(x_position, top_layer_type)
 
     topLayer = __get_first_grass_wave_impact_toplayer_of_type(settings, layer.top_layer_type)
 
@@ -327,17 +368,17 @@ def __create_grass_overtopping_rayleigh_discrete_construction_properties(
     x_position: float,
     layer: GrassOvertoppingLayerSpecification,
     settings: GrassWaveOvertoppingCalculationSettings | None,
-) -> GrassWaveOvertoppingRayleighDiscreteLocationConstructionProperties:
+) -> _cs.GrassWaveOvertoppingRayleighDiscreteLocationConstructionProperties:
 
     match layer.top_layer_type:
         case TopLayerType.GrassClosedSod:
-            topLayerType = GrassTopLayerType.ClosedSod
+            topLayerType = _cs.GrassTopLayerType.ClosedSod
         case TopLayerType.GrassOpenSod:
-            topLayerType = GrassTopLayerType.OpenSod
+            topLayerType = _cs.GrassTopLayerType.OpenSod
         case _:
             raise ValueError("Toplayer type should be of type open or closed sod when calculating grass toplayers.")
 
-    properties = GrassWaveOvertoppingRayleighDiscreteLocationConstructionProperties(x_position, topLayerType)
+    properties = _cs.GrassWaveOvertoppingRayleighDiscreteLocationConstructionProperties(x_position, topLayerType)
 
     topLayer = __get_first_grass_cumulative_overload_toplayer_of_type(settings, layer.top_layer_type)
 
@@ -361,17 +402,17 @@ def __create_grass_overtopping_rayleigh_construction_properties(
     x_position: float,
     layer: GrassOvertoppingLayerSpecification,
     settings: GrassWaveOvertoppingCalculationSettings | None,
-) -> GrassWaveOvertoppingRayleighLocationConstructionProperties:
+) -> _cs.GrassWaveOvertoppingRayleighLocationConstructionProperties:
 
     match layer.top_layer_type:
         case TopLayerType.GrassClosedSod:
-            topLayerType = GrassTopLayerType.ClosedSod
+            topLayerType = _cs.GrassTopLayerType.ClosedSod
         case TopLayerType.GrassOpenSod:
-            topLayerType = GrassTopLayerType.OpenSod
+            topLayerType = _cs.GrassTopLayerType.OpenSod
         case _:
             raise ValueError("Toplayer type should be of type open or closed sod when calculating grass toplayers.")
 
-    properties = GrassWaveOvertoppingRayleighLocationConstructionProperties(x_position, topLayerType)
+    properties = _cs.GrassWaveOvertoppingRayleighLocationConstructionProperties(x_position, topLayerType)
 
     topLayer = __get_first_grass_cumulative_overload_toplayer_of_type(settings, layer.top_layer_type)
 
@@ -394,15 +435,15 @@ def __create_grass_wave_runup_raileigh_discrete_construction_properties(
     x_position: float,
     layer: GrassWaveRunupLayerSpecification,
     settings: GrassWaveRunupCalculationSettings | None,
-) -> GrassWaveRunupRayleighDiscreteLocationConstructionProperties:
+) -> _cs.GrassWaveRunupRayleighDiscreteLocationConstructionProperties:
     topLayerType = None
     match layer.top_layer_type:
         case TopLayerType.GrassClosedSod:
-            topLayerType = GrassTopLayerType.ClosedSod
+            topLayerType = _cs.GrassTopLayerType.ClosedSod
         case TopLayerType.GrassOpenSod:
-            topLayerType = GrassTopLayerType.OpenSod
+            topLayerType = _cs.GrassTopLayerType.OpenSod
 
-    properties = GrassWaveRunupRayleighDiscreteLocationConstructionProperties(x_position, topLayerType)
+    properties = _cs.GrassWaveRunupRayleighDiscreteLocationConstructionProperties(x_position, topLayerType)
 
     top_layer = __get_first_grass_cumulative_overload_toplayer_of_type(settings, layer.top_layer_type)
 
@@ -423,15 +464,15 @@ def __create_grass_wave_runup_battjes_groenendijk_analytical_construction_proper
     x_position: float,
     layer: GrassWaveRunupLayerSpecification,
     settings: GrassWaveRunupCalculationSettings | None,
-) -> GrassWaveRunupBattjesGroenendijkAnalyticalLocationConstructionProperties:
+) -> _cs.GrassWaveRunupBattjesGroenendijkAnalyticalLocationConstructionProperties:
     topLayerType = None
     match layer.top_layer_type:
         case TopLayerType.GrassClosedSod:
-            topLayerType = GrassTopLayerType.ClosedSod
+            topLayerType = _cs.GrassTopLayerType.ClosedSod
         case TopLayerType.GrassOpenSod:
-            topLayerType = GrassTopLayerType.OpenSod
+            topLayerType = _cs.GrassTopLayerType.OpenSod
 
-    properties = GrassWaveRunupBattjesGroenendijkAnalyticalLocationConstructionProperties(x_position, topLayerType)
+    properties = _cs.GrassWaveRunupBattjesGroenendijkAnalyticalLocationConstructionProperties(x_position, topLayerType)
 
     top_layer = __get_first_grass_cumulative_overload_toplayer_of_type(settings, layer.top_layer_type)
 
@@ -457,10 +498,10 @@ def __convert_to_cList(lst: list[list[float]]):
     Returns:
         List[Double] [C#]: The C#-typed equivalent of the specified list.
     """
-    cList = List[ValueTuple[Double, Double]]()
+    cList = _cs.List[_cs.ValueTuple[_cs.Double, _cs.Double]]()
     if lst is not None:
         for l in lst:
-            cList.Add(ValueTuple[Double, Double](l[0], l[1]))
+            cList.Add(_cs.ValueTuple[_cs.Double, _cs.Double](l[0], l[1]))
     return cList
 
 
@@ -18,219 +18,191 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
+from __future__ import annotations
+
 from pydrever.data import (
     DikernelOutputLocation,
     AsphaltWaveImpactOutputLocation,
     GrassCumulativeOverloadOutputLocation,
     GrassWaveImpactOutputLocation,
     NaturalStoneOutputLocation,
+    TimeDependentOutputQuantity,
+    CompactOutputLocation,
+    CompactAsphaltWaveImpactOutputLocation,
+    CompactGrassCumulativeOverloadOutputLocation,
+    CompactGrassWaveImpactOutputLocation,
+    CompactNaturalStoneOutputLocation,
 )
-from pydrever.calculation._dikernel._dikernelcreferences import *
+import pydrever.calculation._dikernel._dikernelcreferences as _cs
+import pydrever.calculation._dikernel._arrayhelper as _array_helper
 import numpy as np
+from functools import partial
 
 
-def parse(c_output: CalculationOutput, x_positions: list[float]) -> list[DikernelOutputLocation]:
+def parse(
+    c_output: _cs.CalculationOutput,
+    x_positions: list[float],
+    requested_quantities: set[TimeDependentOutputQuantity] | None = None,
+    compact: bool = False,
+) -> list[DikernelOutputLocation | CompactOutputLocation]:
     """
     Converts C#-typed output to a list of DikernelOutputLocations
 
     Args:
         c_output (CalculationOutput): The obtained C# output.
         x_positions (list[float]): X-positions of the specfied output locations.
+        requested_quantities (set[TimeDependentOutputQuantity] | None, optional): The time dependent quantities that
+        need to be converted. The damage development is always converted, other quantities are set to None. If not
+        specified, all quantities are available and converted when they are first accessed.
+        compact (bool, optional): Whether to create compact output locations (CompactOutputLocation). All (requested)
+        quantities of compact output locations are converted directly. Defaults to False.
 
     Returns:
-        list[DikernelOutputLocation]: A list of output locations translated
-        to a (derived) type of DikernelOutputLocation containing all calculation results.
+        list[DikernelOutputLocation | CompactOutputLocation]: A list of output locations translated
+        to a (derived) type of DikernelOutputLocation (or CompactOutputLocation) containing all calculation results.
     """
-    output_locations = list[DikernelOutputLocation]()
+    output_locations = list[DikernelOutputLocation | CompactOutputLocation]()
     i = 0
     for c_output_location in c_output.LocationDependentOutputItems:
         c_output_location = c_output.LocationDependentOutputItems[i]
-        output_location = __create_output_location(c_output_location, x_positions[i])
+        output_location = __create_output_location(c_output_location, x_positions[i], requested_quantities, compact)
         if output_location is not None:
             output_locations.append(output_location)
-
         i = i + 1
+
     return output_locations
 
 
-def __create_output_location(c_output_location: LocationDependentOutput, x_position: float) -> DikernelOutputLocation | None:
+def __create_output_location(
+    c_output_location: _cs.LocationDependentOutput,
+    x_position: float,
+    requested_quantities: set[TimeDependentOutputQuantity] | None,
+    compact: bool,
+) -> DikernelOutputLocation | CompactOutputLocation | None:
     """
-    Converts a single C#-typed output location to an equivalent python class
+    Converts a single C#-typed output location to an equivalent python class. Only the values that
+    do not depend on time are converted directly. In case no quantities are requested, the time series
+    are converted when they are first accessed. Otherwise only the requested time series are converted.
 
     Args:
         c_output_location (LocationDependentOutput): The C# output.
         x_position (float): The X-positions of the specfied output location.
+        requested_quantities (set[TimeDependentOutputQuantity] | None): The quantities that need to be converted.
+        compact (bool): Whether to create a compact output location, for which all time series are converted directly.
 
     Returns:
-        DikernelOutputLocation: The translated output for this location.
+        DikernelOutputLocation | CompactOutputLocation: The translated output for this location.
     """
-
-    """
-    Calculate commonly used output variables
-    """
-    time_of_failure: float | None = c_output_location.TimeOfFailure
-    damage_increment: list[float] = list(item.IncrementDamage for item in c_output_location.TimeDependentOutputItems)
-    damage_development: list[float] = list(item for item in c_output_location.CumulativeDamages)
+    values = {
+        "x_position": x_position,
+        "z_position": c_output_location.Z,
+        "time_of_failure": c_output_location.TimeOfFailure,
+    }
 
     """
     Switch between the various type of possible output (different types of calculation)
     """
     match c_output_location:
-        case AsphaltWaveImpactLocationDependentOutput():
-            return __create_asphalt_wave_impact_output_location(
-                x_position,
-                c_output_location.Z,
-                time_of_failure,
-                c_output_location.OuterSlope,
-                c_output_location.LogFlexuralStrength,
-                c_output_location.StiffnessRelation,
-                c_output_location.ComputationalThickness,
-                c_output_location.EquivalentElasticModulus,
-                damage_development,
-                damage_increment,
-                c_output_location.TimeDependentOutputItems,
-            )
-        case GrassCumulativeOverloadLocationDependentOutput():
-            return __create_grass_cumulative_overload_output_location(
-                x_position,
-                c_output_location.Z,
-                time_of_failure,
-                damage_development,
-                damage_increment,
-                c_output_location.TimeDependentOutputItems,
-            )
-        case GrassWaveImpactLocationDependentOutput():
-            return __create_grass_wave_impact_output_location(
-                x_position,
-                c_output_location.Z,
-                time_of_failure,
-                c_output_location.MinimumWaveHeight,
-                c_output_location.MaximumWaveHeight,
-                damage_development,
-                damage_increment,
-                c_output_location.TimeDependentOutputItems,
-            )
-        case NaturalStoneWaveImpactLocationDependentOutput():
-            return __create_natural_stone_output_location(
-                x_position,
-                c_output_location.Z,
-                time_of_failure,
-                c_output_location.Resistance,
-                damage_development,
-                damage_increment,
-                c_output_location.TimeDependentOutputItems,
-            )
-
-
-def __create_asphalt_wave_impact_output_location(
-    x_position: float,
-    z_position: float,
-    time_of_failure: float | None,
-    outer_slope: float,
-    log_flexural_strength: float,
-    stiffness_relation: float,
-    computational_thickness: float,
-    equivalent_elastic_modulus: float,
-    damage_development: list[float],
-    damage_increment: list[float],
-    time_dependent_output_items,
-) -> AsphaltWaveImpactOutputLocation:
-    return AsphaltWaveImpactOutputLocation(
-        x_position=x_position,
-        time_of_failure=time_of_failure,
-        damage_development=damage_development,
-        damage_increment=damage_increment,
-        z_position=z_position,
-        outer_slope=outer_slope,
-        log_flexural_strength=log_flexural_strength,
-        stiffness_relation=stiffness_relation,
-        computational_thickness=computational_thickness,
-        equivalent_elastic_modulus=equivalent_elastic_modulus,
-        maximum_peak_stress=list(item.MaximumPeakStress for item in time_dependent_output_items),
-        average_number_of_waves=list(item.AverageNumberOfWaves for item in time_dependent_output_items),
-    )
-
-
-def __create_grass_cumulative_overload_output_location(
-    x_position: float,
-    z_position: float,
-    time_of_failure: float | None,
-    damage_development: list[float],
-    damage_increment: list[float],
-    time_dependent_output_items,
-) -> GrassCumulativeOverloadOutputLocation:
-    return GrassCumulativeOverloadOutputLocation(
-        x_position=x_position,
-        z_position=z_position,
-        time_of_failure=time_of_failure,
-        damage_development=damage_development,
-        damage_increment=damage_increment,
-        vertical_distance_water_level_elevation=list(item.VerticalDistanceWaterLevelElevation for item in time_dependent_output_items),
-        representative_wave_runup_2p=list(item.RepresentativeWaveRunup2P for item in time_dependent_output_items),
-        cumulative_overload=list(item.CumulativeOverload for item in time_dependent_output_items),
-        average_number_of_waves=list(item.AverageNumberOfWaves for item in time_dependent_output_items),
-    )
-
+        case _cs.AsphaltWaveImpactLocationDependentOutput():
+            output_type = AsphaltWaveImpactOutputLocation
+            values["outer_slope"] = c_output_location.OuterSlope
+            values["log_flexural_strength"] = c_output_location.LogFlexuralStrength
+            values["stiffness_relation"] = c_output_location.StiffnessRelation
+            values["computational_thickness"] = c_output_location.ComputationalThickness
+            values["equivalent_elastic_modulus"] = c_output_location.EquivalentElasticModulus
+        case _cs.GrassCumulativeOverloadLocationDependentOutput():
+            output_type = GrassCumulativeOverloadOutputLocation
+        case _cs.GrassWaveImpactLocationDependentOutput():
+            output_type = GrassWaveImpactOutputLocation
+            values["minimum_wave_height"] = c_output_location.MinimumWaveHeight
+            values["maximum_wave_height"] = c_output_location.MaximumWaveHeight
+        case _cs.NaturalStoneWaveImpactLocationDependentOutput():
+            output_type = NaturalStoneOutputLocation
+            values["resistance"] = c_output_location.Resistance
+        case _:
+            return None
+
+    if requested_quantities is None and not compact:
+        output_location = output_type.model_construct(**values)
+        output_location._quantity_loader = partial(__get_output_values, c_output_location)
+        return output_location
+
+    if compact:
+        output_type = __compact_output_types[output_type]
+        field_names = output_type.field_names
+    else:
+        field_names = output_type.model_fields
+
+    for field_name in field_names:
+        if field_name not in values and __is_requested(field_name, requested_quantities):
+            values[field_name] = __get_output_values(c_output_location, field_name)
+
+    if compact:
+        return output_type(**values)
+
+    for field_name in field_names:
+        values.setdefault(field_name, None)
+    return output_type.model_construct(**values)
+
+
+def __is_requested(field_name: str, requested_quantities: set[TimeDependentOutputQuantity] | None) -> bool:
+    if requested_quantities is None or field_name == TimeDependentOutputQuantity.DamageDevelopment.value:
+        return True
+    return any(quantity.value == field_name for quantity in requested_quantities)
+
+
+__compact_output_types: dict[type, type] = {
+    AsphaltWaveImpactOutputLocation: CompactAsphaltWaveImpactOutputLocation,
+    GrassCumulativeOverloadOutputLocation: CompactGrassCumulativeOverloadOutputLocation,
+    GrassWaveImpactOutputLocation: CompactGrassWaveImpactOutputLocation,
+    NaturalStoneOutputLocation: CompactNaturalStoneOutputLocation,
+}
+
+
+__time_dependent_output_properties: dict[str, str] = {
+    "damage_increment": "IncrementDamage",
+    "maximum_peak_stress": "MaximumPeakStress",
+    "average_number_of_waves": "AverageNumberOfWaves",
+    "vertical_distance_water_level_elevation": "VerticalDistanceWaterLevelElevation",
+    "representative_wave_runup_2p": "RepresentativeWaveRunup2P",
+    "cumulative_overload": "CumulativeOverload",
+    "loading_revetment": "LoadingRevetment",
+    "upper_limit_loading": "UpperLimitLoading",
+    "lower_limit_loading": "LowerLimitLoading",
+    "wave_angle": "WaveAngle",
+    "wave_angle_impact": "WaveAngleImpact",
+    "wave_height_impact": "WaveHeightImpact",
+    "outer_slope": "OuterSlope",
+    "slope_upper_level": "SlopeUpperLevel",
+    "slope_upper_position": "SlopeUpperPosition",
+    "slope_lower_level": "SlopeLowerLevel",
+    "slope_lower_position": "SlopeLowerPosition",
+    "surf_similarity_parameter": "SurfSimilarityParameter",
+    "wave_steepness_deep_water": "WaveSteepnessDeepWater",
+    "depth_maximum_wave_load": "DepthMaximumWaveLoad",
+    "distance_maximum_wave_elevation": "DistanceMaximumWaveElevation",
+    "normative_width_of_wave_impact": "NormativeWidthOfWaveImpact",
+    "hydrodynamic_load": "HydraulicLoad",
+    "reference_time_degradation": "ReferenceTimeDegradation",
+    "reference_degradation": "ReferenceDegradation",
+}
+"""Names of the C# time dependent output properties for each field of the output locations."""
+
+
+def __get_output_values(c_output_location: _cs.LocationDependentOutput, field_name: str) -> np.ndarray:
+    """
+    Retrieves the values of a time dependent output quantity for all time steps at once.
 
-def __create_grass_wave_impact_output_location(
-    x_position: float,
-    z_position: float,
-    time_of_failure: float | None,
-    minimum_wave_height: float,
-    maximum_wave_height: float,
-    damage_development: list[float],
-    damage_increment: list[float],
-    time_dependent_output_items,
-) -> GrassWaveImpactOutputLocation:
-    return GrassWaveImpactOutputLocation(
-        x_position=x_position,
-        z_position=z_position,
-        time_of_failure=time_of_failure,
-        damage_development=damage_development,
-        damage_increment=damage_increment,
-        minimum_wave_height=minimum_wave_height,
-        maximum_wave_height=maximum_wave_height,
-        loading_revetment=list(item.LoadingRevetment for item in time_dependent_output_items),
-        upper_limit_loading=list(item.UpperLimitLoading for item in time_dependent_output_items),
-        lower_limit_loading=list(item.LowerLimitLoading for item in time_dependent_output_items),
-        wave_angle=list(item.WaveAngle for item in time_dependent_output_items),
-        wave_angle_impact=list(item.WaveAngleImpact for item in time_dependent_output_items),
-        wave_height_impact=list(item.WaveHeightImpact for item in time_dependent_output_items),
-    )
+    Args:
+        c_output_location (LocationDependentOutput): The C# output.
+        field_name (str): The name of the field of the output location.
 
+    Returns:
+        np.ndarray: The values for each time step. Empty (null) values are returned as NaN.
+    """
+    if field_name == "damage_development":
+        return _array_helper.to_numpy(_cs.LocationDependentOutputHelper.GetCumulativeDamages(c_output_location))
 
-def __create_natural_stone_output_location(
-    x_position: float,
-    z_position: float,
-    time_of_failure: float | None,
-    resistance: float,
-    damage_development: list[float],
-    damage_increment: list[float],
-    time_dependent_output_items,
-) -> NaturalStoneOutputLocation:
-    return NaturalStoneOutputLocation(
-        x_position=x_position,
-        time_of_failure=time_of_failure,
-        damage_development=damage_development,
-        damage_increment=damage_increment,
-        z_position=z_position,
-        resistance=resistance,
-        outer_slope=list(item.OuterSlope for item in time_dependent_output_items),
-        slope_upper_level=list(item.SlopeUpperLevel for item in time_dependent_output_items),
-        slope_upper_position=list(item.SlopeUpperPosition for item in time_dependent_output_items),
-        slope_lower_level=list(item.SlopeLowerLevel for item in time_dependent_output_items),
-        slope_lower_position=list(item.SlopeLowerPosition for item in time_dependent_output_items),
-        loading_revetment=list(item.LoadingRevetment for item in time_dependent_output_items),
-        surf_similarity_parameter=list(item.SurfSimilarityParameter for item in time_dependent_output_items),
-        wave_steepness_deep_water=list(item.WaveSteepnessDeepWater for item in time_dependent_output_items),
-        upper_limit_loading=list(item.UpperLimitLoading for item in time_dependent_output_items),
-        lower_limit_loading=list(item.LowerLimitLoading for item in time_dependent_output_items),
-        depth_maximum_wave_load=list(item.DepthMaximumWaveLoad for item in time_dependent_output_items),
-        distance_maximum_wave_elevation=list(item.DistanceMaximumWaveElevation for item in time_dependent_output_items),
-        normative_width_of_wave_impact=list(item.NormativeWidthOfWaveImpact for item in time_dependent_output_items),
-        hydrodynamic_load=list(item.HydraulicLoad for item in time_dependent_output_items),
-        wave_angle=list(item.WaveAngle for item in time_dependent_output_items),
-        wave_angle_impact=list(item.WaveAngleImpact for item in time_dependent_output_items),
-        reference_time_degradation=list(item.ReferenceTimeDegradation for item in time_dependent_output_items),
-        reference_degradation=list(item.ReferenceDegradation for item in time_dependent_output_items),
+    return _array_helper.to_numpy(
+        _cs.LocationDependentOutputHelper.GetTimeDependentValues(c_output_location, __time_dependent_output_properties[field_name])
     )
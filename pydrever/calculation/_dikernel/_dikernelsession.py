@@ -0,0 +1,164 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from __future__ import annotations
+
+from pydrever.data import (
+    DikernelInput,
+    DikeSchematization,
+    HydrodynamicConditions,
+    OutputLocationSpecification,
+    RevetmentZoneSpecification,
+    CalculationSettings,
+    TimeDependentOutputQuantity,
+    InterpolationType,
+)
+from pydrever.calculation._dikernel._dikernel import Dikernel
+from pydrever.calculation._dikernel._resultcache import ResultCache
+import pydrever.calculation._dikernel._dikernelcreferences as _cs
+import pydrever.calculation._dikernel._dikernelinputparser as _input_parser
+from typing import Callable
+
+
+class DikernelSession:
+    """
+    Class to calculate one dike profile with a fixed set of output locations and settings for many different
+    hydrodynamic conditions. The profile and locations are converted to C#-typed input once, for each calculation
+    only the hydrodynamic conditions are converted.
+    """
+
+    def __init__(
+        self,
+        dike_schematization: DikeSchematization,
+        output_locations: list[OutputLocationSpecification] | None = None,
+        output_revetment_zones: list[RevetmentZoneSpecification] | None = None,
+        settings: list[CalculationSettings] | None = None,
+        requested_quantities: set[TimeDependentOutputQuantity] | None = None,
+    ):
+        """
+        Initiates a session for the specified dike profile and output locations. All specifications are copied,
+        changing them afterwards does not affect the session.
+
+        Args:
+            dike_schematization (DikeSchematization): Schematization of the dike profile.
+            output_locations (list[OutputLocationSpecification] | None, optional): The desired output locations. Defaults to None.
+            output_revetment_zones (list[RevetmentZoneSpecification] | None, optional): The desired output zones. Defaults to None.
+            settings (list[CalculationSettings] | None, optional): Calculation settings per type of revetment. Defaults to None.
+            requested_quantities (set[TimeDependentOutputQuantity] | None, optional): See DikernelInput. Defaults to None.
+        """
+        self.dike_schematization: DikeSchematization = dike_schematization.model_copy(deep=True)
+        """Schematization of the dike profile."""
+        self.output_locations: list[OutputLocationSpecification] | None = _copy(output_locations)
+        """The desired output locations."""
+        self.output_revetment_zones: list[RevetmentZoneSpecification] | None = _copy(output_revetment_zones)
+        """The desired output zones."""
+        self.settings: list[CalculationSettings] | None = _copy(settings)
+        """Calculation settings per type of revetment."""
+        self.requested_quantities: set[TimeDependentOutputQuantity] | None = requested_quantities
+        """The time dependent quantities that need to be part of the output (see DikernelInput)."""
+        self.hydrodynamics_interpolation: InterpolationType | Callable = InterpolationType.Previous
+        """The interpolation of the hydrodynamic conditions for added time steps (see DikernelInput)."""
+        self.calculate_locations_parallel = False
+        """See the property with the same name of Dikernel."""
+        self.calculate_time_steps_parallel = False
+        """See the property with the same name of Dikernel."""
+        self.auto_parallel = False
+        """See the property with the same name of Dikernel."""
+        self.compact_output = False
+        """See the property with the same name of Dikernel."""
+        self.cache: ResultCache | None = None
+        """See the property with the same name of Dikernel."""
+        self.__c_input: _cs.ICalculationInput | None = None
+
+    def run(
+        self,
+        hydrodynamic_input: HydrodynamicConditions,
+        start_time: float | None = None,
+        stop_time: float | None = None,
+        output_time_steps: list[float] | None = None,
+    ) -> Dikernel:
+        """
+        Performs a calculation with the specified hydrodynamic conditions.
+
+        Args:
+            hydrodynamic_input (HydrodynamicConditions): The hydrodynamic conditions.
+            start_time (float | None, optional): Optional start time of the calculation. Defaults to None.
+            stop_time (float | None, optional): Optional stop time of the calculation. Defaults to None.
+            output_time_steps (list[float] | None, optional): Optional list of desired output time steps. Defaults to None.
+
+        Returns:
+            Dikernel: The (finished) calculation, holding the input, output, warnings and errors.
+        """
+        input = DikernelInput(
+            hydrodynamic_input=hydrodynamic_input,
+            dike_schematization=self.dike_schematization,
+            output_locations=self.output_locations,
+            output_revetment_zones=self.output_revetment_zones,
+            settings=self.settings,
+            start_time=start_time,
+            stop_time=stop_time,
+            output_time_steps=output_time_steps,
+            requested_quantities=self.requested_quantities,
+            hydrodynamics_interpolation=self.hydrodynamics_interpolation,
+        )
+        kernel = _SessionDikernel(input, self)
+        kernel.calculate_locations_parallel = self.calculate_locations_parallel
+        kernel.calculate_time_steps_parallel = self.calculate_time_steps_parallel
+        kernel.auto_parallel = self.auto_parallel
+        kernel.compact_output = self.compact_output
+        kernel.cache = self.cache
+        kernel.run()
+        return kernel
+
+    def _convert_run_input(self, run_input: DikernelInput) -> tuple[_cs.ICalculationInput | None, list[str], list[str]]:
+        """
+        Converts the input of a calculation of this session to C#-typed input. The profile and locations are only converted for the first calculation,
+        unless the loaded version of DiKErnel does not support replacing the hydrodynamic conditions. All input is then converted for each calculation.
+
+        Args:
+            run_input (DikernelInput): The input as it should be passed to DiKErnel (see get_run_input).
+
+        Returns:
+            tuple[ICalculationInput | None, list[str], list[str]]: The C#-typed input, warnings and errors.
+        """
+        if self.__c_input is not None:
+            return _input_parser.replace_hydrodynamics(self.__c_input, run_input.hydrodynamic_input)
+
+        c_input, warnings, errors = _input_parser.parse(run_input)
+        if c_input is not None and len(errors) == 0 and _input_parser.can_replace_hydrodynamics():
+            self.__c_input = c_input
+        return c_input, warnings, errors
+
+
+class _SessionDikernel(Dikernel):
+    """
+    Dikernel that obtains its C#-typed input from a session.
+    """
+
+    def __init__(self, input: DikernelInput, session: DikernelSession):
+        super().__init__(input)
+        self.__session = session
+
+    def _convert_run_input(self, run_input: DikernelInput) -> tuple[_cs.ICalculationInput | None, list[str], list[str]]:
+        return self.__session._convert_run_input(run_input)
+
+
+def _copy(specifications: list | None) -> list | None:
+    return [specification.model_copy(deep=True) for specification in specifications] if specifications is not None else None
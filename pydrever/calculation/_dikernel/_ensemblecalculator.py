@@ -0,0 +1,324 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+This file contains the functions needed to calculate an ensemble of hydrodynamic scenarios for a single dike
+profile. Scenarios are streamed to a pool of worker processes and only a summary of each calculation is
+returned, statistics over the ensemble are aggregated while the results come in.
+"""
+
+from pydrever.data import DikernelInput, HydrodynamicConditions
+import pydrever.calculation._dikernel._batchcalculator as _batch_calculator
+import pydrever.calculation._dikernel._paralleltuning as _parallel_tuning
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from typing import Iterable
+import numpy
+
+
+class EnsembleResult:
+    """
+    Statistics of the output locations over all scenarios of an ensemble. The statistics are updated for each
+    scenario, the memory that is used does not grow with the number of scenarios.
+
+    The quantiles of the final damage are exact for up to five scenarios. For more scenarios they are estimated with
+    the P-square algorithm (Jain and Chlamtac, 1985), which keeps five markers per quantile and location. The estimate
+    converges to the exact quantile for larger ensembles, but is an approximation for small ensembles and for quantiles
+    in the tails of the distribution. The minimum (quantile 0) and maximum (quantile 1) are always exact.
+    """
+
+    def __init__(self, quantiles: Iterable[float] = (0.05, 0.5, 0.95)):
+        """
+        Creates an empty result.
+
+        Args:
+            quantiles (Iterable[float], optional): The quantiles of the final damage that are reported by damage_quantiles. Defaults to (0.05, 0.5, 0.95).
+        """
+        self.quantiles: tuple[float, ...] = tuple(quantiles)
+        """The quantiles of the final damage that are reported by damage_quantiles."""
+        self.x_positions: numpy.ndarray | None = None
+        """The cross-shore positions of the output locations."""
+        self.number_of_scenarios: int = 0
+        """The number of scenarios that were calculated successfully."""
+        self.errors: dict[int, list[str]] = {}
+        """The errors of the scenarios that could not be calculated, by index of the scenario."""
+        self.__number_of_failures: numpy.ndarray | None = None
+        self.__sum_of_damage: numpy.ndarray | None = None
+        self.__maximum_damage: numpy.ndarray | None = None
+        self.__quantile_estimators: list[_QuantileEstimator] = []
+
+    def add(self, x_positions: numpy.ndarray, final_damages: numpy.ndarray, failed: numpy.ndarray):
+        """
+        Adds the summary of a single scenario to the statistics.
+
+        Args:
+            x_positions (numpy.ndarray): The cross-shore positions of the output locations.
+            final_damages (numpy.ndarray): The damage at the end of the calculation for each output location.
+            failed (numpy.ndarray): Whether the revetment failed for each output location.
+        """
+        if self.x_positions is None:
+            self.x_positions = x_positions
+            self.__number_of_failures = numpy.zeros(len(x_positions), dtype=numpy.int64)
+            self.__sum_of_damage = numpy.zeros(len(x_positions))
+            self.__maximum_damage = numpy.full(len(x_positions), -numpy.inf)
+            self.__quantile_estimators = [_QuantileEstimator(quantile, len(x_positions)) for quantile in self.quantiles]
+        elif len(x_positions) != len(self.x_positions):
+            raise ValueError("All scenarios of an ensemble should result in the same output locations.")
+
+        self.number_of_scenarios += 1
+        self.__number_of_failures += failed
+        self.__sum_of_damage += final_damages
+        numpy.maximum(self.__maximum_damage, final_damages, out=self.__maximum_damage)
+        for estimator in self.__quantile_estimators:
+            estimator.add(final_damages)
+
+    @property
+    def failure_probabilities(self) -> numpy.ndarray | None:
+        """
+        Returns:
+            numpy.ndarray | None: The fraction of the calculated scenarios in which each output location failed. None in case no scenario was calculated.
+        """
+        if self.number_of_scenarios == 0:
+            return None
+        return self.__number_of_failures / self.number_of_scenarios
+
+    @property
+    def mean_damage(self) -> numpy.ndarray | None:
+        """
+        Returns:
+            numpy.ndarray | None: The mean final damage of each output location. None in case no scenario was calculated.
+        """
+        if self.number_of_scenarios == 0:
+            return None
+        return self.__sum_of_damage / self.number_of_scenarios
+
+    @property
+    def maximum_damage(self) -> numpy.ndarray | None:
+        """
+        Returns:
+            numpy.ndarray | None: The maximum final damage of each output location. None in case no scenario was calculated.
+        """
+        if self.number_of_scenarios == 0:
+            return None
+        return self.__maximum_damage.copy()
+
+    @property
+    def damage_quantiles(self) -> numpy.ndarray | None:
+        """
+        Returns:
+            numpy.ndarray | None: A (number of quantiles x number of locations) array with the (estimated, see EnsembleResult) quantiles of the final damage of each output location. None in case no scenario was calculated.
+        """
+        if self.number_of_scenarios == 0:
+            return None
+        return numpy.vstack([estimator.quantile for estimator in self.__quantile_estimators])
+
+
+class _QuantileEstimator:
+    """
+    Streaming estimate of a single quantile for a number of locations at once, using the P-square algorithm.
+    The first five values are kept to report exact quantiles, the markers are initialized when a sixth value is added.
+    """
+
+    __number_of_markers = 5
+
+    def __init__(self, quantile: float, number_of_locations: int):
+        if quantile < 0.0 or quantile > 1.0:
+            raise ValueError("Quantiles should be between 0 and 1.")
+        self.__quantile = quantile
+        self.__initial_values: list[numpy.ndarray] | None = []
+        self.__heights = numpy.empty((self.__number_of_markers, number_of_locations))
+        self.__positions = numpy.empty((self.__number_of_markers, number_of_locations))
+        self.__desired_positions = numpy.array([1.0, 1.0 + 2.0 * quantile, 1.0 + 4.0 * quantile, 3.0 + 2.0 * quantile, 5.0])
+        self.__position_increments = numpy.array([0.0, quantile / 2.0, quantile, (1.0 + quantile) / 2.0, 1.0])
+
+    @property
+    def quantile(self) -> numpy.ndarray:
+        if self.__initial_values is not None:
+            return numpy.quantile(numpy.vstack(self.__initial_values), self.__quantile, axis=0)
+        if self.__quantile == 0.0:
+            return self.__heights[0].copy()
+        if self.__quantile == 1.0:
+            return self.__heights[-1].copy()
+        return self.__heights[2].copy()
+
+    def add(self, values: numpy.ndarray):
+        if self.__initial_values is not None:
+            if len(self.__initial_values) < self.__number_of_markers:
+                self.__initial_values.append(numpy.array(values, dtype=numpy.float64))
+                return
+            self.__heights[:] = numpy.sort(numpy.vstack(self.__initial_values), axis=0)
+            self.__positions[:] = numpy.arange(1.0, self.__number_of_markers + 1.0)[:, None]
+            self.__initial_values = None
+
+        heights = self.__heights
+        positions = self.__positions
+        numpy.minimum(heights[0], values, out=heights[0])
+        numpy.maximum(heights[-1], values, out=heights[-1])
+        # Index of the cell (between two markers) that contains the value, positions of all markers above it increase.
+        cells = numpy.count_nonzero(values >= heights[1:-1], axis=0)
+        positions += numpy.arange(self.__number_of_markers)[:, None] > cells
+        self.__desired_positions += self.__position_increments
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            for i in range(1, self.__number_of_markers - 1):
+                difference = self.__desired_positions[i] - positions[i]
+                should_move = ((difference >= 1.0) & (positions[i + 1] - positions[i] > 1.0)) | (
+                    (difference <= -1.0) & (positions[i - 1] - positions[i] < -1.0)
+                )
+                if not should_move.any():
+                    continue
+                direction = numpy.sign(difference)
+                parabolic = heights[i] + direction / (positions[i + 1] - positions[i - 1]) * (
+                    (positions[i] - positions[i - 1] + direction) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i])
+                    + (positions[i + 1] - positions[i] - direction) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1])
+                )
+                neighbour_heights = numpy.where(direction > 0.0, heights[i + 1], heights[i - 1])
+                neighbour_positions = numpy.where(direction > 0.0, positions[i + 1], positions[i - 1])
+                linear = heights[i] + direction * (neighbour_heights - heights[i]) / (neighbour_positions - positions[i])
+                new_heights = numpy.where((heights[i - 1] < parabolic) & (parabolic < heights[i + 1]), parabolic, linear)
+                heights[i] = numpy.where(should_move, new_heights, heights[i])
+                positions[i] = numpy.where(should_move, positions[i] + direction, positions[i])
+
+
+def run(
+    base_input: DikernelInput,
+    hydrodynamics: Iterable[HydrodynamicConditions],
+    workers: int | None = None,
+    quantiles: Iterable[float] = (0.05, 0.5, 0.95),
+    calculate_locations_parallel: bool = False,
+    calculate_time_steps_parallel: bool = False,
+    auto_parallel: bool = False,
+) -> EnsembleResult:
+    """
+    Calculates the specified input for each of the hydrodynamic scenarios using a pool of worker processes. Scenarios
+    are taken from the iterable when a worker is available, so it can be a generator that creates them on the fly.
+
+    Worker processes are spawned, scripts that call this function should therefore protect their entry
+    point with an 'if __name__ == "__main__":' block.
+
+    Args:
+        base_input (DikernelInput): The input that specifies the profile, output locations, settings and calculation period. Its hydrodynamic input is not used.
+        hydrodynamics (Iterable[HydrodynamicConditions]): The hydrodynamic scenarios.
+        workers (int | None, optional): The number of worker processes. Defaults to the number of available cores.
+        quantiles (Iterable[float], optional): The quantiles of the final damage that are reported. Defaults to (0.05, 0.5, 0.95).
+        calculate_locations_parallel (bool, optional): Passed to DiKErnel for each calculation. Defaults to False.
+        calculate_time_steps_parallel (bool, optional): Passed to DiKErnel for each calculation. Defaults to False.
+        auto_parallel (bool, optional): Whether each calculation chooses the parallelization settings itself (see Dikernel). Defaults to False.
+
+    Returns:
+        EnsembleResult: The statistics of all output locations over the scenarios.
+    """
+    workers = _batch_calculator.get_number_of_workers(workers)
+    if auto_parallel:
+        # The cost model is calibrated once, instead of by every worker.
+        _parallel_tuning.prepare()
+    result = EnsembleResult(quantiles)
+    scenarios = enumerate(hydrodynamics)
+    pending = set[Future]()
+
+    with _batch_calculator.create_worker_pool(
+        workers,
+        _initialize_worker,
+        (base_input, calculate_locations_parallel, calculate_time_steps_parallel, auto_parallel),
+    ) as executor:
+        # Only a limited number of scenarios is submitted at once, so the iterable is consumed while calculating.
+        for index, hydrodynamic_conditions in scenarios:
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                __add_results(result, done)
+            pending.add(executor.submit(_run_scenario, index, hydrodynamic_conditions))
+
+        __add_results(result, wait(pending).done)
+
+    return result
+
+
+_session = None
+_base_input: DikernelInput | None = None
+
+
+def _initialize_worker(
+    base_input: DikernelInput,
+    calculate_locations_parallel: bool,
+    calculate_time_steps_parallel: bool,
+    auto_parallel: bool = False,
+):
+    """
+    Creates the session that is used for all scenarios calculated by a worker process.
+    """
+    from pydrever.calculation._dikernel._dikernelsession import DikernelSession
+    import pydrever.calculation._dikernel._dikernelcreferences as _cs
+
+    global _session, _base_input
+    _cs.load()
+    _session = DikernelSession(
+        base_input.dike_schematization,
+        output_locations=base_input.output_locations,
+        output_revetment_zones=base_input.output_revetment_zones,
+        settings=base_input.settings,
+        requested_quantities=set(),
+    )
+    _session.calculate_locations_parallel = calculate_locations_parallel
+    _session.calculate_time_steps_parallel = calculate_time_steps_parallel
+    _session.auto_parallel = auto_parallel
+    _session.compact_output = True
+    _session.hydrodynamics_interpolation = base_input.hydrodynamics_interpolation
+    _base_input = base_input
+
+
+def _run_scenario(
+    index: int, hydrodynamic_conditions: HydrodynamicConditions
+) -> tuple[int, numpy.ndarray | None, numpy.ndarray | None, numpy.ndarray | None, list[str]]:
+    """
+    Calculates a single scenario within a worker process.
+
+    Args:
+        index (int): The index of the scenario.
+        hydrodynamic_conditions (HydrodynamicConditions): The hydrodynamic conditions of the scenario.
+
+    Returns:
+        tuple[int, numpy.ndarray | None, numpy.ndarray | None, numpy.ndarray | None, list[str]]: The index of the scenario, the x-positions,
+        final damage and failure of all output locations and the errors of the calculation.
+    """
+    try:
+        kernel = _session.run(
+            hydrodynamic_conditions,
+            start_time=_base_input.start_time,
+            stop_time=_base_input.stop_time,
+            output_time_steps=_base_input.output_time_steps,
+        )
+    except Exception as e:
+        # A single invalid scenario should not end the calculation of the complete ensemble.
+        return index, None, None, None, [str(e)]
+    if kernel.output is None:
+        return index, None, None, None, kernel.errors or ["Calculation did not produce output."]
+
+    x_positions = numpy.array([location.x_position for location in kernel.output])
+    final_damages = numpy.array([location.final_damage for location in kernel.output])
+    failed = numpy.array([location.failed for location in kernel.output])
+    return index, x_positions, final_damages, failed, []
+
+
+def __add_results(result: EnsembleResult, futures: set[Future]):
+    for future in futures:
+        index, x_positions, final_damages, failed, errors = future.result()
+        if final_damages is None:
+            result.errors[index] = errors
+        else:
+            result.add(x_positions, final_damages, failed)
@@ -18,52 +18,62 @@
  Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-import copy, numpy
+import numpy, hashlib, json, sys
 from pydrever.data import (
     DikernelInput,
     HydrodynamicConditions,
     OutputLocationSpecification,
+    InterpolationType,
 )
 import pydrever.calculation._hydrodynamicsinterpolation as interpolation
+from typing import Callable
 
 
 def get_run_input(input: DikernelInput) -> DikernelInput:
     """
     Returns manipulated input that incorporates the desired output time steps and start time of the calculation in the hydrodynamic input.
+    The returned input shares the profile, output locations, revetment zones and settings with the specified input, these should not be changed while the returned input is used.
 
     Args:
-        input (DikernelInput): The input object to copy all input from.
+        input (DikernelInput): The input object to derive the run input from.
 
     Returns:
         DikernelInput: A manipulated input object that can be used to calculate.
     """
-    time_steps = input.hydrodynamic_input.time_steps
-    run_time_steps = get_run_time_steps(input)
-    run_hydrodynamics = HydrodynamicConditions(
-        time_steps=run_time_steps,
-        water_levels=interpolation.interpolate_time_series(
-            time_steps, input.hydrodynamic_input.water_levels, run_time_steps
-        ),
-        wave_heights=interpolation.interpolate_time_series(
-            time_steps, input.hydrodynamic_input.wave_heights, run_time_steps
-        ),
-        wave_periods=interpolation.interpolate_time_series(
-            time_steps, input.hydrodynamic_input.wave_periods, run_time_steps
-        ),
-        wave_directions=interpolation.interpolate_time_series(
-            time_steps,
-            input.hydrodynamic_input.wave_directions,
-            run_time_steps,
+    hydrodynamic_input = input.hydrodynamic_input
+    run_time_steps = __get_run_time_steps_array(input)
+    # All series share the same time steps and are interpolated at once.
+    run_values = interpolation.interpolate_hydrodynamics(
+        hydrodynamic_input.time_steps,
+        numpy.array(
+            [
+                hydrodynamic_input.water_levels,
+                hydrodynamic_input.wave_heights,
+                hydrodynamic_input.wave_periods,
+                hydrodynamic_input.wave_directions,
+            ],
+            dtype=numpy.float64,
         ),
+        run_time_steps,
+        input.hydrodynamics_interpolation,
+    )
+    # The interpolated rows are passed to DiKErnel as arrays, without converting each value to a Python float.
+    # DiKErnel validates the hydrodynamic conditions of the run input, they are therefore not validated here.
+    run_hydrodynamics = HydrodynamicConditions.model_construct(
+        time_steps=run_time_steps,
+        water_levels=run_values[0],
+        wave_heights=run_values[1],
+        wave_periods=run_values[2],
+        wave_directions=run_values[3],
     )
-    run_input = DikernelInput(
+    # The specifications are not changed by a calculation, they are shared with the original input instead of copied.
+    return DikernelInput.model_construct(
         hydrodynamic_input=run_hydrodynamics,
         dike_schematization=input.dike_schematization,
+        output_locations=input.output_locations,
+        output_revetment_zones=input.output_revetment_zones,
+        settings=input.settings,
     )
-    run_input.output_locations = copy.deepcopy(input.output_locations)
-    run_input.output_revetment_zones = copy.deepcopy(input.output_revetment_zones)
-    run_input.settings = copy.deepcopy(input.settings)
-    return run_input
 
 
 def get_run_time_steps(input: DikernelInput) -> list[float]:
@@ -81,26 +91,68 @@ def get_run_time_steps(input: DikernelInput) -> list[float]:
     Returns:
         list[float]: A list with the time steps needed to run calculations.
     """
-    run_time_steps = input.hydrodynamic_input.time_steps
+    return __get_run_time_steps_array(input).tolist()
+
+
+def __get_run_time_steps_array(input: DikernelInput) -> numpy.ndarray:
+    run_time_steps = numpy.asarray(input.hydrodynamic_input.time_steps, dtype=numpy.float64)
     if input.output_time_steps is not None:
-        run_time_steps = numpy.union1d(run_time_steps, input.output_time_steps).tolist()
+        run_time_steps = numpy.union1d(run_time_steps, input.output_time_steps)
 
     if input.start_time is not None:
-        run_time_steps = list(
-            time_step
-            for time_step in numpy.union1d(run_time_steps, [input.start_time])
-            if time_step >= input.start_time
-        )
+        run_time_steps = numpy.union1d(run_time_steps, [input.start_time])
+        run_time_steps = run_time_steps[run_time_steps >= input.start_time]
 
     if input.stop_time is not None:
-        run_time_steps = list(
-            time_step
-            for time_step in numpy.union1d(run_time_steps, [input.stop_time])
-            if time_step <= input.start_time
-        )
+        run_time_steps = numpy.union1d(run_time_steps, [input.stop_time])
+        run_time_steps = run_time_steps[run_time_steps <= input.stop_time]
     return run_time_steps
 
 
+def get_input_hash(input: DikernelInput) -> str:
+    """
+    Calculates a hash of all specified input. Equal input results in an equal hash, also in different sessions.
+
+    A custom hydrodynamics interpolation function is identified by its module and qualified name. Functions that can not
+    be found by that name (lambdas, nested functions, partial functions and other callable objects) can not be
+    distinguished from each other, input with such a function can therefore not be hashed.
+
+    Args:
+        input (DikernelInput): The input to calculate the hash of.
+
+    Raises:
+        ValueError: In case the hydrodynamics interpolation function can not be identified by its module and qualified name.
+
+    Returns:
+        str: The (hexadecimal) SHA-256 hash of the input.
+    """
+    if not __is_identifiable(input.hydrodynamics_interpolation):
+        raise ValueError(
+            "The hydrodynamics interpolation function can not be identified by its module and name, "
+            "input with a lambda, nested function, partial function or other callable object can not be hashed."
+        )
+
+    # Top layer specifications and settings are specified as base types, serialize_as_any includes the fields of derived types.
+    input_content = input.model_dump(mode="json", serialize_as_any=True)
+    if input_content["requested_quantities"] is not None:
+        input_content["requested_quantities"] = sorted(input_content["requested_quantities"])
+    serialized_input = json.dumps(input_content, sort_keys=True)
+    return hashlib.sha256(serialized_input.encode("utf-8")).hexdigest()
+
+
+def __is_identifiable(hydrodynamics_interpolation: InterpolationType | Callable) -> bool:
+    if isinstance(hydrodynamics_interpolation, InterpolationType):
+        return True
+    module = sys.modules.get(getattr(hydrodynamics_interpolation, "__module__", None) or "")
+    qualified_name = getattr(hydrodynamics_interpolation, "__qualname__", None)
+    if module is None or qualified_name is None:
+        return False
+    value = module
+    for name in qualified_name.split("."):
+        value = getattr(value, name, None)
+    return value is hydrodynamics_interpolation
+
+
 def get_output_locations_from_input(
     input: DikernelInput,
 ) -> list[OutputLocationSpecification]:
@@ -18,12 +18,12 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from pydrever.calculation._dikernel._dikernelcreferences import *
+import pydrever.calculation._dikernel._dikernelcreferences as _cs
 
 
 def parse_messages(c_output):
     if c_output is None:
         return [], []
-    warnings = list(i.Message for i in c_output.Events if i.Type == EventType.Warning)
-    errors = list(i.Message for i in c_output.Events if i.Type == EventType.Error)
+    warnings = list(i.Message for i in c_output.Events if i.Type == _cs.EventType.Warning)
+    errors = list(i.Message for i in c_output.Events if i.Type == _cs.EventType.Error)
     return warnings, errors
@@ -0,0 +1,110 @@
+"""
+ Copyright (C) Stichting Deltares 2023-2024. All rights reserved.
+ 
+ This file is part of the dikernel-python toolbox.
+ 
+ This program is free software; you can redistribute it and/or modify it under the terms of
+ the GNU Lesser General Public License as published by the Free Software Foundation; either
+ version 3 of the License, or (at your option) any later version.
+ 
+ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+ without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ See the GNU Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public License along with this
+ program; if not, see <https://www.gnu.org/licenses/>.
+ 
+ All names, logos, and references to "Deltares" are registered trademarks of Stichting
+ Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.data import DikernelOutputLocation, CompactOutputLocation, TimeDependentOutputQuantity
+import numpy
+
+
+def to_array(
+    output: list[DikernelOutputLocation | CompactOutputLocation],
+    quantity: TimeDependentOutputQuantity,
+) -> numpy.ndarray:
+    """
+    Combines the values of a time dependent quantity at all output locations in a single array.
+
+    Args:
+        output (list[DikernelOutputLocation | CompactOutputLocation]): The calculation output.
+        quantity (TimeDependentOutputQuantity): The requested quantity.
+
+    Returns:
+        numpy.ndarray: A (number of locations x number of time steps) array of float64 values. Rows follow the
+        order of the output locations. Values are NaN for locations that do not have (or did not keep) this quantity.
+    """
+    number_of_time_steps = __get_number_of_time_steps(output)
+    values = numpy.full((len(output), number_of_time_steps), numpy.nan)
+    for i_location, location in enumerate(output):
+        location_values = getattr(location, quantity.value, None)
+        if location_values is not None:
+            values[i_location, :] = location_values
+
+    return values
+
+
+def to_table(
+    output: list[DikernelOutputLocation | CompactOutputLocation],
+    time_steps: list[float],
+) -> dict[str, numpy.ndarray]:
+    """
+    Converts the calculation output to a columnar table with one row per location and time step. The
+    columns x_position, z_position, time_of_failure and time hold the coordinates of each row. All
+    time dependent quantities that are available for at least one location are added as well.
+
+    The result can directly be used to create a pandas DataFrame or an Arrow table.
+
+    Args:
+        output (list[DikernelOutputLocation | CompactOutputLocation]): The calculation output.
+        time_steps (list[float]): The time steps at the end of each calculated time step.
+
+    Returns:
+        dict[str, numpy.ndarray]: The columns of the table by name. All columns have the same length.
+    """
+    number_of_time_steps = __get_number_of_time_steps(output)
+    if len(time_steps) != number_of_time_steps:
+        raise ValueError("The number of time steps does not match the number of time steps in the output.")
+
+    def repeat_per_location(values: list[float | None]) -> numpy.ndarray:
+        return numpy.repeat(numpy.array(values, dtype=numpy.float64), number_of_time_steps)
+
+    table = {
+        "x_position": repeat_per_location([location.x_position for location in output]),
+        "z_position": repeat_per_location([location.z_position for location in output]),
+        "time_of_failure": repeat_per_location([location.time_of_failure for location in output]),
+        "time": numpy.tile(numpy.asarray(time_steps, dtype=numpy.float64), len(output)),
+    }
+    for quantity in get_available_quantities(output):
+        table[quantity.value] = to_array(output, quantity).ravel()
+
+    return table
+
+
+def get_available_quantities(
+    output: list[DikernelOutputLocation | CompactOutputLocation],
+) -> list[TimeDependentOutputQuantity]:
+    """
+    Lists the time dependent quantities that are available for at least one of the output locations.
+
+    Args:
+        output (list[DikernelOutputLocation | CompactOutputLocation]): The calculation output.
+
+    Returns:
+        list[TimeDependentOutputQuantity]: The available quantities.
+    """
+    return [
+        quantity
+        for quantity in TimeDependentOutputQuantity
+        if any(getattr(location, quantity.value, None) is not None for location in output)
+    ]
+
+
+def __get_number_of_time_steps(output: list[DikernelOutputLocation | CompactOutputLocation]) -> int:
+    for location in output:
+        if location.damage_development is not None:
+            return len(location.damage_development)
+    return 0
@@ -0,0 +1,272 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+This file contains a cost model that predicts which combination of DiKErnel's parallelization settings
+(CalculateLocationsInParallel and CalculateTimeStepsInParallel) is the fastest for a calculation. The model
+is calibrated with a small benchmark on the current machine and stored in a local file. The file can be
+specified by the environment variable PYDREVER_PARALLEL_TUNING_FILE.
+"""
+
+from pydrever.data import (
+    DikernelInput,
+    DikeSchematization,
+    HydrodynamicConditions,
+    GrassWaveImpactLayerSpecification,
+    NordicStoneLayerSpecification,
+    TopLayerType,
+)
+import numpy
+import threading
+import json
+import os
+import time
+import uuid
+
+default_calibration_file = os.path.join(os.path.expanduser("~"), ".pydrever", "paralleltuning.json")
+"""The file the calibration of the cost model is stored in when no file is specified (as argument or by the environment variable PYDREVER_PARALLEL_TUNING_FILE)."""
+
+__calibration_file_environment_variable = "PYDREVER_PARALLEL_TUNING_FILE"
+__calibration_version = 1
+__settings = [(False, False), (True, False), (False, True), (True, True)]
+__calibrations = dict[str, dict]()
+__lock = threading.Lock()
+# Held during a calibration, threads that need a calibration wait for the running one instead of calibrating as well.
+__calibration_lock = threading.RLock()
+
+
+def get_parallel_settings(
+    number_of_locations: int, number_of_time_steps: int, calibration_file: str | None = None
+) -> tuple[bool, bool]:
+    """
+    Determines the fastest parallelization settings for a calculation. The cost model is calibrated
+    the first time it is needed on a machine (see calibrate), which takes a few seconds.
+
+    Args:
+        number_of_locations (int): The number of output locations of the calculation.
+        number_of_time_steps (int): The number of time steps of the calculation.
+        calibration_file (str | None, optional): The file containing the calibration. Defaults to the file specified by the environment variable PYDREVER_PARALLEL_TUNING_FILE or default_calibration_file.
+
+    Returns:
+        tuple[bool, bool]: Whether to calculate locations in parallel and whether to calculate time steps in parallel.
+    """
+    if __get_number_of_processors() == 1:
+        return False, False
+
+    calibration = __get_calibration(__get_calibration_file(calibration_file))
+    features = __get_features(number_of_locations, number_of_time_steps)
+    predicted_durations = [
+        float(numpy.dot(calibration["coefficients"][__get_key(settings)], features)) for settings in __settings
+    ]
+    # Settings are ordered from least to most parallel, in case of equal predictions the least parallel settings are used.
+    return __settings[int(numpy.argmin(predicted_durations))]
+
+
+def prepare(calibration_file: str | None = None):
+    """
+    Makes sure the cost model is calibrated and stored (see get_parallel_settings), so calculations in worker processes
+    read the calibration instead of calibrating it themselves.
+
+    Args:
+        calibration_file (str | None, optional): The file containing the calibration. Defaults to the file specified by the environment variable PYDREVER_PARALLEL_TUNING_FILE or default_calibration_file.
+    """
+    if __get_number_of_processors() > 1:
+        __get_calibration(__get_calibration_file(calibration_file))
+
+
+def calibrate(
+    calibration_file: str | None = None,
+    numbers_of_locations: tuple[int, ...] = (2, 8, 32),
+    numbers_of_time_steps: tuple[int, ...] = (50, 500),
+    repetitions: int = 2,
+) -> dict:
+    """
+    Calibrates the cost model by timing calculations of a built-in test case for all combinations of the parallelization settings.
+    For each combination the duration is fitted as a linear function of the number of locations, the number of time steps and their product.
+
+    Args:
+        calibration_file (str | None, optional): The file to store the calibration in. Defaults to the file specified by the environment variable PYDREVER_PARALLEL_TUNING_FILE or default_calibration_file.
+        numbers_of_locations (tuple[int, ...], optional): The numbers of locations of the benchmark calculations. Defaults to (2, 8, 32).
+        numbers_of_time_steps (tuple[int, ...], optional): The numbers of time steps of the benchmark calculations. Defaults to (50, 500).
+        repetitions (int, optional): The number of times each calculation is repeated (the fastest is used). Defaults to 2.
+
+    Returns:
+        dict: The calibration, containing the number of processors and the coefficients of the cost model for each combination of settings.
+    """
+    with __calibration_lock:
+        return __calibrate(__get_calibration_file(calibration_file), numbers_of_locations, numbers_of_time_steps, repetitions)
+
+
+def __calibrate(
+    calibration_file: str,
+    numbers_of_locations: tuple[int, ...],
+    numbers_of_time_steps: tuple[int, ...],
+    repetitions: int,
+) -> dict:
+    from pydrever.calculation._dikernel._dikernel import Dikernel
+
+    sizes = [
+        (number_of_locations, number_of_time_steps)
+        for number_of_locations in numbers_of_locations
+        for number_of_time_steps in numbers_of_time_steps
+    ]
+    inputs = [create_benchmark_input(number_of_locations, number_of_time_steps) for number_of_locations, number_of_time_steps in sizes]
+    features = numpy.array([__get_features(number_of_locations, number_of_time_steps) for number_of_locations, number_of_time_steps in sizes])
+
+    coefficients = dict[str, list[float]]()
+    for calculate_locations_parallel, calculate_time_steps_parallel in __settings:
+        durations = list[float]()
+        for input in inputs:
+            duration = numpy.inf
+            for _ in range(repetitions):
+                kernel = Dikernel(input)
+                kernel.compact_output = True
+                kernel.calculate_locations_parallel = calculate_locations_parallel
+                kernel.calculate_time_steps_parallel = calculate_time_steps_parallel
+                start = time.perf_counter()
+                if not kernel.run():
+                    raise RuntimeError("Calibration of the parallelization settings failed: " + "; ".join(kernel.errors))
+                duration = min(duration, time.perf_counter() - start)
+            durations.append(duration)
+        fitted_coefficients = numpy.linalg.lstsq(features, numpy.array(durations), rcond=None)[0]
+        coefficients[__get_key((calculate_locations_parallel, calculate_time_steps_parallel))] = fitted_coefficients.tolist()
+
+    calibration = {
+        "version": __calibration_version,
+        "processors": __get_number_of_processors(),
+        "coefficients": coefficients,
+    }
+    try:
+        __write_calibration(calibration_file, calibration)
+    except OSError:
+        # The calibration is still used in this session.
+        pass
+    with __lock:
+        __calibrations[calibration_file] = calibration
+    return calibration
+
+
+def __get_calibration_file(calibration_file: str | None) -> str:
+    return calibration_file or os.environ.get(__calibration_file_environment_variable) or default_calibration_file
+
+
+def __get_calibration(calibration_file: str) -> dict:
+    calibration = __get_stored_calibration(calibration_file)
+    if calibration is not None:
+        return calibration
+
+    with __calibration_lock:
+        # Another thread may have finished a calibration while this thread was waiting.
+        calibration = __get_stored_calibration(calibration_file)
+        if calibration is None:
+            calibration = calibrate(calibration_file)
+    return calibration
+
+
+def __get_stored_calibration(calibration_file: str) -> dict | None:
+    with __lock:
+        calibration = __calibrations.get(calibration_file)
+        if calibration is None:
+            calibration = __read_calibration(calibration_file)
+            if calibration is not None:
+                __calibrations[calibration_file] = calibration
+    return calibration
+
+
+def __read_calibration(calibration_file: str) -> dict | None:
+    try:
+        with open(calibration_file, "r") as file:
+            calibration = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    # A calibration of another machine (or an older version of the model) is not used.
+    if calibration.get("version") != __calibration_version or calibration.get("processors") != __get_number_of_processors():
+        return None
+    return calibration
+
+
+def __write_calibration(calibration_file: str, calibration: dict):
+    directory = os.path.dirname(calibration_file)
+    if directory != "":
+        os.makedirs(directory, exist_ok=True)
+    temporary_file_name = f"{calibration_file}.{uuid.uuid4().hex}.tmp"
+    with open(temporary_file_name, "w") as file:
+        json.dump(calibration, file, indent=2)
+    os.replace(temporary_file_name, calibration_file)
+
+
+def __get_features(number_of_locations: int, number_of_time_steps: int) -> list[float]:
+    return [1.0, float(number_of_locations), float(number_of_time_steps), float(number_of_locations * number_of_time_steps)]
+
+
+def __get_key(settings: tuple[bool, bool]) -> str:
+    return f"locations_{settings[0]}_time_steps_{settings[1]}".lower()
+
+
+def __get_number_of_processors() -> int:
+    return os.cpu_count() or 1
+
+
+def create_benchmark_input(number_of_locations: int, number_of_time_steps: int, seed: int | None = None) -> DikernelInput:
+    """
+    Creates input with random hydrodynamic conditions and alternating natural stone and grass wave impact
+    locations, as used to benchmark calculations.
+
+    Args:
+        number_of_locations (int): The number of output locations.
+        number_of_time_steps (int): The number of time steps.
+        seed (int | None, optional): Seed of the random hydrodynamic conditions. Defaults to a seed derived from the size of the input.
+
+    Returns:
+        DikernelInput: The benchmark input.
+    """
+    random = numpy.random.default_rng(number_of_locations * number_of_time_steps if seed is None else seed)
+    input = DikernelInput(
+        hydrodynamic_input=HydrodynamicConditions(
+            time_steps=(3600.0 * numpy.arange(number_of_time_steps + 1)).tolist(),
+            water_levels=random.uniform(0.5, 2.5, number_of_time_steps).tolist(),
+            wave_heights=random.uniform(0.2, 1.0, number_of_time_steps).tolist(),
+            wave_periods=random.uniform(3.0, 6.0, number_of_time_steps).tolist(),
+            wave_directions=random.uniform(60.0, 120.0, number_of_time_steps).tolist(),
+        ),
+        dike_schematization=DikeSchematization(
+            dike_orientation=90.0,
+            x_positions=[0.0, 25.0, 35.0, 41.0, 45, 50, 60, 70],
+            z_positions=[-3, 0.0, 1.5, 1.7, 3.0, 3.1, 0, -1],
+            roughnesses=[1, 1, 0.75, 0.5, 0.8, 0.8, 0.8],
+            x_outer_toe=25.0,
+            x_outer_crest=45.0,
+            foreshore_slope=0.05,
+            z_bottom=-4,
+        ),
+    )
+    for i_location in range(number_of_locations):
+        if i_location % 2 == 0:
+            input.add_output_location(
+                x_location=26.0 + 8.0 * i_location / number_of_locations,
+                top_layer_specification=NordicStoneLayerSpecification(top_layer_thickness=0.4, relative_density=2.45),
+            )
+        else:
+            input.add_output_location(
+                x_location=41.5 + 3.0 * i_location / number_of_locations,
+                top_layer_specification=GrassWaveImpactLayerSpecification(top_layer_type=TopLayerType.GrassClosedSod),
+            )
+    return input
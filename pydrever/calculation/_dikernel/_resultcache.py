@@ -0,0 +1,253 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+This file contains an on-disk cache for calculation results. The result of each output location is stored by a
+key that is derived from the input it was calculated with. Locations are calculated independently, so only
+locations that were not calculated before with equal profile, hydrodynamics and settings need to be calculated.
+"""
+
+from pydrever.data import DikernelInput, DikernelOutputLocation, CompactOutputLocation
+import pydrever.calculation._dikernel._inputservices as _input_services
+import pydrever.calculation._dikernel._dikernelcreferences as _cs
+from pydantic import BaseModel
+from functools import cache
+import hashlib
+import pickle
+import json
+import os
+import uuid
+
+
+class ResultCache:
+    """
+    On-disk cache of calculation results. The result of each output location is stored as a separate file in the specified directory.
+    In case the total size of the stored results exceeds the maximum size, the least recently used results
+    are removed.
+
+    Multiple processes can use the same cache directory.
+    """
+
+    def __init__(self, directory: str, max_size: int = 1024**3):
+        """
+        Creates a cache that stores results in the specified directory.
+
+        Args:
+            directory (str): The directory to store results in. It is created in case it does not exist.
+            max_size (int, optional): The maximum total size of the stored results in bytes. Defaults to 1 GB.
+        """
+        if max_size < 0:
+            raise ValueError("The maximum size of the cache should not be negative.")
+
+        self.directory: str = directory
+        """The directory containing the cached results."""
+        self.max_size: int = max_size
+        """The maximum total size of the stored results in bytes."""
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: str) -> tuple[DikernelOutputLocation | CompactOutputLocation, list[str]] | None:
+        """
+        Returns the cached result for a key.
+
+        Args:
+            key (str): The key of the result (see get_location_keys).
+
+        Returns:
+            tuple[DikernelOutputLocation | CompactOutputLocation, list[str]] | None: The output of the location and the
+            warnings of the calculation it was part of. None in case there is no (readable) result for this key.
+        """
+        file_name = self.__get_file_name(key)
+        try:
+            with open(file_name, "rb") as file:
+                output_location, warnings = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Incomplete or outdated entries are removed, the result needs to be calculated again.
+            self.__remove(file_name)
+            return None
+
+        # Marks the result as recently used.
+        try:
+            os.utime(file_name)
+        except OSError:
+            pass
+        return output_location, warnings
+
+    def set(
+        self,
+        key: str,
+        output_location: DikernelOutputLocation | CompactOutputLocation,
+        warnings: list[str],
+    ):
+        """
+        Stores a result in the cache and removes the least recently used results in case the cache exceeds its maximum size.
+
+        Args:
+            key (str): The key of the result (see get_location_keys).
+            output_location (DikernelOutputLocation | CompactOutputLocation): The output of the location.
+            warnings (list[str]): The warnings of the calculation.
+        """
+        self.set_many([(key, output_location, warnings)])
+
+    def set_many(self, results: list[tuple[str, DikernelOutputLocation | CompactOutputLocation, list[str]]]):
+        """
+        Stores multiple results in the cache. The least recently used results are removed once after all results are
+        stored, in case the cache exceeds its maximum size.
+
+        Args:
+            results (list[tuple[str, DikernelOutputLocation | CompactOutputLocation, list[str]]]): The key, output of the
+            location and warnings of the calculation for each result (see set).
+        """
+        for key, output_location, warnings in results:
+            file_name = self.__get_file_name(key)
+            # Results are written to a temporary file first, so other processes never read an incomplete result.
+            temporary_file_name = f"{file_name}.{uuid.uuid4().hex}.tmp"
+            with open(temporary_file_name, "wb") as file:
+                pickle.dump((output_location, list(warnings)), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_file_name, file_name)
+
+        if len(results) > 0:
+            self.__evict()
+
+    def clear(self):
+        """
+        Removes all results from the cache.
+        """
+        for file_name in self.__get_entries():
+            self.__remove(file_name)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns:
+            int: The total size of the stored results in bytes.
+        """
+        return sum(self.__get_size(file_name) for file_name in self.__get_entries())
+
+    def __get_file_name(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pkl")
+
+    def __get_entries(self) -> list[str]:
+        return [
+            os.path.join(self.directory, file_name)
+            for file_name in os.listdir(self.directory)
+            if file_name.endswith(".pkl")
+        ]
+
+    def __evict(self):
+        entries = list[tuple[float, int, str]]()
+        for file_name in self.__get_entries():
+            try:
+                status = os.stat(file_name)
+            except OSError:
+                continue
+            entries.append((status.st_mtime, status.st_size, file_name))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, file_name in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self.__remove(file_name)
+            total_size -= size
+
+    @staticmethod
+    def __get_size(file_name: str) -> int:
+        try:
+            return os.path.getsize(file_name)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def __remove(file_name: str):
+        try:
+            os.remove(file_name)
+        except OSError:
+            pass
+
+
+def get_location_keys(input: DikernelInput, compact_output: bool) -> list[str]:
+    """
+    Creates the cache keys of all output locations of a calculation. A key is based on the specification of the
+    location, the profile, hydrodynamics and settings as they are passed to DiKErnel, the requested quantities,
+    the type of output and the binaries that are used to calculate.
+
+    Args:
+        input (DikernelInput): The input of the calculation.
+        compact_output (bool): Whether the calculation produces compact output locations.
+
+    Returns:
+        list[str]: The keys of the output locations, in the order of get_output_locations_from_input.
+    """
+    run_input = _input_services.get_run_input(input)
+    shared_content = {
+        "version": __cache_version,
+        "kernel": get_kernel_hash(),
+        "hydrodynamic_input": __dump(run_input.hydrodynamic_input),
+        "dike_schematization": __dump(run_input.dike_schematization),
+        "settings": [__dump(settings) for settings in run_input.settings] if run_input.settings is not None else None,
+        "requested_quantities": (
+            sorted(quantity.value for quantity in input.requested_quantities)
+            if input.requested_quantities is not None
+            else None
+        ),
+        "compact_output": compact_output,
+    }
+    shared_hash = hashlib.sha256(json.dumps(shared_content, sort_keys=True).encode("utf-8")).hexdigest()
+
+    return [
+        hashlib.sha256(
+            json.dumps({"shared": shared_hash, "location": __dump(location)}, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        for location in _input_services.get_output_locations_from_input(run_input)
+    ]
+
+
+def __dump(model: BaseModel) -> dict:
+    # See get_input_hash for the use of serialize_as_any.
+    return model.model_dump(mode="json", serialize_as_any=True)
+
+
+__cache_version = 1
+__binary_extensions = {".dll", ".so", ".dylib"}
+
+
+def get_kernel_hash() -> str:
+    """
+    Returns:
+        str: The (hexadecimal) SHA-256 hash of all binaries that are loaded to calculate.
+    """
+    return __get_kernel_hash(_cs.dll_base_path)
+
+
+@cache
+def __get_kernel_hash(dll_directory: str) -> str:
+    """
+    Calculates a hash of all binaries that are loaded to calculate (the DiKErnel assemblies, their dependencies,
+    the helper assembly and the native overtopping libraries), so cached results are not used with another build of any of these.
+    """
+    kernel_hash = hashlib.sha256()
+    for file_name in sorted(os.listdir(dll_directory)):
+        if os.path.splitext(file_name)[1].lower() not in __binary_extensions:
+            continue
+        kernel_hash.update(file_name.encode("utf-8"))
+        with open(os.path.join(dll_directory, file_name), "rb") as file:
+            kernel_hash.update(file.read())
+    return kernel_hash.hexdigest()
@@ -0,0 +1,140 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+This file contains the selection and configuration of the .NET runtime that is used to run DiKErnel. The
+runtime is configured just before it is loaded (see _dikernelcreferences.load).
+"""
+
+import os
+import sys
+
+default_runtime_config = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_dikerneldll", "runtimeconfig.json")
+"""The runtime configuration that is shipped with pydrever (used for coreclr)."""
+
+__runtimes = ["coreclr", "netfx", "mono"]
+__runtime_environment_variable = "PYDREVER_DOTNET_RUNTIME"
+__configuration: tuple[str, str | None, dict[str, str]] | None = None
+
+
+def configure_runtime(
+    runtime: str = "coreclr",
+    runtime_config: str | None = None,
+    tiered_compilation: bool | None = None,
+    quick_jit_for_loops: bool | None = None,
+    server_garbage_collection: bool | None = None,
+    concurrent_garbage_collection: bool | None = None,
+):
+    """
+    Configures the .NET runtime that is used to run DiKErnel. This needs to be done before the first calculation
+    (or call to warmup), the runtime can not be changed once it is loaded.
+
+    Without configuration, the runtime specified by the environment variable PYDREVER_DOTNET_RUNTIME is used. In
+    case this variable is not specified either, pythonnet selects the runtime (see PYTHONNET_RUNTIME), except on
+    systems other than Windows, where coreclr is used.
+
+    Options that are not specified are left to the runtime (for coreclr they can also be set by DOTNET_
+    environment variables, for example DOTNET_gcServer=1).
+
+    Args:
+        runtime (str, optional): The runtime: "coreclr", "netfx" (Windows only) or "mono". Defaults to "coreclr".
+        runtime_config (str | None, optional): Path to a runtimeconfig.json (coreclr only). Defaults to the shipped configuration.
+        tiered_compilation (bool | None, optional): Whether to use tiered compilation (coreclr only). Defaults to None.
+        quick_jit_for_loops (bool | None, optional): Whether methods with loops start with quick (non-optimized) JIT compilation (coreclr only). Defaults to None.
+        server_garbage_collection (bool | None, optional): Whether to use server garbage collection (coreclr only). Defaults to None.
+        concurrent_garbage_collection (bool | None, optional): Whether to use concurrent garbage collection (coreclr only). Defaults to None.
+
+    Raises:
+        RuntimeError: Raised in case the runtime has already been loaded.
+        ValueError: Raised in case of an unknown runtime or options that are not supported by the runtime.
+    """
+    global __configuration
+
+    if is_runtime_loaded():
+        raise RuntimeError("The .NET runtime has already been loaded, configure the runtime before the first calculation.")
+    if runtime not in __runtimes:
+        raise ValueError(f"Unknown runtime '{runtime}', choose one of {', '.join(__runtimes)}.")
+
+    properties = {
+        name: "true" if value else "false"
+        for name, value in (
+            ("System.Runtime.TieredCompilation", tiered_compilation),
+            ("System.Runtime.TieredCompilation.QuickJitForLoops", quick_jit_for_loops),
+            ("System.GC.Server", server_garbage_collection),
+            ("System.GC.Concurrent", concurrent_garbage_collection),
+        )
+        if value is not None
+    }
+    if runtime != "coreclr" and (runtime_config is not None or len(properties) > 0):
+        raise ValueError("A runtime configuration and runtime options can only be specified for coreclr.")
+
+    __configuration = (runtime, runtime_config, properties)
+
+
+def is_runtime_loaded() -> bool:
+    """
+    Returns:
+        bool: Whether the .NET runtime has already been loaded in this process.
+    """
+    return "clr" in sys.modules
+
+
+def apply_configuration():
+    """
+    Passes the configured runtime to pythonnet. This should be called just before the runtime is loaded.
+    """
+    if is_runtime_loaded():
+        return
+
+    configuration = __get_configuration()
+    if configuration is None:
+        return
+
+    import pythonnet
+
+    runtime, runtime_config, properties = configuration
+    if runtime == "coreclr":
+        import clr_loader
+
+        pythonnet.set_runtime(
+            clr_loader.get_coreclr(
+                runtime_config=runtime_config if runtime_config is not None else default_runtime_config,
+                properties=properties if len(properties) > 0 else None,
+            )
+        )
+    else:
+        pythonnet.set_runtime(runtime)
+
+
+def __get_configuration() -> tuple[str, str | None, dict[str, str]] | None:
+    if __configuration is not None:
+        return __configuration
+
+    runtime = os.environ.get(__runtime_environment_variable)
+    if runtime is not None:
+        if runtime not in __runtimes:
+            raise ValueError(f"Unknown runtime '{runtime}' specified by {__runtime_environment_variable}.")
+        return runtime, None, {}
+
+    if "PYTHONNET_RUNTIME" in os.environ or sys.platform == "win32":
+        return None
+
+    # Mono is usually not available on other systems than Windows, the shipped configuration for coreclr is used instead.
+    return "coreclr", None, {}
@@ -18,18 +18,33 @@
  Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
+import numpy as numpy
 
-def is_continuously_increasing(lst: list[float]) -> bool:
+
+def is_continuously_increasing(lst: list[float] | numpy.ndarray) -> bool:
     """
     Function to check whether a list has continuously increasing numbers.
 
     Args:
-        lst (list[float]): The list that needs to increase continuously
+        lst (list[float] | numpy.ndarray): The list that needs to increase continuously
 
     Returns:
         bool: False of one or more of the numbers is decreasing
     """
-    return all(i < j for i, j in zip(lst, lst[1:]))
+    return bool((numpy.diff(numpy.asarray(lst, dtype=numpy.float64)) > 0.0).all())
+
+
+def contains_only_finite_numbers(values: list[float] | numpy.ndarray) -> bool:
+    """
+    Function to check whether a list only contains finite numbers.
+
+    Args:
+        values (list[float] | numpy.ndarray): The list that needs to be checked
+
+    Returns:
+        bool: False in case one or more of the numbers is NaN or infinite
+    """
+    return bool(numpy.isfinite(numpy.asarray(values, dtype=numpy.float64)).all())
 
 
 def is_valid_orientation(orientation: float) -> bool:
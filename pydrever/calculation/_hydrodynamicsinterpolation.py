@@ -18,6 +18,10 @@
  Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
+from pydrever.data import InterpolationType
+from typing import Callable
+import numpy
+
 
 def interpolate_time_series(
     time_steps: list[float], values: list[float], target_time_steps: list[float]
@@ -33,17 +37,100 @@ def interpolate_time_series(
     Returns:
         list[float]: A list of values for the combined list of time steps and target_time_steps.
     """
-    iargs = 1
-    itarget = 1
-    target_values = list[float]()
-    while itarget < len(target_time_steps):
-        if (
-            target_time_steps[itarget] > time_steps[iargs]
-            and iargs < len(time_steps) - 1
-        ):
-            iargs = iargs + 1
-            continue
-        target_values.append(values[iargs - 1])
-        itarget = itarget + 1
-
-    return target_values
+    return interpolate_time_series_block(time_steps, numpy.asarray(values)[numpy.newaxis, :], target_time_steps)[0].tolist()
+
+
+def interpolate_time_series_block(
+    time_steps: numpy.ndarray | list[float],
+    values: numpy.ndarray,
+    target_time_steps: numpy.ndarray | list[float],
+    interpolation: InterpolationType = InterpolationType.Previous,
+) -> numpy.ndarray:
+    """
+    Interpolates multiple time series that share the same time steps at once. Values apply to a complete time step,
+    the value of each target time step is determined by the type of interpolation:
+
+    * Previous - The value of the original time step the target time step falls in (piecewise constant).
+    * Linear - Linear interpolation between the centers of the original time steps, constant beyond the first and last center.
+    * Nearest - The value of the original time step with the center nearest to the center of the target time step.
+
+    Args:
+        time_steps (numpy.ndarray | list[float]): Original (increasing) time steps of the time series.
+        values (numpy.ndarray): A (number of series x number of time steps - 1) array with the value of each series during each time step.
+        target_time_steps (numpy.ndarray | list[float]): Desired (increasing) time steps.
+        interpolation (InterpolationType, optional): The type of interpolation. Defaults to InterpolationType.Previous.
+
+    Returns:
+        numpy.ndarray: A (number of series x number of target time steps - 1) array with the value of each series during each target time step.
+    """
+    time_steps = numpy.asarray(time_steps, dtype=numpy.float64)
+    target_time_steps = numpy.asarray(target_time_steps, dtype=numpy.float64)
+    values = numpy.asarray(values)
+    if len(target_time_steps) < 2:
+        return numpy.empty((values.shape[0], 0), dtype=values.dtype)
+
+    match interpolation:
+        case InterpolationType.Previous:
+            # Each target time step takes the value of the first original time step that ends at or after the end of the target time step.
+            indices = numpy.searchsorted(time_steps, target_time_steps[1:], side="left")
+            numpy.clip(indices, 1, len(time_steps) - 1, out=indices)
+            return values[:, indices - 1]
+        case InterpolationType.Linear:
+            centers, target_centers = __get_centers(time_steps), __get_centers(target_time_steps)
+            if len(centers) == 1:
+                return numpy.repeat(values, len(target_centers), axis=1)
+            indices = numpy.searchsorted(centers, target_centers, side="right") - 1
+            numpy.clip(indices, 0, len(centers) - 2, out=indices)
+            weights = numpy.clip((target_centers - centers[indices]) / (centers[indices + 1] - centers[indices]), 0.0, 1.0)
+            return values[:, indices] * (1.0 - weights) + values[:, indices + 1] * weights
+        case InterpolationType.Nearest:
+            centers, target_centers = __get_centers(time_steps), __get_centers(target_time_steps)
+            if len(centers) == 1:
+                return numpy.repeat(values, len(target_centers), axis=1)
+            indices = numpy.searchsorted(centers, target_centers, side="left")
+            numpy.clip(indices, 1, len(centers) - 1, out=indices)
+            # In case of equal distances the earlier time step is used.
+            use_previous = (target_centers - centers[indices - 1]) <= (centers[indices] - target_centers)
+            return values[:, numpy.where(use_previous, indices - 1, indices)]
+        case _:
+            raise ValueError(f"Unknown type of interpolation: {interpolation}")
+
+
+def interpolate_hydrodynamics(
+    time_steps: numpy.ndarray | list[float],
+    values: numpy.ndarray,
+    target_time_steps: numpy.ndarray | list[float],
+    interpolation: InterpolationType | Callable[[numpy.ndarray, numpy.ndarray, numpy.ndarray], numpy.ndarray] = InterpolationType.Previous,
+) -> numpy.ndarray:
+    """
+    Interpolates the water levels, wave heights, wave periods and wave directions in a single pass. Wave
+    directions are interpolated as angles (in degrees): an interpolation between 350 and 10 degrees passes 0 degrees.
+
+    Args:
+        time_steps (numpy.ndarray | list[float]): Original (increasing) time steps of the hydrodynamic conditions.
+        values (numpy.ndarray): A (4 x number of time steps - 1) array with the water levels, wave heights, wave periods and wave directions.
+        target_time_steps (numpy.ndarray | list[float]): Desired (increasing) time steps.
+        interpolation (InterpolationType | Callable, optional): The type of interpolation or a function with the signature of
+        interpolate_time_series_block (without interpolation argument). Defaults to InterpolationType.Previous.
+
+    Returns:
+        numpy.ndarray: A (4 x number of target time steps - 1) array with the interpolated water levels, wave heights, wave periods and wave directions.
+    """
+    values = numpy.asarray(values, dtype=numpy.float64)
+    if interpolation in (InterpolationType.Previous, InterpolationType.Nearest):
+        # These interpolations select existing values, directions do not need a special treatment.
+        return interpolate_time_series_block(time_steps, values, target_time_steps, interpolation)
+
+    directions = numpy.radians(values[3])
+    block = numpy.vstack([values[:3], numpy.cos(directions), numpy.sin(directions)])
+    if isinstance(interpolation, InterpolationType):
+        interpolated_block = interpolate_time_series_block(time_steps, block, target_time_steps, interpolation)
+    else:
+        interpolated_block = numpy.asarray(interpolation(numpy.asarray(time_steps, dtype=numpy.float64), block, numpy.asarray(target_time_steps, dtype=numpy.float64)))
+
+    interpolated_directions = numpy.mod(numpy.degrees(numpy.arctan2(interpolated_block[4], interpolated_block[3])), 360.0)
+    return numpy.vstack([interpolated_block[:3], interpolated_directions])
+
+
+def __get_centers(time_steps: numpy.ndarray) -> numpy.ndarray:
+    return 0.5 * (time_steps[:-1] + time_steps[1:])
@@ -22,6 +22,7 @@ from ._toplayertypes import TopLayerType
 from ._grassovertoppingcalculationtypes import GrassOvertoppingCalculationType
 from ._grasswaverunupcalculationtypes import GrassWaveRunupCalculationType
 from ._quantities import TimeDependentOutputQuantity
+from ._interpolationtypes import InterpolationType
 
 from ._dikernelcalculationsettings import (
     AsphaltCalculationSettings,
@@ -47,6 +48,13 @@ from ._dikerneloutput import (
     GrassWaveImpactOutputLocation,
     NaturalStoneOutputLocation,
 )
+from ._dikernelcompactoutput import (
+    CompactOutputLocation,
+    CompactAsphaltWaveImpactOutputLocation,
+    CompactGrassCumulativeOverloadOutputLocation,
+    CompactGrassWaveImpactOutputLocation,
+    CompactNaturalStoneOutputLocation,
+)
 from ._dikerneloutputspecification import (
     OutputLocationSpecification,
     TopLayerSpecification,
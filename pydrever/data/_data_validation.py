@@ -20,6 +20,8 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 
 from typing import cast
 
+import numpy as numpy
+
 
 def validate_one_of_two_should_be_specified(values: dict, first_parameter_name: str, second_parameter_name: str):
     """
@@ -104,5 +106,53 @@ def validate_hydrodynamics_length(values: dict):
     return values
 
 
+def validate_hydrodynamic_arrays(
+    time_steps: numpy.ndarray,
+    water_levels: numpy.ndarray,
+    wave_heights: numpy.ndarray,
+    wave_periods: numpy.ndarray,
+    wave_directions: numpy.ndarray,
+):
+    """
+    This method validates the shape and values of the arrays of a HydrodynamicConditions object
+    with vectorized checks, without visiting the individual values in Python.
+
+    Args:
+        time_steps (numpy.ndarray): The time steps.
+        water_levels (numpy.ndarray): The water levels.
+        wave_heights (numpy.ndarray): The wave heights.
+        wave_periods (numpy.ndarray): The wave periods.
+        wave_directions (numpy.ndarray): The wave directions.
+
+    Raises:
+        Exception: In case one of the arrays is not one-dimensional, in case the lengths of the series
+        are not exactly 1 less than the length of the time steps, in case the time steps are not
+        continuously increasing or in case one of the arrays contains values that are not finite.
+    """
+    series = {
+        "time_steps": time_steps,
+        "water_levels": water_levels,
+        "wave_heights": wave_heights,
+        "wave_periods": wave_periods,
+        "wave_directions": wave_directions,
+    }
+    for name, values in series.items():
+        if values.ndim != 1:
+            raise Exception("The specified {0} should be a one-dimensional array.".format(name))
+
+    nr_time_steps = len(time_steps)
+    if any(nr_time_steps - 1 != len(values) for values in (water_levels, wave_heights, wave_periods, wave_directions)):
+        raise Exception(
+            "Length of the specified series for waterlevels, wave heights, wave periods and wave angles needs to be exactly 1 less than the length of the specified time steps."
+        )
+
+    for name, values in series.items():
+        if not numpy.isfinite(values).all():
+            raise Exception("The specified {0} contain values that are not finite.".format(name))
+
+    if not (numpy.diff(time_steps) > 0.0).all():
+        raise Exception("The specified time steps should be continuously increasing.")
+
+
 def __get_value(values: dict, name: str) -> list[float] | None:
     return cast(list[float], values[name]) if name in values else None
@@ -0,0 +1,157 @@
+"""
+Copyright (C) Stichting Deltares 2023-2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from typing import Any, ClassVar
+import numpy
+
+
+class CompactOutputLocation:
+    """
+    Compact alternative for DikernelOutputLocation. Instances have no attribute dictionary and no validation
+    is performed, all time series are stored as NumPy arrays (float64) in which empty values are represented
+    by NaN. Public attribute names are equal to the ones of the corresponding DikernelOutputLocation.
+
+    Instances are immutable.
+    """
+
+    __slots__ = (
+        "x_position",
+        "z_position",
+        "time_of_failure",
+        "damage_development",
+        "damage_increment",
+    )
+
+    field_names: ClassVar[tuple[str, ...]] = __slots__
+    """Names of all fields of this type of output location, including the fields of base classes."""
+
+    x_position: float
+    """The cross-shore position of the calculated location."""
+    z_position: float
+    """The height of the calculated location."""
+    time_of_failure: float | None
+    """The moment (time step) this location failed. None if it did not fail."""
+    damage_development: numpy.ndarray
+    """The damage level at the end of each time step."""
+    damage_increment: numpy.ndarray
+    """The increment of the damage level during each time step."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.field_names = cls.field_names + tuple(cls.__dict__.get("__slots__", ()))
+
+    def __init__(self, **values: Any):
+        """
+        Creates a new output location. Fields that are not specified are None.
+
+        Args:
+            values: The values of the fields of this output location.
+        """
+        unknown_fields = values.keys() - set(self.field_names)
+        if len(unknown_fields) > 0:
+            raise TypeError(f"{type(self).__name__} has no field(s) {', '.join(sorted(unknown_fields))}")
+        for field_name in self.field_names:
+            object.__setattr__(self, field_name, values.get(field_name))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {field_name: getattr(self, field_name) for field_name in self.field_names}
+
+    def __setstate__(self, state: dict[str, Any]):
+        for field_name in self.field_names:
+            object.__setattr__(self, field_name, state.get(field_name))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(x_position={self.x_position}, z_position={self.z_position}, time_of_failure={self.time_of_failure})"
+
+    @property
+    def failed(self) -> bool:
+        """
+        Returns:
+            bool: Whether the revetment has failed at this position.
+        """
+        return self.time_of_failure is not None
+
+    @property
+    def final_damage(self) -> float:
+        return self.damage_development[-1] if self.damage_development is not None else 0.0
+
+
+class CompactAsphaltWaveImpactOutputLocation(CompactOutputLocation):
+    __slots__ = (
+        "outer_slope",
+        "log_flexural_strength",
+        "stiffness_relation",
+        "computational_thickness",
+        "equivalent_elastic_modulus",
+        "maximum_peak_stress",
+        "average_number_of_waves",
+    )
+
+
+class CompactGrassCumulativeOverloadOutputLocation(CompactOutputLocation):
+    __slots__ = (
+        "representative_wave_runup_2p",
+        "cumulative_overload",
+        "average_number_of_waves",
+        "vertical_distance_water_level_elevation",
+    )
+
+
+class CompactGrassWaveImpactOutputLocation(CompactOutputLocation):
+    __slots__ = (
+        "minimum_wave_height",
+        "maximum_wave_height",
+        "loading_revetment",
+        "upper_limit_loading",
+        "lower_limit_loading",
+        "wave_angle",
+        "wave_angle_impact",
+        "wave_height_impact",
+    )
+
+
+class CompactNaturalStoneOutputLocation(CompactOutputLocation):
+    __slots__ = (
+        "resistance",
+        "outer_slope",
+        "slope_upper_level",
+        "slope_upper_position",
+        "slope_lower_level",
+        "slope_lower_position",
+        "loading_revetment",
+        "surf_similarity_parameter",
+        "wave_steepness_deep_water",
+        "upper_limit_loading",
+        "lower_limit_loading",
+        "depth_maximum_wave_load",
+        "distance_maximum_wave_elevation",
+        "normative_width_of_wave_impact",
+        "hydrodynamic_load",
+        "wave_angle",
+        "wave_angle_impact",
+        "reference_time_degradation",
+        "reference_degradation",
+    )
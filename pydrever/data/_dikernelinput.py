@@ -19,9 +19,19 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 from __future__ import annotations
-from pydantic import BaseModel, ConfigDict, root_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PlainValidator,
+    TypeAdapter,
+    WithJsonSchema,
+    root_validator,
+    field_serializer,
+)
+from typing import Annotated, Any, Callable
 
 import numpy as numpy
+import numpy.typing
 from pydrever.data._dikerneloutputspecification import (
     OutputLocationSpecification,
     TopLayerSpecification,
@@ -31,22 +41,45 @@ from pydrever.data._dikernelrevetmentzonespecification import (
     RevetmentZoneSpecification,
 )
 from pydrever.data._dikernelcalculationsettings import CalculationSettings
+from pydrever.data._quantities import TimeDependentOutputQuantity
+from pydrever.data._interpolationtypes import InterpolationType
 from pydrever.data import _data_validation as data_validation
 
 
+def __validate_series(values: Any) -> list[float] | numpy.ndarray:
+    if isinstance(values, numpy.ndarray):
+        return numpy.ascontiguousarray(values, dtype=numpy.float64)
+    return __float_list_adapter.validate_python(values)
+
+
+__float_list_adapter = TypeAdapter(list[float])
+
+Series = Annotated[
+    list[float] | numpy.ndarray,
+    PlainValidator(__validate_series),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+"""Series of float values, either a list or a float64 array. Lists are validated as list[float]."""
+
+
 class HydrodynamicConditions(BaseModel):
+    """
+    Hydrodynamic conditions for each time step of a calculation. Series are either lists or float64 arrays (see from_arrays),
+    conditions with equal values are equal regardless of the type of the series.
+    """
+
     model_config = ConfigDict(validate_assignment=True)
 
-    time_steps: list[float]
+    time_steps: Series
     """list of timesteps."""
     # TODO: Check whether all time steps are increasing? Or does the dikernel give this error?
-    water_levels: list[float]
+    water_levels: Series
     """list of waterlevels"""
-    wave_heights: list[float]
+    wave_heights: Series
     """list of significant wave heights (Hs)"""
-    wave_periods: list[float]
+    wave_periods: Series
     """list of wave periods"""
-    wave_directions: list[float]
+    wave_directions: Series
     """list of wave directions"""
     # TODO: Maybe automatically correct the wave directions? But not here.. only validate the directions in this class.
 
@@ -55,6 +88,60 @@ class HydrodynamicConditions(BaseModel):
         data_validation.validate_hydrodynamics_length(values=values)
         return values
 
+    # A field serializer (instead of a serializer of the Series type) is also used when serializing with serialize_as_any.
+    @field_serializer("time_steps", "water_levels", "wave_heights", "wave_periods", "wave_directions")
+    def serialize_series(self, values: list[float] | numpy.ndarray) -> list[float]:
+        if isinstance(values, numpy.ndarray):
+            return values.tolist()
+        return values
+
+    def __eq__(self, other: Any) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(numpy.array_equal(getattr(self, field_name), getattr(other, field_name)) for field_name in type(self).model_fields)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        time_steps: numpy.typing.ArrayLike,
+        water_levels: numpy.typing.ArrayLike,
+        wave_heights: numpy.typing.ArrayLike,
+        wave_periods: numpy.typing.ArrayLike,
+        wave_directions: numpy.typing.ArrayLike,
+    ) -> HydrodynamicConditions:
+        """
+        Creates hydrodynamic conditions that are backed by float64 arrays. The series are validated with
+        vectorized checks instead of converting each value to a Python float. Arrays that are already
+        contiguous float64 arrays are not copied and are passed to DiKErnel as a whole, they should therefore
+        not be changed while the hydrodynamic conditions are used.
+
+        Args:
+            time_steps (ArrayLike): The time steps, these should be continuously increasing.
+            water_levels (ArrayLike): The water levels.
+            wave_heights (ArrayLike): The significant wave heights (Hs).
+            wave_periods (ArrayLike): The wave periods.
+            wave_directions (ArrayLike): The wave directions.
+
+        Raises:
+            Exception: In case the shapes of the series do not match, the time steps are not continuously
+            increasing or one of the series contains values that are not finite.
+
+        Returns:
+            HydrodynamicConditions: Hydrodynamic conditions that contain the arrays.
+        """
+        series = [
+            numpy.ascontiguousarray(values, dtype=numpy.float64)
+            for values in (time_steps, water_levels, wave_heights, wave_periods, wave_directions)
+        ]
+        data_validation.validate_hydrodynamic_arrays(*series)
+        return cls.model_construct(
+            time_steps=series[0],
+            water_levels=series[1],
+            wave_heights=series[2],
+            wave_periods=series[3],
+            wave_directions=series[4],
+        )
+
 
 class DikernelInput(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
@@ -73,9 +160,19 @@ class DikernelInput(BaseModel):
     """Optional start time of the calculation - instance variable."""
     stop_time: float | None = None
     """Optional stop time of the calculation - instance variable."""
+    requested_quantities: set[TimeDependentOutputQuantity] | None = None
+    """Optional set of time dependent quantities that need to be part of the output. The damage development and time of failure are always included, other quantities are None. By default all quantities are available - instance variable."""
     output_time_steps: list[float] | None = None
     """Optional list of desired output time steps. This will add output times to the calculation - instance variable."""
     # Results are not filtered based on this list (cumulative values such as the damage increment in the results would not make sense anymore).
+    hydrodynamics_interpolation: InterpolationType | Callable[[numpy.ndarray, numpy.ndarray, numpy.ndarray], numpy.ndarray] = InterpolationType.Previous
+    """The interpolation of the hydrodynamic conditions for time steps that are added to the calculation (output time steps, start and stop time). Either a type of interpolation or a function with the signature of pydrever.calculation.hydrodynamicsinterpolator.interpolate_time_series_block. Wave directions are interpolated as angles. A function is identified by its module and qualified name, input with a lambda, nested function or partial function can not be used for checkpoints and stored results - instance variable."""
+
+    @field_serializer("hydrodynamics_interpolation")
+    def serialize_hydrodynamics_interpolation(self, interpolation: InterpolationType | Callable) -> str:
+        if isinstance(interpolation, InterpolationType):
+            return interpolation.value
+        return f"{interpolation.__module__}.{getattr(interpolation, '__qualname__', type(interpolation).__qualname__)}"
 
     def add_output_location(self, x_location: float, top_layer_specification: TopLayerSpecification):
         """
@@ -18,23 +18,135 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from pydantic import BaseModel, ConfigDict
+from __future__ import annotations
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    PlainSerializer,
+    PlainValidator,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    WithJsonSchema,
+    model_serializer,
+)
+from typing import Annotated, Any, Callable
+import numpy
+
+
+def __validate_time_series(values: Any, adapter: TypeAdapter) -> numpy.ndarray:
+    if isinstance(values, numpy.ndarray):
+        return numpy.asarray(values, dtype=numpy.float64)
+    return numpy.array([numpy.nan if value is None else value for value in adapter.validate_python(values)], dtype=numpy.float64)
+
+
+def __serialize_time_series(values: numpy.ndarray | None) -> list[float | None] | None:
+    if values is None:
+        return None
+    return [None if numpy.isnan(value) else value for value in numpy.asarray(values, dtype=numpy.float64).tolist()]
+
+
+__float_list_adapter = TypeAdapter(list[float])
+__optional_float_list_adapter = TypeAdapter(list[float | None])
+__time_series_schema = {"type": "array", "items": {"type": "number"}}
+
+TimeSeries = Annotated[
+    numpy.ndarray,
+    PlainValidator(lambda values: __validate_time_series(values, __float_list_adapter)),
+    PlainSerializer(__serialize_time_series, return_type=list[float | None] | None),
+    WithJsonSchema(__time_series_schema),
+]
+"""Time series of float64 values. Lists are validated as list[float], empty values are serialized as None."""
+
+OptionalTimeSeries = Annotated[
+    numpy.ndarray,
+    PlainValidator(lambda values: __validate_time_series(values, __optional_float_list_adapter)),
+    PlainSerializer(__serialize_time_series, return_type=list[float | None] | None),
+    WithJsonSchema({**__time_series_schema, "items": {"anyOf": [{"type": "number"}, {"type": "null"}]}}),
+]
+"""Time series of float64 values that may contain empty values. Lists are validated as list[float | None], None is stored as NaN."""
 
 
 class DikernelOutputLocation(BaseModel):
+    """
+    Base class for the calculation results at a single output location. Output produced by
+    Dikernel is not validated again and holds its time series as NumPy arrays (float64),
+    in which empty values are represented by NaN.
+
+    Time series of output produced by Dikernel are only converted when they are accessed for
+    the first time. The converted values are kept, so each series is converted at most once.
+    Serializing, copying, comparing, pickling or printing a location converts all remaining series.
+    """
+
     model_config = ConfigDict(frozen=True)
 
+    _quantity_loader: Callable[[str], Any] | None = PrivateAttr(default=None)
+    """Optional function that provides the values of a field that was not specified on creation."""
+
     x_position: float
     """The cross-shore position of the calculated location."""
     z_position: float
     """The height of the calculated location."""
     time_of_failure: float | None
     """The moment (time step) this location failed. None if it did not fail."""
-    damage_development: list[float]
+    damage_development: TimeSeries
     """The damage level at the end of each time step."""
-    damage_increment: list[float]
+    damage_increment: TimeSeries
     """The increment of the damage level during each time step."""
 
+    def __getattr__(self, name: str) -> Any:
+        if name in type(self).model_fields:
+            private_attributes = self.__pydantic_private__
+            loader = private_attributes.get("_quantity_loader") if private_attributes is not None else None
+            if loader is not None:
+                value = loader(name)
+                self.__dict__[name] = value
+                return value
+        return super().__getattr__(name)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # The loader refers to the C# output and can not be pickled, all values are loaded instead.
+        self.__load_quantities()
+        state = super().__getstate__()
+        if state["__pydantic_private__"] is not None:
+            state["__pydantic_private__"] = {**state["__pydantic_private__"], "_quantity_loader": None}
+        return state
+
+    def __copy__(self) -> DikernelOutputLocation:
+        self.__load_quantities()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> DikernelOutputLocation:
+        # The loader refers to the C# output and can not be copied, the copy contains all values and no loader instead.
+        self.__load_quantities()
+        memo = {} if memo is None else memo
+        loader = self.__pydantic_private__.get("_quantity_loader") if self.__pydantic_private__ is not None else None
+        if loader is not None:
+            memo[id(loader)] = None
+        return super().__deepcopy__(memo)
+
+    def __repr_args__(self):
+        self.__load_quantities()
+        return super().__repr_args__()
+
+    @model_serializer(mode="wrap")
+    def serialize_location(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        self.__load_quantities()
+        return handler(self)
+
+    def __load_quantities(self):
+        """
+        Loads all time series that were not accessed yet.
+        """
+        for field_name in type(self).model_fields.keys() - self.__dict__.keys():
+            getattr(self, field_name)
+
+    def __eq__(self, other: Any) -> bool:
+        # Time series are arrays, these are equal when all values are equal (empty values included).
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(_are_equal_values(getattr(self, field_name), getattr(other, field_name)) for field_name in type(self).model_fields)
+
     @property
     def failed(self) -> bool:
         """
@@ -48,51 +160,57 @@ class DikernelOutputLocation(BaseModel):
         return self.damage_development[-1] if self.damage_development is not None else 0.0
 
 
+def _are_equal_values(value: Any, other_value: Any) -> bool:
+    if isinstance(value, numpy.ndarray) or isinstance(other_value, numpy.ndarray):
+        return numpy.array_equal(value, other_value, equal_nan=True)
+    return value == other_value
+
+
 class AsphaltWaveImpactOutputLocation(DikernelOutputLocation):
     outer_slope: float
     log_flexural_strength: float
     stiffness_relation: float
     computational_thickness: float
     equivalent_elastic_modulus: float
-    maximum_peak_stress: list[float]
-    average_number_of_waves: list[float]
+    maximum_peak_stress: TimeSeries
+    average_number_of_waves: TimeSeries
 
 
 class GrassCumulativeOverloadOutputLocation(DikernelOutputLocation):
-    representative_wave_runup_2p: list[float | None]
-    cumulative_overload: list[float | None]
-    average_number_of_waves: list[float | None]
-    vertical_distance_water_level_elevation: list[float]
+    representative_wave_runup_2p: OptionalTimeSeries
+    cumulative_overload: OptionalTimeSeries
+    average_number_of_waves: OptionalTimeSeries
+    vertical_distance_water_level_elevation: TimeSeries
 
 
 class GrassWaveImpactOutputLocation(DikernelOutputLocation):
     minimum_wave_height: float
     maximum_wave_height: float
-    loading_revetment: list[float]
-    upper_limit_loading: list[float]
-    lower_limit_loading: list[float]
-    wave_angle: list[float | None]
-    wave_angle_impact: list[float | None]
-    wave_height_impact: list[float | None]
+    loading_revetment: TimeSeries
+    upper_limit_loading: TimeSeries
+    lower_limit_loading: TimeSeries
+    wave_angle: OptionalTimeSeries
+    wave_angle_impact: OptionalTimeSeries
+    wave_height_impact: OptionalTimeSeries
 
 
 class NaturalStoneOutputLocation(DikernelOutputLocation):
     resistance: float
-    outer_slope: list[float]
-    slope_upper_level: list[float]
-    slope_upper_position: list[float]
-    slope_lower_level: list[float]
-    slope_lower_position: list[float]
-    loading_revetment: list[float]
-    surf_similarity_parameter: list[float]
-    wave_steepness_deep_water: list[float]
-    upper_limit_loading: list[float]
-    lower_limit_loading: list[float]
-    depth_maximum_wave_load: list[float]
-    distance_maximum_wave_elevation: list[float]
-    normative_width_of_wave_impact: list[float]
-    hydrodynamic_load: list[float | None]
-    wave_angle: list[float | None]
-    wave_angle_impact: list[float | None]
-    reference_time_degradation: list[float | None]
-    reference_degradation: list[float | None]
+    outer_slope: TimeSeries
+    slope_upper_level: TimeSeries
+    slope_upper_position: TimeSeries
+    slope_lower_level: TimeSeries
+    slope_lower_position: TimeSeries
+    loading_revetment: TimeSeries
+    surf_similarity_parameter: TimeSeries
+    wave_steepness_deep_water: TimeSeries
+    upper_limit_loading: TimeSeries
+    lower_limit_loading: TimeSeries
+    depth_maximum_wave_load: TimeSeries
+    distance_maximum_wave_elevation: TimeSeries
+    normative_width_of_wave_impact: TimeSeries
+    hydrodynamic_load: OptionalTimeSeries
+    wave_angle: OptionalTimeSeries
+    wave_angle_impact: OptionalTimeSeries
+    reference_time_degradation: OptionalTimeSeries
+    reference_degradation: OptionalTimeSeries
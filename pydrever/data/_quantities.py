@@ -42,7 +42,7 @@ class TimeDependentOutputQuantity(Enum):
     WaveAngleImpact = (
         "wave_angle_impact"  # GrassWaveImpact, NaturalStone, GrassWaveRunup
     )
-    WaveHeightImpact = "wave_height_impactt"  # GrassWaveImpact
+    WaveHeightImpact = "wave_height_impact"  # GrassWaveImpact
     OuterSlope = "outer_slope"  # NaturalStone
     SlopeUpperLevel = "slope_upper_level"  # NaturalStone
     SlopeUpperPosition = "slope_upper_position"  # NaturalStone
@@ -19,3 +19,4 @@
 """
 
 import pydrever.io._prflreader as prflreader
+import pydrever.io._resultstore as resultstore
@@ -0,0 +1,280 @@
+"""
+ Copyright (C) Stichting Deltares 2024. All rights reserved.
+ 
+ This file is part of the dikernel-python toolbox.
+ 
+ This program is free software; you can redistribute it and/or modify it under the terms of
+ the GNU Lesser General Public License as published by the Free Software Foundation; either
+ version 3 of the License, or (at your option) any later version.
+ 
+ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+ without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ See the GNU Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public License along with this
+ program; if not, see <https://www.gnu.org/licenses/>.
+ 
+ All names, logos, and references to "Deltares" are registered trademarks of Stichting
+ Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+"""
+This file contains functions to store calculation output on disk and to read it back. Each time dependent
+quantity is stored in a separate NPY file as a (number of locations x number of time steps) array. Reading
+maps these files into memory, so only the values that are actually used (for example a single location or
+time step) are read from disk.
+"""
+
+from pydrever.data import (
+    DikernelInput,
+    DikernelOutputLocation,
+    CompactOutputLocation,
+    CompactAsphaltWaveImpactOutputLocation,
+    CompactGrassCumulativeOverloadOutputLocation,
+    CompactGrassWaveImpactOutputLocation,
+    CompactNaturalStoneOutputLocation,
+    TimeDependentOutputQuantity,
+)
+import pydrever.calculation._dikernel._inputservices as _input_services
+import pydrever.calculation._dikernel._outputservices as _output_services
+import pydrever.calculation._dikernel._resultcache as _result_cache
+from enum import Enum
+import numpy
+import json
+import os
+
+
+class ResultStoreExceptionType(Enum):
+    """
+    This enum provides the type of error raised by the result store in case a result could not be read.
+    """
+
+    DirectoryNotFound = "Directory could not be found."
+    NoMetadata = "No metadata was found in the directory."
+    WrongVersion = "The version should be 1."
+    QuantityNotStored = "The requested quantity is not part of the stored results."
+
+
+class ResultStoreException(Exception):
+    """
+    Custom exception used by the result store in case a result could not be read. The ResultStoreExceptionType (type)
+    provides information on what went wrong.
+
+    Args:
+        type (ResultStoreExceptionType): The type of exception that occurred.
+    """
+
+    def __init__(self, type: ResultStoreExceptionType):
+        self.type = type
+        super().__init__(str(self.type.value))
+
+
+__version = 1
+__metadata_file_name = "metadata.json"
+
+_compact_output_types: dict[str, type] = {
+    "AsphaltWaveImpactOutputLocation": CompactAsphaltWaveImpactOutputLocation,
+    "GrassCumulativeOverloadOutputLocation": CompactGrassCumulativeOverloadOutputLocation,
+    "GrassWaveImpactOutputLocation": CompactGrassWaveImpactOutputLocation,
+    "NaturalStoneOutputLocation": CompactNaturalStoneOutputLocation,
+}
+
+
+class StoredResult:
+    """
+    Calculation output that was stored on disk. Time dependent values are read from disk when they are used.
+    """
+
+    def __init__(self, directory: str, metadata: dict):
+        self.directory: str = directory
+        """The directory containing the stored result."""
+        self.input_hash: str | None = metadata["input_hash"]
+        """The hash of the input that was used to calculate this result (if specified)."""
+        self.kernel_hash: str | None = metadata.get("kernel_hash")
+        """The hash of the binaries that were used to calculate this result (if the input was specified)."""
+        self.quantities: list[TimeDependentOutputQuantity] = [
+            TimeDependentOutputQuantity(quantity) for quantity in metadata["quantities"]
+        ]
+        """The time dependent quantities that are part of the stored result."""
+        self.x_positions: numpy.ndarray = self.__load("x_position")
+        """The cross-shore positions of all output locations."""
+        self.z_positions: numpy.ndarray = self.__load("z_position")
+        """The heights of all output locations."""
+        self.times_of_failure: numpy.ndarray = self.__load("time_of_failure")
+        """The moment each output location failed (NaN if it did not fail)."""
+        self.time_steps: numpy.ndarray = self.__load("time")
+        """The end times of the calculated time steps."""
+        self.__location_types: list[str] = metadata["location_types"]
+        self.__location_values: list[dict] = metadata["location_values"]
+
+    @property
+    def number_of_locations(self) -> int:
+        return len(self.x_positions)
+
+    def is_result_of(self, input: DikernelInput) -> bool:
+        """
+        Args:
+            input (DikernelInput): The input to compare with.
+
+        Returns:
+            bool: Whether this result was written together with (input equal to) the specified input and calculated with the
+            currently loaded binaries.
+        """
+        return (
+            self.input_hash is not None
+            and self.kernel_hash == _result_cache.get_kernel_hash()
+            and self.input_hash == _get_input_hash(input)
+        )
+
+    def get_values(self, quantity: TimeDependentOutputQuantity) -> numpy.ndarray:
+        """
+        Returns the (memory mapped) values of a quantity. Rows refer to output locations, columns to time steps.
+        Slicing the result (e.g. [i_location, :] or [:, i_time]) only reads the required values from disk.
+
+        Args:
+            quantity (TimeDependentOutputQuantity): The requested quantity.
+
+        Raises:
+            ResultStoreException: Raised in case the quantity is not part of the stored result.
+
+        Returns:
+            numpy.ndarray: A read-only (number of locations x number of time steps) array.
+        """
+        if quantity not in self.quantities:
+            raise ResultStoreException(ResultStoreExceptionType.QuantityNotStored)
+        return self.__load(quantity.value)
+
+    def get_location(self, index: int) -> CompactOutputLocation:
+        """
+        Creates the output of a single output location. Time series refer to the values on disk.
+
+        Args:
+            index (int): The index of the output location (output locations are stored in the order of the output).
+
+        Returns:
+            CompactOutputLocation: The output of the location.
+        """
+        output_type = _compact_output_types[self.__location_types[index]]
+        time_of_failure = self.times_of_failure[index]
+        values = {
+            "x_position": float(self.x_positions[index]),
+            "z_position": float(self.z_positions[index]),
+            "time_of_failure": None if numpy.isnan(time_of_failure) else float(time_of_failure),
+            **self.__location_values[index],
+        }
+        for quantity in self.quantities:
+            if quantity.value in output_type.field_names:
+                values[quantity.value] = self.__load(quantity.value)[index]
+
+        return output_type(**values)
+
+    def get_output(self) -> list[CompactOutputLocation]:
+        """
+        Returns:
+            list[CompactOutputLocation]: The output of all stored locations.
+        """
+        return [self.get_location(index) for index in range(self.number_of_locations)]
+
+    def __load(self, name: str) -> numpy.ndarray:
+        return numpy.load(os.path.join(self.directory, name + ".npy"), mmap_mode="r")
+
+
+def write(
+    directory: str,
+    output: list[DikernelOutputLocation | CompactOutputLocation],
+    time_steps: list[float],
+    input: DikernelInput | None = None,
+):
+    """
+    Writes calculation output to a directory. Existing results in this directory are overwritten.
+
+    Args:
+        directory (str): The directory to write to. This directory is created in case it does not exist.
+        output (list[DikernelOutputLocation | CompactOutputLocation]): The calculation output.
+        time_steps (list[float]): The end times of the calculated time steps.
+        input (DikernelInput | None, optional): The input that was used to calculate the output. Only a hash of
+        the input is stored, see StoredResult.is_result_of. No hash is stored in case the input can not be hashed
+        (see get_input_hash). Defaults to None.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    quantities = _output_services.get_available_quantities(output)
+    for quantity in quantities:
+        __save(directory, quantity.value, _output_services.to_array(output, quantity))
+
+    __save(directory, "x_position", [location.x_position for location in output])
+    __save(directory, "z_position", [location.z_position for location in output])
+    __save(directory, "time_of_failure", [location.time_of_failure for location in output])
+    __save(directory, "time", time_steps)
+
+    metadata = {
+        "version": __version,
+        "input_hash": _get_input_hash(input) if input is not None else None,
+        "kernel_hash": _result_cache.get_kernel_hash() if input is not None else None,
+        "quantities": [quantity.value for quantity in quantities],
+        "location_types": [type(location).__name__.removeprefix("Compact") for location in output],
+        "location_values": [__get_location_values(location) for location in output],
+    }
+    with open(os.path.join(directory, __metadata_file_name), "w") as file:
+        json.dump(metadata, file)
+
+
+def read(directory: str) -> StoredResult:
+    """
+    Opens results that were written with the write function of this module.
+
+    Args:
+        directory (str): The directory containing the results.
+
+    Raises:
+        ResultStoreException: Raised in case the directory does not contain (supported) results.
+
+    Returns:
+        StoredResult: The stored result.
+    """
+    if not os.path.isdir(directory):
+        raise ResultStoreException(ResultStoreExceptionType.DirectoryNotFound)
+
+    metadata_file = os.path.join(directory, __metadata_file_name)
+    if not os.path.isfile(metadata_file):
+        raise ResultStoreException(ResultStoreExceptionType.NoMetadata)
+
+    with open(metadata_file) as file:
+        metadata = json.load(file)
+
+    if metadata.get("version") != __version:
+        raise ResultStoreException(ResultStoreExceptionType.WrongVersion)
+
+    return StoredResult(directory, metadata)
+
+
+def __save(directory: str, name: str, values):
+    numpy.save(os.path.join(directory, name + ".npy"), numpy.asarray(values, dtype=numpy.float64))
+
+
+def __get_location_values(location: DikernelOutputLocation | CompactOutputLocation) -> dict:
+    """
+    Collects the values of a location that do not depend on time (other than the position and time of failure).
+    """
+    time_dependent_fields = set(quantity.value for quantity in TimeDependentOutputQuantity)
+    field_names = (
+        type(location).field_names if isinstance(location, CompactOutputLocation) else type(location).model_fields
+    )
+    return {
+        field_name: __to_float(getattr(location, field_name))
+        for field_name in field_names
+        if field_name not in time_dependent_fields
+        and field_name not in ("x_position", "z_position", "time_of_failure")
+    }
+
+
+def __to_float(value) -> float | None:
+    return float(value) if value is not None else None
+
+
+def _get_input_hash(input: DikernelInput) -> str | None:
+    try:
+        return _input_services.get_input_hash(input)
+    except ValueError:
+        # Input with a hydrodynamics interpolation function that can not be identified is never recognized as input of a stored result.
+        return None
@@ -21,8 +21,9 @@
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as numpy
-from pydrever.data import DikernelInput, DikernelOutputLocation
+from pydrever.data import DikernelInput, DikernelOutputLocation, TimeDependentOutputQuantity
 from pydrever.calculation._dikernel._inputservices import get_run_input
+from pydrever.calculation._dikernel._outputservices import to_array
 
 
 def animate_damage_development(
@@ -32,11 +33,14 @@ def animate_damage_development(
 
     run_input = get_run_input(input)
     x_positions = [l.x_position for l in output]
-    damage_development = [[0.0] * len(x_positions)]
     t_output = run_input.hydrodynamic_input.time_steps
-    for i_time, time in enumerate(t_output[1:]):
-        damage_development.append([l.damage_development[i_time] for l in output])
-    max_damage = max(max(damage_development))
+    damage_development = numpy.vstack(
+        (
+            numpy.zeros(len(x_positions)),
+            to_array(output, TimeDependentOutputQuantity.DamageDevelopment).T,
+        )
+    )
+    max_damage = numpy.nanmax(damage_development)
 
     fig = plt.figure()
     fig.suptitle("Tijd = %0.0f [sec]" % (0.0))
@@ -79,13 +83,13 @@ def animate_damage_development(
     ax3.set(ylabel="Water level [m]", xlabel="Time step [s]")
     ax3.plot(
         run_input.hydrodynamic_input.time_steps,
-        [None] + run_input.hydrodynamic_input.water_levels,
+        numpy.concatenate(([None], run_input.hydrodynamic_input.water_levels), axis=None),
         linestyle="dotted",
     )
     scat = ax3.scatter(
         run_input.hydrodynamic_input.time_steps,
-        [None] + run_input.hydrodynamic_input.water_levels,
-        c=[None] + run_input.hydrodynamic_input.wave_heights,
+        numpy.concatenate(([None], run_input.hydrodynamic_input.water_levels), axis=None),
+        c=numpy.concatenate(([None], run_input.hydrodynamic_input.wave_heights), axis=None),
         s=10,
         cmap=mpl.colormaps["winter"],
         marker="o",
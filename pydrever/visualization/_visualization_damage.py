@@ -27,9 +27,14 @@ from pydrever.data import (
     GrassCumulativeOverloadOutputLocation,
     GrassWaveImpactOutputLocation,
     NaturalStoneOutputLocation,
+    CompactAsphaltWaveImpactOutputLocation,
+    CompactGrassCumulativeOverloadOutputLocation,
+    CompactGrassWaveImpactOutputLocation,
+    CompactNaturalStoneOutputLocation,
     TimeDependentOutputQuantity,
 )
 import pydrever.calculation._dikernel._inputservices as _input_services
+import pydrever.calculation._dikernel._outputservices as _output_services
 
 
 def plot_hydrodynamic_conditions(input: DikernelInput):
@@ -154,15 +159,13 @@ def plot_damage_levels(
         run_times = _input_services.get_run_time_steps(input)
         x_positions = [loc.x_position for loc in output]
 
-        values = [[None for x in range(len(run_times) - 1)] for y in range(len(output))]
-        for i_loc, location in enumerate(output):
-            values[i_loc] = getattr(location, TimeDependentOutputQuantity.DamageDevelopment.value)
+        values = _output_services.to_array(output, TimeDependentOutputQuantity.DamageDevelopment)
 
         colors = plt.cm.winter(numpy.linspace(0, 1, len(run_times) - 1))
-        for i in range(len(values[0])):
+        for i in range(values.shape[1]):
             ax1.plot(
                 x_positions,
-                [row[i] for row in values],
+                values[:, i],
                 color=colors[i],
                 linestyle="-",
                 marker="o",
@@ -239,18 +242,18 @@ def plot_development_per_location(
 
     color = "black"
     match location:
-        case AsphaltWaveImpactOutputLocation():
+        case AsphaltWaveImpactOutputLocation() | CompactAsphaltWaveImpactOutputLocation():
             color = "gray"
-        case GrassCumulativeOverloadOutputLocation():
+        case GrassCumulativeOverloadOutputLocation() | CompactGrassCumulativeOverloadOutputLocation():
             color = "darkgreen"
-        case GrassWaveImpactOutputLocation():
+        case GrassWaveImpactOutputLocation() | CompactGrassWaveImpactOutputLocation():
             color = "darkgreen"
-        case NaturalStoneOutputLocation():
+        case NaturalStoneOutputLocation() | CompactNaturalStoneOutputLocation():
             color = "black"
 
     ax = plt.subplot(111)
     ax.grid()
-    ax.plot(run_times, [None] + values, color=color)
+    ax.plot(run_times, numpy.concatenate(([None], values), axis=None), color=color)
     ax.set(ylabel=quantity.name, xlabel="Time step [s]")
     fig.suptitle(
         quantity.name + " in time [x = " + str(location.x_position) + " m]",
@@ -283,16 +286,14 @@ def plot_development(
     run_times = _input_services.get_run_time_steps(input)
     x_positions = [loc.x_position for loc in locations]
 
-    values = [[None for x in range(len(run_times) - 1)] for y in range(len(locations))]
-    for i_loc, location in enumerate(locations):
-        values[i_loc] = getattr(location, quantity.value)
+    values = _output_services.to_array(locations, quantity)
 
     colors = plt.cm.winter(numpy.linspace(0, 1, len(run_times) - 1))
 
     ax = plt.subplot(111)
     ax.grid()
-    for i in range(len(values[0])):
-        ax.plot(x_positions, [row[i] for row in values], color=colors[i])
+    for i in range(values.shape[1]):
+        ax.plot(x_positions, values[:, i], color=colors[i])
 
     ax.set(ylabel=quantity.name, xlabel="Cross-shore position [m]")
 
@@ -0,0 +1,52 @@
+"""
+Copyright (C) Stichting Deltares 2023-2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import pydrever.calculation._dikernel._arrayhelper as _array_helper
+import numpy as numpy
+
+
+def test_to_c_array_copies_values():
+    values = numpy.linspace(0.0, 1.0, 11)
+
+    c_array = _array_helper.to_c_array(values)
+
+    assert c_array.Length == 11
+    assert list(c_array) == values.tolist()
+
+
+def test_to_c_array_converts_list():
+    c_array = _array_helper.to_c_array([1, 2.5, 3])
+
+    assert list(c_array) == [1.0, 2.5, 3.0]
+
+
+def test_to_c_array_handles_empty_series():
+    c_array = _array_helper.to_c_array([])
+
+    assert c_array.Length == 0
+
+
+def test_to_numpy_copies_values():
+    values = numpy.linspace(0.0, 1.0, 11)
+
+    result = _array_helper.to_numpy(_array_helper.to_c_array(values))
+
+    assert result.dtype == numpy.float64
+    numpy.testing.assert_array_equal(result, values)
@@ -0,0 +1,86 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.calculation import Dikernel, AsyncDikernelPool
+import asyncio
+import pytest
+
+
+def test_cancelled_calculation_reports_error(create_input, create_constant_hydrodynamic_conditions):
+    kernel = Dikernel(create_input(create_constant_hydrodynamic_conditions(10)))
+    kernel.cancel()
+
+    assert not kernel.run()
+    assert kernel.output is None
+    assert "The calculation was cancelled." in kernel.errors
+
+
+def test_run_async_equals_run(create_input, create_constant_hydrodynamic_conditions):
+    kernel = Dikernel(create_input(create_constant_hydrodynamic_conditions(10)))
+    assert kernel.run()
+
+    async_kernel = Dikernel(create_input(create_constant_hydrodynamic_conditions(10)))
+    assert asyncio.run(async_kernel.run_async())
+
+    assert list(async_kernel.output[0].damage_development) == list(kernel.output[0].damage_development)
+
+
+def test_run_async_cancels_calculation_after_timeout(create_input, create_constant_hydrodynamic_conditions):
+    kernel = Dikernel(create_input(create_constant_hydrodynamic_conditions(500000)))
+
+    async def run():
+        with pytest.raises(TimeoutError):
+            await kernel.run_async(timeout=0.01)
+
+    asyncio.run(run())
+
+    assert kernel.output is None
+    assert "The calculation was cancelled." in kernel.errors
+
+
+def test_pool_raises_builtin_timeout_error(create_input, create_constant_hydrodynamic_conditions):
+    async def run():
+        async with AsyncDikernelPool(workers=1) as pool:
+            with pytest.raises(TimeoutError) as exception_info:
+                await pool.run(create_input(create_constant_hydrodynamic_conditions(500000)), timeout=0.01)
+        return exception_info
+
+    exception_info = asyncio.run(run())
+
+    assert exception_info.type is TimeoutError
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_pool_runs_concurrent_calculations(use_processes: bool, create_input, create_constant_hydrodynamic_conditions):
+    wave_heights = [0.5, 1.0, 1.5]
+
+    async def run() -> list[Dikernel]:
+        async with AsyncDikernelPool(workers=2, use_processes=use_processes) as pool:
+            inputs = [create_input(create_constant_hydrodynamic_conditions(10, wave_height=wave_height)) for wave_height in wave_heights]
+            return await asyncio.gather(*(pool.run(input) for input in inputs))
+
+    kernels = asyncio.run(run())
+
+    assert len(kernels) == 3
+    for kernel, wave_height in zip(kernels, wave_heights):
+        assert kernel.input.hydrodynamic_input.wave_heights[0] == wave_height
+        expected_kernel = Dikernel(create_input(create_constant_hydrodynamic_conditions(10, wave_height=wave_height)))
+        assert expected_kernel.run()
+        assert list(kernel.output[0].damage_development) == list(expected_kernel.output[0].damage_development)
@@ -0,0 +1,47 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.calculation import Dikernel
+
+
+def test_run_many_returns_results_in_order(create_input, create_hydrodynamic_conditions):
+    water_levels = [1.5, 2.0, 2.5]
+    inputs = [create_input(create_hydrodynamic_conditions(water_levels=[water_level] * 5)) for water_level in water_levels]
+
+    kernels = Dikernel.run_many(inputs, workers=2)
+
+    assert len(kernels) == 3
+    for kernel, input, water_level in zip(kernels, inputs, water_levels):
+        assert kernel.input is input
+        assert kernel.output is not None
+        assert len(kernel.output) == 1
+        assert kernel.output[0].upper_limit_loading[0] == water_level
+
+
+def test_run_many_returns_errors_per_input(create_input):
+    invalid_input = create_input()
+    invalid_input.output_locations = None
+
+    kernels = Dikernel.run_many([create_input(), invalid_input], workers=2)
+
+    assert kernels[0].output is not None
+    assert len(kernels[0].errors) == 0
+    assert kernels[1].output is None
+    assert "At least one outputlocation needs to be specified." in kernels[1].errors
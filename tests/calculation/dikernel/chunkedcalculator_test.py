@@ -0,0 +1,118 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.calculation import Dikernel
+import pydrever.calculation._dikernel._chunkedcalculator as _chunked_calculator
+import pydrever.data as data
+import numpy
+import pytest
+
+
+@pytest.fixture
+def create_input(create_input, natural_stone_and_grass_locations):
+    def create(wave_height: float) -> data.DikernelInput:
+        number_of_steps = 12
+        hydrodynamic_conditions = data.HydrodynamicConditions(
+            time_steps=numpy.linspace(0.0, 36000.0, number_of_steps + 1).tolist(),
+            water_levels=numpy.linspace(1.0, 2.5, number_of_steps).tolist(),
+            wave_heights=[wave_height] * number_of_steps,
+            wave_periods=[4.0] * number_of_steps,
+            wave_directions=numpy.linspace(60.0, 100.0, number_of_steps).tolist(),
+        )
+        return create_input(hydrodynamic_conditions, natural_stone_and_grass_locations)
+
+    return create
+
+
+def test_chunk_hydrodynamics_equal_run_input(create_input):
+    input = create_input(0.5)
+    input.output_time_steps = [4500.0, 20000.0]
+    run_time_steps = [0.0, 3000.0, 4500.0, 6000.0, 9000.0, 12000.0]
+
+    hydrodynamics = _chunked_calculator.get_chunk_hydrodynamics(input.hydrodynamic_input, run_time_steps[2:5])
+
+    assert hydrodynamics.time_steps == [4500.0, 6000.0, 9000.0]
+    assert hydrodynamics.water_levels == input.hydrodynamic_input.water_levels[1:3]
+    assert hydrodynamics.wave_directions == input.hydrodynamic_input.wave_directions[1:3]
+
+
+def test_chunks_continue_damage(create_input):
+    input = create_input(0.5)
+    kernel = Dikernel(input)
+    assert kernel.run()
+
+    chunks = list(kernel.run_chunked(5))
+
+    assert [len(chunk.input.hydrodynamic_input.time_steps) for chunk in chunks] == [6, 6, 3]
+    for i_location, location in enumerate(kernel.output):
+        assert not location.failed
+        damage_development = numpy.concatenate([chunk.output[i_location].damage_development for chunk in chunks])
+        numpy.testing.assert_allclose(damage_development, location.damage_development, rtol=1e-10)
+
+
+def test_failed_locations_are_not_part_of_next_chunks(create_input):
+    input = create_input(1.5)
+    kernel = Dikernel(input)
+    assert kernel.run()
+    assert kernel.output[1].failed and not kernel.output[0].failed
+
+    chunks = list(kernel.run_chunked(3))
+
+    assert len(chunks) == 4
+    assert [len(chunk.output) for chunk in chunks] == [2, 2, 2, 1]
+    assert chunks[2].output[1].time_of_failure == pytest.approx(kernel.output[1].time_of_failure)
+    assert chunks[3].output[0].x_position == 30.0
+
+
+def test_invalid_chunk_size(create_input):
+    with pytest.raises(ValueError):
+        next(Dikernel(create_input(0.5)).run_chunked(0))
+
+
+def test_resume_from_checkpoint(tmp_path, create_input):
+    checkpoint_file = str(tmp_path / "checkpoint.json")
+    input = create_input(1.5)
+    kernel = Dikernel(input)
+    assert kernel.run()
+
+    interrupted_chunks = list[Dikernel]()
+    for chunk in Dikernel(input).run_chunked(3, checkpoint_file):
+        interrupted_chunks.append(chunk)
+        if len(interrupted_chunks) == 2:
+            break
+    resumed_chunks = list(Dikernel(input).run_chunked(3, checkpoint_file))
+
+    # The checkpoint of a chunk is written when the next chunk is requested, the second chunk is therefore calculated again.
+    assert len(resumed_chunks) == 3
+    assert resumed_chunks[0].input.hydrodynamic_input.time_steps[0] == 9000.0
+    chunks = interrupted_chunks[:1] + resumed_chunks
+    damage_development = numpy.concatenate([chunk.output[0].damage_development for chunk in chunks])
+    numpy.testing.assert_allclose(damage_development, kernel.output[0].damage_development, rtol=1e-10)
+    assert list(Dikernel(input).run_chunked(3, checkpoint_file)) == []
+
+
+def test_checkpoint_of_other_input_is_ignored(tmp_path, create_input):
+    checkpoint_file = str(tmp_path / "checkpoint.json")
+    list(Dikernel(create_input(0.5)).run_chunked(5, checkpoint_file))
+
+    chunks = list(Dikernel(create_input(0.6)).run_chunked(5, checkpoint_file))
+
+    assert len(chunks) == 3
+    assert chunks[0].input.hydrodynamic_input.time_steps[0] == 0.0
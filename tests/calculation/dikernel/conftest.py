@@ -0,0 +1,129 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from typing import Callable
+import pydrever.data as data
+import pytest
+
+
+def create_dike_schematization() -> data.DikeSchematization:
+    return data.DikeSchematization(
+        dike_orientation=90.0,
+        x_positions=[0.0, 25.0, 35.0, 41.0, 45, 50, 60, 70],
+        z_positions=[-3, 0.0, 1.5, 1.7, 3.0, 3.1, 0, -1],
+        roughnesses=[1, 1, 0.75, 0.5, 0.8, 0.8, 0.8],
+        x_outer_toe=25.0,
+        x_outer_crest=45.0,
+        foreshore_slope=0.05,
+        z_bottom=-4,
+    )
+
+
+def create_grass_wave_impact_location(
+    x_position: float = 42.0, top_layer_type: data.TopLayerType = data.TopLayerType.GrassClosedSod
+) -> data.OutputLocationSpecification:
+    return data.OutputLocationSpecification(
+        x_position=x_position,
+        top_layer_specification=data.GrassWaveImpactLayerSpecification(top_layer_type=top_layer_type),
+    )
+
+
+def create_natural_stone_location(x_position: float = 30.0) -> data.OutputLocationSpecification:
+    return data.OutputLocationSpecification(
+        x_position=x_position,
+        top_layer_specification=data.NordicStoneLayerSpecification(top_layer_thickness=0.4, relative_density=2.45),
+    )
+
+
+@pytest.fixture
+def dike_schematization() -> data.DikeSchematization:
+    return create_dike_schematization()
+
+
+@pytest.fixture
+def natural_stone_and_grass_locations() -> list[data.OutputLocationSpecification]:
+    return [create_natural_stone_location(), create_grass_wave_impact_location()]
+
+
+@pytest.fixture
+def create_hydrodynamic_conditions() -> Callable[..., data.HydrodynamicConditions]:
+    """
+    Factory of hydrodynamic conditions with five time steps. Each of the series can be replaced.
+    """
+
+    def create(
+        water_levels: list[float] | None = None,
+        wave_heights: list[float] | None = None,
+        wave_periods: list[float] | None = None,
+        wave_directions: list[float] | None = None,
+    ) -> data.HydrodynamicConditions:
+        return data.HydrodynamicConditions(
+            time_steps=[0.0, 25000.0, 50000.0, 75000.0, 100000.0, 126000.0],
+            water_levels=water_levels if water_levels is not None else [1.2, 1.9, 2.8, 2.7, 2.0],
+            wave_heights=wave_heights if wave_heights is not None else [0.5, 0.9, 1.2, 1.1, 0.8],
+            wave_periods=wave_periods if wave_periods is not None else [6.0, 6.0, 6.0, 6.0, 6.0],
+            wave_directions=wave_directions if wave_directions is not None else [60.0, 70.0, 80.0, 90.0, 100.0],
+        )
+
+    return create
+
+
+@pytest.fixture
+def create_constant_hydrodynamic_conditions() -> Callable[..., data.HydrodynamicConditions]:
+    """
+    Factory of constant hydrodynamic conditions with time steps of 3000 seconds.
+    """
+
+    def create(
+        number_of_time_steps: int,
+        water_level: float = 2.0,
+        wave_height: float = 1.0,
+        wave_period: float = 4.0,
+        wave_direction: float = 90.0,
+    ) -> data.HydrodynamicConditions:
+        return data.HydrodynamicConditions(
+            time_steps=[3000.0 * i for i in range(number_of_time_steps + 1)],
+            water_levels=[water_level] * number_of_time_steps,
+            wave_heights=[wave_height] * number_of_time_steps,
+            wave_periods=[wave_period] * number_of_time_steps,
+            wave_directions=[wave_direction] * number_of_time_steps,
+        )
+
+    return create
+
+
+@pytest.fixture
+def create_input(create_hydrodynamic_conditions) -> Callable[..., data.DikernelInput]:
+    """
+    Factory of input on the test profile. By default the input contains the hydrodynamic conditions of
+    create_hydrodynamic_conditions and a single grass wave impact location.
+    """
+
+    def create(
+        hydrodynamic_conditions: data.HydrodynamicConditions | None = None,
+        output_locations: list[data.OutputLocationSpecification] | None = None,
+    ) -> data.DikernelInput:
+        return data.DikernelInput(
+            hydrodynamic_input=hydrodynamic_conditions if hydrodynamic_conditions is not None else create_hydrodynamic_conditions(),
+            dike_schematization=create_dike_schematization(),
+            output_locations=list(output_locations) if output_locations is not None else [create_grass_wave_impact_location()],
+        )
+
+    return create
@@ -18,8 +18,11 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from pydrever.calculation import Dikernel
+from pydrever.calculation import Dikernel, ResultCache
+from concurrent.futures import ThreadPoolExecutor
 import pydrever.data as data
+import numpy
+import pytest
 
 
 def test_perform_basic_calculation():
@@ -63,3 +66,141 @@ def test_perform_basic_calculation():
     assert runresult
     assert kernel.output is not None
     assert len(kernel.output) == 1
+
+
+@pytest.fixture
+def create_screening_input(create_input, create_constant_hydrodynamic_conditions, natural_stone_and_grass_locations):
+    def create(number_of_time_steps: int) -> data.DikernelInput:
+        return create_input(
+            create_constant_hydrodynamic_conditions(number_of_time_steps, water_level=2.5, wave_height=1.5),
+            natural_stone_and_grass_locations,
+        )
+
+    return create
+
+
+def test_stop_at_first_failure(create_screening_input):
+    complete_kernel = Dikernel(create_screening_input(40))
+    assert complete_kernel.run()
+    kernel = Dikernel(create_screening_input(40))
+    kernel.stop_at_first_failure = True
+
+    assert kernel.run()
+
+    assert kernel.truncated_at is not None
+    assert kernel.truncated_at < complete_kernel.get_output_time_steps()[-1]
+    assert kernel.output[1].time_of_failure == complete_kernel.output[1].time_of_failure
+    assert len(kernel.output[1].damage_development) == len(kernel.get_output_time_steps())
+    assert kernel.get_output_time_steps()[-1] == kernel.truncated_at
+
+
+def test_stop_when_all_failed_calculates_all_time_steps_when_not_all_locations_fail(create_screening_input):
+    kernel = Dikernel(create_screening_input(40))
+    kernel.stop_when_all_failed = True
+
+    assert kernel.run()
+
+    assert kernel.truncated_at is None
+    assert not kernel.output[0].failed
+    assert len(kernel.output[0].damage_development) == 40
+
+
+def test_stop_when_all_failed_equals_complete_calculation_up_to_truncation(create_input, tmp_path):
+    number_of_time_steps = 100
+    # The rising water level makes the lower location fail in an earlier segment than the higher location.
+    hydrodynamic_conditions = data.HydrodynamicConditions(
+        time_steps=[3000.0 * i for i in range(number_of_time_steps + 1)],
+        water_levels=[1.0 + 2.0 * i / number_of_time_steps for i in range(number_of_time_steps)],
+        wave_heights=[1.0] * number_of_time_steps,
+        wave_periods=[4.0] * number_of_time_steps,
+        wave_directions=[90.0] * number_of_time_steps,
+    )
+    locations = [
+        data.OutputLocationSpecification(
+            x_position=x_position,
+            top_layer_specification=data.GrassWaveImpactLayerSpecification(top_layer_type=data.TopLayerType.GrassClosedSod),
+        )
+        for x_position in [38.0, 42.0]
+    ]
+    complete_kernel = Dikernel(create_input(hydrodynamic_conditions, locations))
+    assert complete_kernel.run()
+    kernel = Dikernel(create_input(hydrodynamic_conditions, locations))
+    kernel.stop_when_all_failed = True
+    kernel.cache = ResultCache(str(tmp_path))
+
+    assert kernel.run()
+
+    number_of_calculated_time_steps = len(kernel.get_output_time_steps())
+    assert kernel.truncated_at is not None
+    assert number_of_calculated_time_steps < number_of_time_steps
+    assert kernel.cache.size == 0
+    for location, complete_location in zip(kernel.output, complete_kernel.output, strict=True):
+        assert location.time_of_failure == pytest.approx(complete_location.time_of_failure)
+        numpy.testing.assert_allclose(
+            location.damage_development, complete_location.damage_development[:number_of_calculated_time_steps]
+        )
+        numpy.testing.assert_allclose(
+            location.loading_revetment, complete_location.loading_revetment[:number_of_calculated_time_steps]
+        )
+
+
+@pytest.mark.parametrize("stop_at_first_failure", [False, True])
+def test_validation_reports_missing_and_mismatching_hydrodynamic_series(create_screening_input, stop_at_first_failure: bool):
+    input = create_screening_input(10)
+    input.hydrodynamic_input = input.hydrodynamic_input.model_copy(
+        update={"water_levels": None, "wave_periods": numpy.full(8, 4.0)}
+    )
+    kernel = Dikernel(input)
+    kernel.stop_at_first_failure = stop_at_first_failure
+
+    assert not kernel.run()
+
+    assert kernel.output is None
+    assert kernel.errors == [
+        "The water levels of the hydrodynamic input must be specified.",
+        "The number of wave periods of the hydrodynamic input should be exactly 1 less than the number of time steps.",
+    ]
+
+
+def test_concurrent_calculations_in_threads(create_screening_input):
+    def run(number_of_time_steps: int) -> Dikernel:
+        kernel = Dikernel(create_screening_input(number_of_time_steps))
+        kernel.calculate_locations_parallel = True
+        kernel.run()
+        return kernel
+
+    numbers_of_time_steps = [10, 20, 30, 40] * 4
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        kernels = list(executor.map(run, numbers_of_time_steps))
+
+    for kernel, number_of_time_steps in zip(kernels, numbers_of_time_steps):
+        expected_kernel = run(number_of_time_steps)
+        assert kernel.errors == expected_kernel.errors
+        assert kernel.warnings == expected_kernel.warnings
+        for location, expected_location in zip(kernel.output, expected_kernel.output):
+            assert list(location.damage_development) == list(expected_location.damage_development)
+
+
+def test_validation_reports_all_violations(create_screening_input):
+    input = create_screening_input(10)
+    time_steps = list(input.hydrodynamic_input.time_steps)
+    time_steps[3], time_steps[4] = time_steps[4], time_steps[3]
+    wave_heights = list(input.hydrodynamic_input.wave_heights)
+    wave_heights[5] = float("nan")
+    input.hydrodynamic_input = input.hydrodynamic_input.model_copy(update={"time_steps": time_steps, "wave_heights": wave_heights})
+    input.start_time = 9000.0
+    input.stop_time = 6000.0
+    input.output_time_steps = [-100.0, 1.0e6]
+    kernel = Dikernel(input)
+
+    assert not kernel.run()
+
+    assert kernel.output is None
+    assert kernel.errors == [
+        "The time steps of the hydrodynamic input should be continuously increasing.",
+        "The wave heights of the hydrodynamic input should all be finite numbers.",
+        "Stop time should be greater than the specified start time.",
+        "Specified output time steps should all be greater than the specified start time.",
+        "Specified output time steps should all be greater than the minimum specified time step of the hydrodynamic conditions.",
+        "Specified output time steps should not be greater than the maximum specified time step of the hydrodynamic conditions.",
+    ]
@@ -0,0 +1,45 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import subprocess
+import sys
+import os
+
+root_directory = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def run_python(code: str) -> str:
+    # A new process is needed, the .NET runtime can not be unloaded once it is started.
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root_directory,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def test_import_does_not_load_runtime():
+    assert run_python("import sys, pydrever.calculation; print('clr' in sys.modules)") == "False"
+
+
+def test_warmup_loads_runtime():
+    code = "import sys, pydrever.calculation; pydrever.calculation.warmup(); print('clr' in sys.modules)"
+    assert run_python(code) == "True"
@@ -0,0 +1,159 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.calculation import Dikernel
+import pydrever.calculation._dikernel._resultcache as _result_cache
+import pydrever.data as data
+import numpy as numpy
+import pickle
+import copy
+import json
+import pytest
+
+
+@pytest.fixture
+def grass_wave_impact_input(create_input) -> data.DikernelInput:
+    return create_input()
+
+
+def test_output_contains_numpy_arrays(grass_wave_impact_input):
+    kernel = Dikernel(grass_wave_impact_input)
+    assert kernel.run()
+
+    location = kernel.output[0]
+    assert isinstance(location, data.GrassWaveImpactOutputLocation)
+    assert isinstance(location.damage_development, numpy.ndarray)
+    assert location.damage_development.dtype == numpy.float64
+    assert len(location.damage_development) == 5
+    assert len(location.damage_increment) == 5
+    numpy.testing.assert_array_equal(location.upper_limit_loading, [1.2, 1.9, 2.8, 2.7, 2.0])
+    # Empty values (the location is not loaded) are returned as NaN.
+    assert numpy.all(numpy.isnan(location.wave_angle))
+    assert location.final_damage == location.damage_development[-1]
+
+
+def test_output_time_series_are_converted_on_first_access(grass_wave_impact_input):
+    kernel = Dikernel(grass_wave_impact_input)
+    assert kernel.run()
+
+    location = kernel.output[0]
+    assert location.time_of_failure is None
+    assert "damage_development" not in location.__dict__
+    assert "upper_limit_loading" not in location.__dict__
+
+    final_damage = location.final_damage
+    assert "damage_development" in location.__dict__
+    assert "upper_limit_loading" not in location.__dict__
+    assert final_damage == location.damage_development[-1]
+    assert location.upper_limit_loading is location.upper_limit_loading
+
+
+def test_output_of_equal_calculations_is_equal(grass_wave_impact_input):
+    kernel = Dikernel(grass_wave_impact_input)
+    assert kernel.run()
+    other_kernel = Dikernel(grass_wave_impact_input)
+    assert other_kernel.run()
+
+    assert kernel.output[0] == other_kernel.output[0]
+    assert kernel.output[0] != kernel.output[0].model_copy(update={"x_position": 41.0})
+
+
+def test_output_that_was_not_accessed_can_be_serialized_and_copied(grass_wave_impact_input):
+    def create_location() -> data.GrassWaveImpactOutputLocation:
+        kernel = Dikernel(grass_wave_impact_input)
+        assert kernel.run()
+        return kernel.output[0]
+
+    assert "damage_development" in create_location().model_dump()
+    assert json.loads(create_location().model_dump_json())["upper_limit_loading"] == [1.2, 1.9, 2.8, 2.7, 2.0]
+    assert "wave_angle=" in repr(create_location())
+    numpy.testing.assert_array_equal(copy.copy(create_location()).upper_limit_loading, [1.2, 1.9, 2.8, 2.7, 2.0])
+
+    location_copy = copy.deepcopy(create_location())
+    assert location_copy._quantity_loader is None
+    assert location_copy == create_location()
+
+
+def test_output_can_be_pickled(grass_wave_impact_input):
+    kernel = Dikernel(grass_wave_impact_input)
+    assert kernel.run()
+
+    location = pickle.loads(pickle.dumps(kernel.output[0]))
+
+    numpy.testing.assert_array_equal(location.upper_limit_loading, [1.2, 1.9, 2.8, 2.7, 2.0])
+    numpy.testing.assert_array_equal(location.damage_development, kernel.output[0].damage_development)
+
+
+def test_only_requested_quantities_are_converted(grass_wave_impact_input):
+    grass_wave_impact_input.requested_quantities = {data.TimeDependentOutputQuantity.WaveHeightImpact}
+    kernel = Dikernel(grass_wave_impact_input)
+    assert kernel.run()
+
+    location = kernel.output[0]
+    assert location._quantity_loader is None
+    assert len(location.damage_development) == 5
+    assert len(location.wave_height_impact) == 5
+    assert location.damage_increment is None
+    assert location.upper_limit_loading is None
+    assert location.final_damage == location.damage_development[-1]
+    assert location.minimum_wave_height is not None
+
+
+def test_compact_output_locations(grass_wave_impact_input):
+    kernel = Dikernel(grass_wave_impact_input)
+    kernel.compact_output = True
+    assert kernel.run()
+
+    location = kernel.output[0]
+    assert isinstance(location, data.CompactGrassWaveImpactOutputLocation)
+    assert len(location.damage_development) == 5
+    numpy.testing.assert_array_equal(location.upper_limit_loading, [1.2, 1.9, 2.8, 2.7, 2.0])
+    assert location.minimum_wave_height is not None
+    assert not location.failed
+
+
+def test_output_as_array_and_table(grass_wave_impact_input):
+    kernel = Dikernel(grass_wave_impact_input)
+    assert kernel.run()
+
+    numpy.testing.assert_array_equal(kernel.get_output_time_steps(), [25000.0, 50000.0, 75000.0, 100000.0, 126000.0])
+    damage = kernel.to_array(data.TimeDependentOutputQuantity.DamageDevelopment)
+    assert damage.shape == (1, 5)
+    table = kernel.to_table()
+    numpy.testing.assert_array_equal(table["damage_development"], damage.ravel())
+    numpy.testing.assert_array_equal(table["time"], kernel.get_output_time_steps())
+
+
+def test_output_can_be_stored(tmp_path, monkeypatch, grass_wave_impact_input):
+    from pydrever.io import resultstore
+
+    kernel = Dikernel(grass_wave_impact_input)
+    assert kernel.run()
+
+    resultstore.write(str(tmp_path), kernel.output, kernel.get_output_time_steps(), kernel.input)
+    result = resultstore.read(str(tmp_path))
+    assert result.is_result_of(grass_wave_impact_input)
+    numpy.testing.assert_array_equal(result.get_location(0).damage_development, kernel.output[0].damage_development)
+
+    lambda_input = grass_wave_impact_input.model_copy(update={"hydrodynamics_interpolation": lambda *args: args[1]})
+    assert not result.is_result_of(lambda_input)
+
+    monkeypatch.setattr(_result_cache, "get_kernel_hash", lambda: "other binaries")
+    assert not result.is_result_of(grass_wave_impact_input)
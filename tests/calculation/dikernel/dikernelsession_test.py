@@ -0,0 +1,85 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.calculation import Dikernel, DikernelSession
+import pydrever.calculation._dikernel._dikernelinputparser as _input_parser
+import pydrever.data as data
+import numpy
+import pytest
+
+
+def create_hydrodynamic_conditions(factor: float, number_of_steps: int) -> data.HydrodynamicConditions:
+    time_steps = numpy.linspace(0.0, 126000.0, number_of_steps + 1)
+    shape = numpy.sin(numpy.linspace(0.2, 2.9, number_of_steps))
+    return data.HydrodynamicConditions(
+        time_steps=time_steps.tolist(),
+        water_levels=(factor * (1.0 + 1.8 * shape)).tolist(),
+        wave_heights=(factor * (0.4 + 0.8 * shape)).tolist(),
+        wave_periods=[6.0] * number_of_steps,
+        wave_directions=numpy.linspace(60.0, 100.0, number_of_steps).tolist(),
+    )
+
+
+@pytest.mark.parametrize("can_replace_hydrodynamics", [True, False])
+def test_session_results_equal_separate_calculations(
+    monkeypatch, dike_schematization, natural_stone_and_grass_locations, can_replace_hydrodynamics: bool
+):
+    # Without support for replacing the hydrodynamic conditions (other versions of DiKErnel), all input is converted for each calculation.
+    assert _input_parser.can_replace_hydrodynamics()
+    monkeypatch.setattr(_input_parser, "can_replace_hydrodynamics", lambda: can_replace_hydrodynamics)
+    session = DikernelSession(dike_schematization, output_locations=natural_stone_and_grass_locations)
+
+    for hydrodynamic_conditions in [create_hydrodynamic_conditions(1.0, 5), create_hydrodynamic_conditions(0.8, 12)]:
+        session_kernel = session.run(hydrodynamic_conditions)
+        kernel = Dikernel(
+            data.DikernelInput(
+                hydrodynamic_input=hydrodynamic_conditions,
+                dike_schematization=dike_schematization,
+                output_locations=natural_stone_and_grass_locations,
+            )
+        )
+        assert kernel.run()
+
+        assert session_kernel.errors is None or len(session_kernel.errors) == 0
+        assert len(session_kernel.output) == len(kernel.output)
+        for session_location, location in zip(session_kernel.output, kernel.output):
+            assert session_location.x_position == location.x_position
+            numpy.testing.assert_array_equal(session_location.damage_development, location.damage_development)
+
+
+def test_session_is_not_affected_by_changes_to_specification(dike_schematization, natural_stone_and_grass_locations):
+    session = DikernelSession(dike_schematization, output_locations=natural_stone_and_grass_locations)
+    natural_stone_and_grass_locations.pop()
+
+    kernel = session.run(create_hydrodynamic_conditions(1.0, 5))
+
+    assert len(kernel.output) == 2
+
+
+def test_session_reports_invalid_time_steps(dike_schematization, natural_stone_and_grass_locations):
+    session = DikernelSession(dike_schematization, output_locations=natural_stone_and_grass_locations)
+    session.run(create_hydrodynamic_conditions(1.0, 5))
+
+    hydrodynamic_conditions = create_hydrodynamic_conditions(1.0, 5)
+    hydrodynamic_conditions.time_steps[2] = hydrodynamic_conditions.time_steps[1]
+    kernel = session.run(hydrodynamic_conditions)
+
+    assert kernel.output is None
+    assert len(kernel.errors) > 0
@@ -0,0 +1,141 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.calculation import Dikernel, EnsembleResult, run_ensemble
+import pydrever.calculation._dikernel._ensemblecalculator as _ensemble_calculator
+import pydrever.calculation._dikernel._paralleltuning as _parallel_tuning
+import pydrever.data as data
+import numpy
+import pytest
+
+
+@pytest.fixture
+def base_input(create_input) -> data.DikernelInput:
+    return create_input(
+        output_locations=[
+            data.OutputLocationSpecification(
+                x_position=40.0,
+                top_layer_specification=data.GrassWaveImpactLayerSpecification(top_layer_type=data.TopLayerType.GrassClosedSod),
+            ),
+            data.OutputLocationSpecification(
+                x_position=42.0,
+                top_layer_specification=data.GrassWaveImpactLayerSpecification(top_layer_type=data.TopLayerType.GrassOpenSod),
+            ),
+        ]
+    )
+
+
+def test_ensemble_result_aggregates_scenarios():
+    result = EnsembleResult(quantiles=[0.0, 0.5, 1.0])
+    x_positions = numpy.array([1.0, 2.0])
+
+    result.add(x_positions, numpy.array([0.2, 1.0]), numpy.array([False, True]))
+    result.add(x_positions, numpy.array([0.4, 0.5]), numpy.array([False, False]))
+    result.add(x_positions, numpy.array([0.6, 1.5]), numpy.array([False, True]))
+
+    assert result.number_of_scenarios == 3
+    numpy.testing.assert_allclose(result.failure_probabilities, [0.0, 2.0 / 3.0])
+    numpy.testing.assert_allclose(result.mean_damage, [0.4, 1.0])
+    numpy.testing.assert_allclose(result.maximum_damage, [0.6, 1.5])
+    numpy.testing.assert_allclose(result.damage_quantiles, [[0.2, 0.5], [0.4, 1.0], [0.6, 1.5]])
+
+
+def test_ensemble_result_estimates_quantiles_of_many_scenarios():
+    quantiles = [0.0, 0.05, 0.5, 0.95, 1.0]
+    result = EnsembleResult(quantiles=quantiles)
+    x_positions = numpy.array([1.0, 2.0])
+    generator = numpy.random.default_rng(42)
+    final_damages = numpy.column_stack((generator.uniform(0.0, 1.0, 2000), generator.normal(1.0, 0.2, 2000)))
+
+    for damages in final_damages:
+        result.add(x_positions, damages, damages > 1.0)
+
+    expected = numpy.quantile(final_damages, quantiles, axis=0)
+    assert result.number_of_scenarios == 2000
+    numpy.testing.assert_allclose(result.damage_quantiles, expected, atol=0.02)
+    numpy.testing.assert_array_equal(result.damage_quantiles[[0, -1]], expected[[0, -1]])
+
+
+def test_empty_ensemble_result_has_no_statistics():
+    result = EnsembleResult()
+
+    assert result.number_of_scenarios == 0
+    assert result.failure_probabilities is None
+    assert result.damage_quantiles is None
+
+
+def test_run_ensemble_equals_separate_calculations(base_input, create_hydrodynamic_conditions):
+    wave_heights = [0.5, 0.8, 1.1, 1.4, 1.7]
+
+    result = run_ensemble(
+        base_input,
+        (create_hydrodynamic_conditions(wave_heights=[wave_height] * 5) for wave_height in wave_heights),
+        workers=2,
+    )
+
+    final_damages = []
+    failed = []
+    for wave_height in wave_heights:
+        input = base_input.model_copy(update={"hydrodynamic_input": create_hydrodynamic_conditions(wave_heights=[wave_height] * 5)})
+        kernel = Dikernel(input)
+        assert kernel.run()
+        final_damages.append([location.final_damage for location in kernel.output])
+        failed.append([location.failed for location in kernel.output])
+
+    assert result.number_of_scenarios == len(wave_heights)
+    assert len(result.errors) == 0
+    numpy.testing.assert_array_equal(result.x_positions, [40.0, 42.0])
+    numpy.testing.assert_allclose(result.mean_damage, numpy.mean(final_damages, axis=0))
+    numpy.testing.assert_allclose(result.failure_probabilities, numpy.mean(failed, axis=0))
+    numpy.testing.assert_allclose(result.damage_quantiles, numpy.quantile(final_damages, [0.05, 0.5, 0.95], axis=0))
+
+
+def test_run_ensemble_with_auto_parallel(tmp_path, monkeypatch, base_input, create_hydrodynamic_conditions):
+    monkeypatch.setenv("PYDREVER_PARALLEL_TUNING_FILE", str(tmp_path / "paralleltuning.json"))
+    calibrate = _parallel_tuning.calibrate
+    prepare = _parallel_tuning.prepare
+    prepared = []
+
+    def calibrate_small(calibration_file: str) -> dict:
+        return calibrate(calibration_file, (1, 2), (5, 10), repetitions=1)
+
+    def prepare_and_record():
+        prepared.append(True)
+        prepare()
+
+    monkeypatch.setattr(_parallel_tuning, "calibrate", calibrate_small)
+    monkeypatch.setattr(_parallel_tuning, "prepare", prepare_and_record)
+
+    result = run_ensemble(base_input, [create_hydrodynamic_conditions()], workers=1, auto_parallel=True)
+
+    assert prepared == [True]
+    assert result.number_of_scenarios == 1
+    _ensemble_calculator._initialize_worker(base_input, False, False, True)
+    assert _ensemble_calculator._session.auto_parallel
+
+
+def test_run_ensemble_reports_errors_per_scenario(base_input, create_hydrodynamic_conditions):
+    invalid_conditions = create_hydrodynamic_conditions(wave_heights=[1.0] * 5).model_copy(update={"wave_heights": [1.0] * 3})
+
+    result = run_ensemble(base_input, [create_hydrodynamic_conditions(wave_heights=[1.0] * 5), invalid_conditions], workers=1)
+
+    assert result.number_of_scenarios == 1
+    assert list(result.errors.keys()) == [1]
+    assert len(result.errors[1]) > 0
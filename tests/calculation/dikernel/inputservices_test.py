@@ -29,8 +29,10 @@ from pydrever.data import (
     TopLayerSpecification,
     TopLayerType,
     HydrodynamicConditions,
+    InterpolationType,
 )
-
+from pydrever.calculation import hydrodynamicsinterpolator
+from functools import partial
 import pytest
 
 
@@ -215,3 +217,88 @@ def test_get_output_locations_returns_combined_output_locations(
     assert locations[6].top_layer_specification == spec_vertical
     assert locations[7].x_position == 10.0
     assert locations[7].top_layer_specification == spec_vertical
+
+
+@pytest.mark.parametrize(
+    "interpolation,expected_water_levels,expected_wave_directions",
+    [
+        (InterpolationType.Previous, [1.0, 1.0, 3.0, 3.0], [350.0, 350.0, 10.0, 10.0]),
+        (InterpolationType.Linear, [1.0, 1.5, 2.5, 3.0], [350.0, 355.0, 5.0, 10.0]),
+    ],
+)
+def test_get_run_input_interpolates_output_time_steps(
+    empty_schematization, interpolation, expected_water_levels, expected_wave_directions
+):
+    input = DikernelInput(
+        hydrodynamic_input=HydrodynamicConditions(
+            time_steps=[0.0, 2.0, 4.0],
+            water_levels=[1.0, 3.0],
+            wave_heights=[0.5, 0.5],
+            wave_periods=[4.0, 4.0],
+            wave_directions=[350.0, 10.0],
+        ),
+        dike_schematization=empty_schematization,
+        output_time_steps=[1.0, 3.0],
+        hydrodynamics_interpolation=interpolation,
+    )
+
+    run_input = _input_service.get_run_input(input)
+
+    assert run_input.hydrodynamic_input.time_steps.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert run_input.hydrodynamic_input.water_levels == pytest.approx(expected_water_levels)
+    assert run_input.hydrodynamic_input.wave_directions == pytest.approx(expected_wave_directions, abs=0.1)
+
+
+def test_get_run_input_shares_specifications(empty_schematization, empty_hydrodynamics, valid_output_location_specification):
+    input = DikernelInput(
+        hydrodynamic_input=empty_hydrodynamics,
+        dike_schematization=empty_schematization,
+        output_locations=[valid_output_location_specification],
+        settings=[],
+    )
+
+    run_input = _input_service.get_run_input(input)
+
+    assert run_input.dike_schematization is input.dike_schematization
+    assert run_input.output_locations is input.output_locations
+    assert run_input.settings is input.settings
+    assert run_input.output_revetment_zones is None
+    assert run_input.hydrodynamic_input is not input.hydrodynamic_input
+
+
+def interpolate_previous(time_steps, values, target_time_steps):
+    return hydrodynamicsinterpolator.interpolate_time_series_block(time_steps, values, target_time_steps)
+
+
+def test_input_hash_identifies_interpolation_function(empty_schematization, empty_hydrodynamics):
+    input = DikernelInput(hydrodynamic_input=empty_hydrodynamics, dike_schematization=empty_schematization)
+    function_input = input.model_copy(update={"hydrodynamics_interpolation": interpolate_previous})
+
+    assert _input_service.get_input_hash(function_input) == _input_service.get_input_hash(function_input.model_copy())
+    assert _input_service.get_input_hash(function_input) != _input_service.get_input_hash(input)
+
+
+def create_nested_interpolation():
+    def interpolate(time_steps, values, target_time_steps):
+        return interpolate_previous(time_steps, values, target_time_steps)
+
+    return interpolate
+
+
+@pytest.mark.parametrize(
+    "interpolation",
+    [
+        lambda time_steps, values, target_time_steps: values,
+        partial(hydrodynamicsinterpolator.interpolate_time_series_block, interpolation=InterpolationType.Linear),
+        create_nested_interpolation(),
+    ],
+)
+def test_input_hash_refuses_unidentifiable_interpolation(empty_schematization, empty_hydrodynamics, interpolation):
+    input = DikernelInput(
+        hydrodynamic_input=empty_hydrodynamics,
+        dike_schematization=empty_schematization,
+        hydrodynamics_interpolation=interpolation,
+    )
+
+    with pytest.raises(ValueError):
+        _input_service.get_input_hash(input)
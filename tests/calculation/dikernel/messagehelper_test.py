@@ -18,15 +18,16 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from pydrever.calculation._dikernel._dikernelcreferences import *
+import pydrever.calculation._dikernel._dikernelcreferences as _cs
 import pydrever.calculation._dikernel._messagehelper as _message_helper
 
+_cs.load()
 from DiKErnel.Util import Event, SimpleResult
 
 
 def test_message_helper_parses_error_messages():
-    c_events = List[Event]()
-    c_events.Add(Event("test", EventType.Error))
+    c_events = _cs.List[Event]()
+    c_events.Add(Event("test", _cs.EventType.Error))
     c_result = SimpleResult(False, c_events)
 
     warnings, errors = _message_helper.parse_messages(c_result)
@@ -36,8 +37,8 @@ def test_message_helper_parses_error_messages():
 
 
 def test_message_helper_parses_warning_messages():
-    c_events = List[Event]()
-    c_events.Add(Event("test", EventType.Warning))
+    c_events = _cs.List[Event]()
+    c_events.Add(Event("test", _cs.EventType.Warning))
     c_result = SimpleResult(False, c_events)
 
     warnings, errors = _message_helper.parse_messages(c_result)
@@ -0,0 +1,75 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import pydrever.calculation._dikernel._outputservices as _output_services
+from pydrever.data import (
+    CompactGrassWaveImpactOutputLocation,
+    NaturalStoneOutputLocation,
+    TimeDependentOutputQuantity,
+)
+import numpy
+import pytest
+
+
+@pytest.fixture
+def output():
+    return [
+        CompactGrassWaveImpactOutputLocation(
+            x_position=10.0,
+            z_position=1.0,
+            damage_development=numpy.array([0.1, 0.2, 0.3]),
+            wave_height_impact=numpy.array([0.5, 0.6, 0.7]),
+        ),
+        NaturalStoneOutputLocation.model_construct(
+            x_position=20.0,
+            z_position=2.0,
+            time_of_failure=1500.0,
+            damage_development=[0.4, 1.1, 1.2],
+            hydrodynamic_load=[1.0, None, 3.0],
+        ),
+    ]
+
+
+def test_to_array(output):
+    damage = _output_services.to_array(output, TimeDependentOutputQuantity.DamageDevelopment)
+    numpy.testing.assert_array_equal(damage, [[0.1, 0.2, 0.3], [0.4, 1.1, 1.2]])
+
+    load = _output_services.to_array(output, TimeDependentOutputQuantity.HydrodynamicLoad)
+    assert load.shape == (2, 3)
+    assert numpy.all(numpy.isnan(load[0]))
+    numpy.testing.assert_array_equal(load[1], [1.0, numpy.nan, 3.0])
+
+
+def test_to_table(output):
+    table = _output_services.to_table(output, [100.0, 200.0, 300.0])
+
+    numpy.testing.assert_array_equal(table["x_position"], [10.0, 10.0, 10.0, 20.0, 20.0, 20.0])
+    numpy.testing.assert_array_equal(table["time"], [100.0, 200.0, 300.0, 100.0, 200.0, 300.0])
+    numpy.testing.assert_array_equal(table["time_of_failure"][3:], [1500.0, 1500.0, 1500.0])
+    assert numpy.all(numpy.isnan(table["time_of_failure"][:3]))
+    numpy.testing.assert_array_equal(table["damage_development"], [0.1, 0.2, 0.3, 0.4, 1.1, 1.2])
+    assert "wave_height_impact" in table
+    assert "maximum_peak_stress" not in table
+    assert all(len(column) == 6 for column in table.values())
+
+
+def test_to_table_throws_on_wrong_number_of_time_steps(output):
+    with pytest.raises(ValueError):
+        _output_services.to_table(output, [100.0, 200.0])
@@ -0,0 +1,116 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.calculation import Dikernel, calibrate_parallel_settings
+import pydrever.calculation._dikernel._paralleltuning as _parallel_tuning
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+
+
+def test_calibrate_stores_cost_model(tmp_path):
+    calibration_file = str(tmp_path / "tuning" / "paralleltuning.json")
+
+    calibration = calibrate_parallel_settings(calibration_file, (1, 4), (10, 40), repetitions=1)
+
+    assert os.path.exists(calibration_file)
+    with open(calibration_file, "r") as file:
+        assert json.load(file) == calibration
+    assert calibration["processors"] == (os.cpu_count() or 1)
+    assert len(calibration["coefficients"]) == 4
+    assert all(len(coefficients) == 4 for coefficients in calibration["coefficients"].values())
+
+
+def test_parallel_settings_follow_cost_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    calibration_file = str(tmp_path / "paralleltuning.json")
+    with open(calibration_file, "w") as file:
+        json.dump(
+            {
+                "version": 1,
+                "processors": 8,
+                "coefficients": {
+                    "locations_false_time_steps_false": [0.0, 0.0, 0.0, 1.0],
+                    "locations_true_time_steps_false": [10.0, 0.0, 0.0, 0.25],
+                    "locations_false_time_steps_true": [20.0, 0.0, 0.0, 0.5],
+                    "locations_true_time_steps_true": [40.0, 0.0, 0.0, 0.25],
+                },
+            },
+            file,
+        )
+
+    assert _parallel_tuning.get_parallel_settings(1, 5, calibration_file) == (False, False)
+    assert _parallel_tuning.get_parallel_settings(100, 1000, calibration_file) == (True, False)
+
+
+def test_single_processor_calculates_serially(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    calibration_file = str(tmp_path / "paralleltuning.json")
+
+    assert _parallel_tuning.get_parallel_settings(100, 1000, calibration_file) == (False, False)
+    assert not os.path.exists(calibration_file)
+
+
+def test_auto_parallel_calculation(tmp_path, monkeypatch, create_input):
+    monkeypatch.setattr(_parallel_tuning, "default_calibration_file", str(tmp_path / "paralleltuning.json"))
+    input = create_input()
+    kernel = Dikernel(input)
+    kernel.auto_parallel = True
+
+    assert kernel.run()
+    assert len(kernel.output) == 1
+
+
+def test_concurrent_calculations_calibrate_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    calibration_file = str(tmp_path / "tuning" / "paralleltuning.json")
+    monkeypatch.setenv("PYDREVER_PARALLEL_TUNING_FILE", calibration_file)
+    calibrate = _parallel_tuning.calibrate
+    calibrated_files = []
+
+    def calibrate_small(calibration_file: str) -> dict:
+        calibrated_files.append(calibration_file)
+        return calibrate(calibration_file, (1, 2), (5, 10), repetitions=1)
+
+    monkeypatch.setattr(_parallel_tuning, "calibrate", calibrate_small)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        settings = list(executor.map(lambda _: _parallel_tuning.get_parallel_settings(10, 100), range(4)))
+
+    assert calibrated_files == [calibration_file]
+    assert os.path.exists(calibration_file)
+    assert len(set(settings)) == 1
+
+
+def test_auto_parallel_is_used_for_each_chunk(monkeypatch, create_input, create_constant_hydrodynamic_conditions):
+    requested_sizes = []
+
+    def get_parallel_settings(number_of_locations: int, number_of_time_steps: int) -> tuple[bool, bool]:
+        requested_sizes.append((number_of_locations, number_of_time_steps))
+        return False, False
+
+    monkeypatch.setattr(_parallel_tuning, "get_parallel_settings", get_parallel_settings)
+    kernel = Dikernel(create_input(create_constant_hydrodynamic_conditions(10)))
+    kernel.auto_parallel = True
+
+    chunks = list(kernel.run_chunked(4))
+
+    assert len(chunks) == 3
+    assert requested_sizes == [(1, 4), (1, 4), (1, 2)]
@@ -0,0 +1,146 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.calculation import Dikernel, ResultCache
+import pydrever.calculation._dikernel._resultcache as _result_cache
+import pydrever.calculation._dikernel._dikernelcreferences as _cs
+import pydrever.data as data
+import numpy
+import os
+import shutil
+import pytest
+
+
+@pytest.fixture
+def input(create_input) -> data.DikernelInput:
+    return create_input()
+
+
+def test_location_keys_depend_on_input(input):
+    keys = _result_cache.get_location_keys(input, False)
+    assert len(keys) == 1
+    assert keys == _result_cache.get_location_keys(input.model_copy(deep=True), False)
+    assert keys != _result_cache.get_location_keys(input, True)
+
+    input.add_output_location(
+        x_location=41.0,
+        top_layer_specification=data.GrassWaveImpactLayerSpecification(top_layer_type=data.TopLayerType.GrassOpenSod),
+    )
+    extended_keys = _result_cache.get_location_keys(input, False)
+    assert len(extended_keys) == 2
+    # Locations are ordered by their cross-shore position.
+    assert extended_keys[1] == keys[0]
+
+    input.dike_schematization.dike_orientation = 80.0
+    assert keys[0] not in _result_cache.get_location_keys(input, False)
+
+
+def test_cache_returns_stored_result(tmp_path, input):
+    cache = ResultCache(str(tmp_path))
+    kernel = Dikernel(input)
+    kernel.cache = cache
+    assert kernel.run()
+    assert len(os.listdir(tmp_path)) == 1
+
+    cached_kernel = Dikernel(input)
+    cached_kernel.cache = cache
+    assert cached_kernel.run()
+    # Cached output is not related to a calculation (and C# output) in this session.
+    assert cached_kernel.output[0]._quantity_loader is None
+    numpy.testing.assert_array_equal(cached_kernel.output[0].damage_development, kernel.output[0].damage_development)
+
+
+def test_cache_only_calculates_new_locations(tmp_path, input):
+    cache = ResultCache(str(tmp_path))
+    kernel = Dikernel(input)
+    kernel.cache = cache
+    assert kernel.run()
+
+    input.add_output_location(
+        x_location=41.0,
+        top_layer_specification=data.GrassWaveImpactLayerSpecification(top_layer_type=data.TopLayerType.GrassOpenSod),
+    )
+    extended_kernel = Dikernel(input)
+    extended_kernel.cache = cache
+    assert extended_kernel.run()
+
+    assert [location.x_position for location in extended_kernel.output] == [41.0, 42.0]
+    assert extended_kernel.output[0]._quantity_loader is not None
+    assert extended_kernel.output[1]._quantity_loader is None
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_cache_removes_least_recently_used_results(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    output_location = data.CompactOutputLocation(x_position=1.0, damage_development=numpy.zeros(1000))
+    cache.set("first", output_location, [])
+    cache.set("second", output_location, [])
+    assert cache.get("first") is not None
+    os.utime(os.path.join(tmp_path, "second.pkl"), (0, 0))
+
+    # Room for two results.
+    cache.max_size = cache.size + 100
+    cache.set("third", output_location, ["warning"])
+
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third")[1] == ["warning"]
+
+
+def test_calculation_reduces_cache_size_once(tmp_path, monkeypatch, input):
+    for x_position in [40.0, 41.0, 43.0]:
+        input.add_output_location(
+            x_location=x_position,
+            top_layer_specification=data.GrassWaveImpactLayerSpecification(top_layer_type=data.TopLayerType.GrassOpenSod),
+        )
+    cache = ResultCache(str(tmp_path))
+    listed_directories = []
+    listdir = os.listdir
+    monkeypatch.setattr(os, "listdir", lambda path: listed_directories.append(path) or listdir(path))
+    kernel = Dikernel(input)
+    kernel.cache = cache
+
+    assert kernel.run()
+
+    assert listed_directories.count(str(tmp_path)) == 1
+    assert len(os.listdir(tmp_path)) == 4
+
+
+def test_cache_ignores_unreadable_results(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    with open(os.path.join(tmp_path, "broken.pkl"), "wb") as file:
+        file.write(b"no pickle")
+
+    assert cache.get("broken") is None
+    assert not os.path.exists(os.path.join(tmp_path, "broken.pkl"))
+
+
+def test_location_keys_depend_on_all_binaries(tmp_path, monkeypatch, input):
+    keys = _result_cache.get_location_keys(input, False)
+
+    for directory_name, changed_binary in [("copy", None), ("changed_helper", "LogHandlerHelper.dll"), ("changed_overtopping", "dllDikesOvertopping.dll")]:
+        dll_directory = tmp_path / directory_name
+        shutil.copytree(_cs.dll_base_path, dll_directory)
+        if changed_binary is not None:
+            with open(dll_directory / changed_binary, "ab") as file:
+                file.write(b"\0")
+        monkeypatch.setattr(_cs, "dll_base_path", str(dll_directory))
+
+        assert (_result_cache.get_location_keys(input, False) == keys) == (changed_binary is None)
@@ -0,0 +1,78 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import subprocess
+import sys
+import os
+import pytest
+
+root_directory = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def run_python(code: str, environment: dict[str, str] | None = None) -> str:
+    # A new process is needed, the .NET runtime can not be changed once it is loaded.
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root_directory,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **(environment or {})},
+    ).stdout.strip()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses coreclr, which is not the default runtime on Windows.")
+def test_configure_runtime_applies_options():
+    code = """
+import pydrever
+pydrever.configure_runtime("coreclr", server_garbage_collection=True, tiered_compilation=False)
+pydrever.calculation.warmup()
+from System import AppContext
+print(AppContext.GetData("System.GC.Server"), AppContext.GetData("System.Runtime.TieredCompilation"))
+"""
+    # The runtime falls back to workstation garbage collection on a single processor, the properties are checked instead.
+    assert run_python(code) == "true false"
+
+
+def test_configure_runtime_throws_after_loading():
+    code = """
+import pydrever
+pydrever.calculation.warmup()
+try:
+    pydrever.configure_runtime("coreclr")
+except RuntimeError:
+    print("raised")
+"""
+    assert run_python(code) == "raised"
+
+
+@pytest.mark.parametrize(
+    "runtime,options",
+    [("unknown", ""), ("mono", "server_garbage_collection=True")],
+)
+def test_configure_runtime_throws_on_invalid_configuration(runtime, options):
+    code = f"""
+import pydrever
+try:
+    pydrever.configure_runtime("{runtime}", {options})
+except ValueError:
+    print("raised")
+"""
+    assert run_python(code) == "raised"
@@ -0,0 +1,112 @@
+"""
+ Copyright (C) Stichting Deltares 2024. All rights reserved.
+ 
+ This file is part of the dikernel-python toolbox.
+ 
+ This program is free software; you can redistribute it and/or modify it under the terms of
+ the GNU Lesser General Public License as published by the Free Software Foundation; either
+ version 3 of the License, or (at your option) any later version.
+ 
+ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+ without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ See the GNU Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public License along with this
+ program; if not, see <https://www.gnu.org/licenses/>.
+ 
+ All names, logos, and references to "Deltares" are registered trademarks of Stichting
+ Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.calculation import hydrodynamicsinterpolator
+from pydrever.data import InterpolationType
+import numpy
+import pytest
+
+
+def test_interpolate_time_series():
+    time_steps = [0.0, 10.0, 20.0, 30.0]
+    values = [1.0, 2.0, 3.0]
+
+    interpolated_values = hydrodynamicsinterpolator.interpolate_time_series(
+        time_steps, values, [0.0, 5.0, 10.0, 15.0, 20.0, 30.0]
+    )
+
+    assert interpolated_values == [1.0, 1.0, 2.0, 2.0, 3.0]
+
+
+def test_interpolate_time_series_outside_original_time_steps():
+    interpolated_values = hydrodynamicsinterpolator.interpolate_time_series(
+        [0.0, 10.0, 20.0], [1.0, 2.0], [0.0, 20.0, 25.0, 40.0]
+    )
+
+    assert interpolated_values == [2.0, 2.0, 2.0]
+
+
+def test_interpolate_time_series_block():
+    time_steps = numpy.array([0.0, 10.0, 20.0, 30.0])
+    values = numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    target_time_steps = numpy.array([5.0, 10.0, 12.0, 25.0, 30.0])
+
+    interpolated_values = hydrodynamicsinterpolator.interpolate_time_series_block(time_steps, values, target_time_steps)
+
+    numpy.testing.assert_array_equal(interpolated_values, [[1.0, 2.0, 3.0, 3.0], [4.0, 5.0, 6.0, 6.0]])
+    for series, interpolated_series in zip(values, interpolated_values):
+        assert (
+            hydrodynamicsinterpolator.interpolate_time_series(time_steps.tolist(), series.tolist(), target_time_steps.tolist())
+            == interpolated_series.tolist()
+        )
+
+
+def test_interpolate_time_series_block_without_target_time_steps():
+    interpolated_values = hydrodynamicsinterpolator.interpolate_time_series_block(
+        [0.0, 10.0], numpy.array([[1.0], [2.0]]), [5.0]
+    )
+
+    assert interpolated_values.shape == (2, 0)
+
+
+@pytest.mark.parametrize(
+    "interpolation,expected_values",
+    [
+        (InterpolationType.Previous, [1.0, 1.0, 2.0, 3.0, 3.0]),
+        (InterpolationType.Linear, [1.0, 1.25, 2.0, 2.75, 3.0]),
+        (InterpolationType.Nearest, [1.0, 1.0, 2.0, 3.0, 3.0]),
+    ],
+)
+def test_interpolate_time_series_block_with_interpolation_type(interpolation, expected_values):
+    time_steps = [0.0, 10.0, 20.0, 30.0]
+    values = numpy.array([[1.0, 2.0, 3.0]])
+
+    interpolated_values = hydrodynamicsinterpolator.interpolate_time_series_block(
+        time_steps, values, [0.0, 5.0, 10.0, 20.0, 25.0, 30.0], interpolation
+    )
+
+    numpy.testing.assert_allclose(interpolated_values[0], expected_values)
+
+
+@pytest.mark.parametrize("interpolation", list(InterpolationType))
+def test_interpolation_without_added_time_steps_keeps_values(interpolation):
+    time_steps = [0.0, 10.0, 25.0, 30.0]
+    values = numpy.array([[1.0, 4.0, 2.0], [350.0, 10.0, 180.0]])
+
+    interpolated_values = hydrodynamicsinterpolator.interpolate_time_series_block(time_steps, values, time_steps, interpolation)
+
+    numpy.testing.assert_allclose(interpolated_values, values)
+
+
+def test_interpolate_hydrodynamics_with_function():
+    def interpolate_linear(time_steps, values, target_time_steps):
+        return hydrodynamicsinterpolator.interpolate_time_series_block(
+            time_steps, values, target_time_steps, InterpolationType.Linear
+        )
+
+    values = numpy.array([[1.0, 3.0], [0.5, 1.5], [4.0, 6.0], [300.0, 60.0]])
+
+    interpolated_values = hydrodynamicsinterpolator.interpolate_hydrodynamics(
+        [0.0, 2.0, 4.0], values, [0.0, 1.0, 2.0, 3.0, 4.0], interpolate_linear
+    )
+
+    numpy.testing.assert_allclose(interpolated_values[:3], [[1.0, 1.5, 2.5, 3.0], [0.5, 0.75, 1.25, 1.5], [4.0, 4.5, 5.5, 6.0]])
+    # Directions are interpolated as unit vectors, across north.
+    numpy.testing.assert_allclose(interpolated_values[3], [300.0, 319.1, 40.9, 60.0], atol=0.1)
@@ -0,0 +1,77 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.data import (
+    CompactOutputLocation,
+    CompactGrassWaveImpactOutputLocation,
+    GrassWaveImpactOutputLocation,
+)
+import numpy
+import pickle
+import pytest
+
+
+def test_compact_output_location_has_same_fields_as_output_location():
+    assert set(CompactGrassWaveImpactOutputLocation.field_names) == set(GrassWaveImpactOutputLocation.model_fields)
+
+
+def test_compact_output_location_has_no_attribute_dictionary():
+    location = CompactGrassWaveImpactOutputLocation(x_position=1.0)
+    assert not hasattr(location, "__dict__")
+    assert location.wave_angle is None
+
+
+def test_compact_output_location_is_immutable():
+    location = CompactOutputLocation(x_position=1.0)
+    with pytest.raises(AttributeError):
+        location.x_position = 2.0
+
+
+def test_compact_output_location_throws_on_unknown_field():
+    with pytest.raises(TypeError):
+        CompactOutputLocation(wave_angle=numpy.array([1.0]))
+
+
+@pytest.mark.parametrize(
+    "time_of_failure,failed",
+    [(None, False), (1500.0, True)],
+)
+def test_compact_output_location_properties(time_of_failure, failed):
+    location = CompactOutputLocation(
+        x_position=1.0,
+        z_position=2.0,
+        time_of_failure=time_of_failure,
+        damage_development=numpy.array([0.1, 0.4, 1.2]),
+    )
+    assert location.failed == failed
+    assert location.final_damage == 1.2
+
+
+def test_compact_output_location_can_be_pickled():
+    location = CompactGrassWaveImpactOutputLocation(
+        x_position=1.0,
+        z_position=2.0,
+        damage_development=numpy.array([0.1, 0.4]),
+        minimum_wave_height=0.25,
+    )
+    copy = pickle.loads(pickle.dumps(location))
+    assert copy.x_position == 1.0
+    assert copy.minimum_wave_height == 0.25
+    numpy.testing.assert_array_equal(copy.damage_development, [0.1, 0.4])
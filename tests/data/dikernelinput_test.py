@@ -0,0 +1,124 @@
+"""
+Copyright (C) Stichting Deltares 2024. All rights reserved.
+
+This file is part of the dikernel-python toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.data import HydrodynamicConditions, DikernelInput, DikeSchematization
+import numpy as numpy
+import pytest
+
+
+def test_hydrodynamic_conditions_from_arrays_shares_buffers():
+    time_steps = numpy.linspace(0.0, 1000.0, 11)
+    water_levels = numpy.linspace(0.0, 2.0, 10)
+
+    conditions = HydrodynamicConditions.from_arrays(time_steps, water_levels, numpy.ones(10), numpy.full(10, 4.0), numpy.zeros(10))
+
+    assert conditions.time_steps is time_steps
+    assert conditions.water_levels is water_levels
+    assert conditions.wave_periods.dtype == numpy.float64
+
+
+def test_hydrodynamic_conditions_from_arrays_converts_lists():
+    conditions = HydrodynamicConditions.from_arrays([0, 1, 2], [1, 2], [0.5, 0.5], [4, 4], [0, 0])
+
+    assert isinstance(conditions.time_steps, numpy.ndarray)
+    assert conditions.time_steps.dtype == numpy.float64
+    assert conditions.model_dump()["water_levels"] == [1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "time_steps,water_levels,message",
+    [
+        ([0.0, 1.0, 2.0], [1.0], "exactly 1 less"),
+        ([0.0, 2.0, 1.0], [1.0, 1.0], "continuously increasing"),
+        ([0.0, 1.0, 1.0], [1.0, 1.0], "continuously increasing"),
+        ([0.0, 1.0, 2.0], [1.0, numpy.nan], "not finite"),
+        ([0.0, 1.0, numpy.inf], [1.0, 1.0], "not finite"),
+        ([[0.0, 1.0, 2.0]], [1.0, 1.0], "one-dimensional"),
+    ],
+)
+def test_hydrodynamic_conditions_from_arrays_validates(time_steps, water_levels, message):
+    number_of_values = len(water_levels)
+    with pytest.raises(Exception, match=message):
+        HydrodynamicConditions.from_arrays(
+            time_steps,
+            water_levels,
+            numpy.ones(number_of_values),
+            numpy.ones(number_of_values),
+            numpy.zeros(number_of_values),
+        )
+
+
+def create_conditions_as_lists() -> HydrodynamicConditions:
+    return HydrodynamicConditions(
+        time_steps=[0.0, 1.0, 2.0],
+        water_levels=[1.0, 2.0],
+        wave_heights=[0.5, 0.5],
+        wave_periods=[4.0, 4.0],
+        wave_directions=[0.0, 0.0],
+    )
+
+
+def create_conditions_as_arrays() -> HydrodynamicConditions:
+    return HydrodynamicConditions.from_arrays([0, 1, 2], [1, 2], [0.5, 0.5], [4, 4], [0, 0])
+
+
+def test_hydrodynamic_conditions_from_arrays_equal_conditions_with_lists():
+    conditions = create_conditions_as_arrays()
+
+    assert conditions == create_conditions_as_arrays()
+    assert conditions == create_conditions_as_lists()
+    assert conditions != create_conditions_as_arrays().model_copy(update={"water_levels": numpy.array([1.0, 3.0])})
+
+    dike_schematization = DikeSchematization(
+        dike_orientation=0.0, x_positions=[0.0, 1.0], z_positions=[0.0, 1.0], roughnesses=[1.0], x_outer_toe=0.0, x_outer_crest=1.0
+    )
+    input = DikernelInput(hydrodynamic_input=conditions, dike_schematization=dike_schematization)
+    assert input == DikernelInput(hydrodynamic_input=create_conditions_as_lists(), dike_schematization=dike_schematization)
+
+
+def test_hydrodynamic_conditions_from_arrays_can_be_serialized():
+    conditions = create_conditions_as_arrays()
+
+    json = conditions.model_dump_json()
+
+    assert json == create_conditions_as_lists().model_dump_json()
+    assert HydrodynamicConditions.model_validate_json(json) == conditions
+    assert conditions.model_dump(mode="json", serialize_as_any=True)["time_steps"] == [0.0, 1.0, 2.0]
+
+
+def test_hydrodynamic_conditions_keep_validated_arrays():
+    conditions = HydrodynamicConditions(
+        time_steps=numpy.array([0, 1, 2]),
+        water_levels=[1, 2],
+        wave_heights=[0.5, 0.5],
+        wave_periods=[4.0, 4.0],
+        wave_directions=[0.0, 0.0],
+    )
+
+    assert conditions.time_steps.dtype == numpy.float64
+    assert conditions.water_levels == [1.0, 2.0]
+    with pytest.raises(ValueError):
+        HydrodynamicConditions(
+            time_steps=[0.0, 1.0, 2.0],
+            water_levels=["high", "low"],
+            wave_heights=[0.5, 0.5],
+            wave_periods=[4.0, 4.0],
+            wave_directions=[0.0, 0.0],
+        )
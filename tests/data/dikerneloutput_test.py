@@ -19,6 +19,8 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 import pytest
+import numpy
+import json
 
 from pydrever.data import (
     NaturalStoneOutputLocation,
@@ -216,3 +218,47 @@ def test_grasscumulativeoverloadoutputlocationthrowsonwronginput(field_name, val
     errors = v_error.value.errors()
     assert len(errors) == 1
     assert errors[0]["loc"][0] == field_name
+
+
+def create_grass_wave_impact_output_location(wave_angle: list[float | None]) -> GrassWaveImpactOutputLocation:
+    return GrassWaveImpactOutputLocation(
+        x_position=1.23,
+        z_position=2.132,
+        time_of_failure=None,
+        damage_development=[0.1, 0.2, 0.3],
+        damage_increment=[0.1, 0.1, 0.1],
+        minimum_wave_height=0.5,
+        maximum_wave_height=2.0,
+        loading_revetment=[1.0, 1.0, 0.0],
+        upper_limit_loading=[1.0, 2.0, 3.0],
+        lower_limit_loading=[0.0, 1.0, 2.0],
+        wave_angle=wave_angle,
+        wave_angle_impact=[1.0, 2.0, None],
+        wave_height_impact=[1.0, 2.0, None],
+    )
+
+
+def test_output_location_time_series_are_arrays():
+    location = create_grass_wave_impact_output_location([1.0, 2.0, None])
+
+    assert isinstance(location.damage_development, numpy.ndarray)
+    assert location.damage_development.dtype == numpy.float64
+    assert numpy.isnan(location.wave_angle[2])
+
+
+def test_output_location_can_be_serialized():
+    location = create_grass_wave_impact_output_location([1.0, 2.0, None])
+
+    serialized_location = json.loads(location.model_dump_json())
+
+    assert serialized_location["damage_development"] == [0.1, 0.2, 0.3]
+    assert serialized_location["wave_angle"] == [1.0, 2.0, None]
+    assert GrassWaveImpactOutputLocation.model_validate(serialized_location) == location
+
+
+def test_output_location_equality():
+    location = create_grass_wave_impact_output_location([1.0, 2.0, None])
+
+    assert location == create_grass_wave_impact_output_location([1.0, 2.0, None])
+    assert location != create_grass_wave_impact_output_location([1.0, 3.0, None])
+    assert location != create_grass_wave_impact_output_location([1.0, 2.0, 3.0])
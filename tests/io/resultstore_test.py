@@ -0,0 +1,97 @@
+"""
+ Copyright (C) Stichting Deltares 2024. All rights reserved.
+ 
+ This file is part of the dikernel-python toolbox.
+ 
+ This program is free software; you can redistribute it and/or modify it under the terms of
+ the GNU Lesser General Public License as published by the Free Software Foundation; either
+ version 3 of the License, or (at your option) any later version.
+ 
+ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+ without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ See the GNU Lesser General Public License for more details.
+ 
+ You should have received a copy of the GNU Lesser General Public License along with this
+ program; if not, see <https://www.gnu.org/licenses/>.
+ 
+ All names, logos, and references to "Deltares" are registered trademarks of Stichting
+ Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydrever.io import resultstore
+from pydrever.data import (
+    CompactGrassWaveImpactOutputLocation,
+    NaturalStoneOutputLocation,
+    TimeDependentOutputQuantity,
+)
+import numpy
+import pytest
+
+
+@pytest.fixture
+def output():
+    return [
+        CompactGrassWaveImpactOutputLocation(
+            x_position=10.0,
+            z_position=1.0,
+            damage_development=numpy.array([0.1, 0.2, 0.3]),
+            wave_height_impact=numpy.array([0.5, 0.6, 0.7]),
+            minimum_wave_height=0.25,
+        ),
+        NaturalStoneOutputLocation.model_construct(
+            x_position=20.0,
+            z_position=2.0,
+            time_of_failure=1500.0,
+            damage_development=[0.4, 1.1, 1.2],
+            resistance=0.5,
+        ),
+    ]
+
+
+def test_write_and_read(tmp_path, output):
+    resultstore.write(str(tmp_path), output, [100.0, 200.0, 300.0])
+    result = resultstore.read(str(tmp_path))
+
+    assert result.input_hash is None
+    assert result.number_of_locations == 2
+    assert set(result.quantities) == {
+        TimeDependentOutputQuantity.DamageDevelopment,
+        TimeDependentOutputQuantity.WaveHeightImpact,
+    }
+    numpy.testing.assert_array_equal(result.time_steps, [100.0, 200.0, 300.0])
+    numpy.testing.assert_array_equal(result.x_positions, [10.0, 20.0])
+
+    damage = result.get_values(TimeDependentOutputQuantity.DamageDevelopment)
+    assert isinstance(damage, numpy.memmap)
+    numpy.testing.assert_array_equal(damage[:, 1], [0.2, 1.1])
+
+
+def test_read_location(tmp_path, output):
+    resultstore.write(str(tmp_path), output, [100.0, 200.0, 300.0])
+    result = resultstore.read(str(tmp_path))
+
+    grass_location = result.get_location(0)
+    assert isinstance(grass_location, CompactGrassWaveImpactOutputLocation)
+    assert grass_location.minimum_wave_height == 0.25
+    assert not grass_location.failed
+    numpy.testing.assert_array_equal(grass_location.wave_height_impact, [0.5, 0.6, 0.7])
+
+    stone_location = result.get_output()[1]
+    assert stone_location.resistance == 0.5
+    assert stone_location.time_of_failure == 1500.0
+    assert stone_location.final_damage == 1.2
+    assert not hasattr(stone_location, "wave_height_impact")
+
+
+def test_read_throws_on_unknown_quantity(tmp_path, output):
+    resultstore.write(str(tmp_path), output, [100.0, 200.0, 300.0])
+    result = resultstore.read(str(tmp_path))
+    with pytest.raises(resultstore.ResultStoreException) as exception:
+        result.get_values(TimeDependentOutputQuantity.WaveAngle)
+    assert exception.value.type == resultstore.ResultStoreExceptionType.QuantityNotStored
+
+
+def test_read_throws_on_missing_directory(tmp_path):
+    with pytest.raises(resultstore.ResultStoreException) as exception:
+        resultstore.read(str(tmp_path / "missing"))
+    assert exception.value.type == resultstore.ResultStoreExceptionType.DirectoryNotFound